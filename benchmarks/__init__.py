@@ -0,0 +1,39 @@
+"""
+Micro benchmarks for django-rest-localflavor. Each module can be run on its
+own, e.g. ``python -m benchmarks.bench_checkdigits``.
+"""
+import timeit
+
+
+def setup_django():
+    """
+    Configures the minimal settings the serializer fields need.
+    """
+    from django.conf import settings
+    if not settings.configured:
+        settings.configure(
+            INSTALLED_APPS=[
+                "django.contrib.auth",
+                "django.contrib.contenttypes",
+                "rest_localflavor",
+            ],
+        )
+        import django
+        setup = getattr(django, 'setup', None)
+        if setup is not None:
+            setup()
+
+
+def ops_per_sec(func, values, number=2000, repeat=5):
+    """
+    Best of ``repeat`` runs of ``func`` over every item of ``values``, in
+    calls per second. Exceptions raised by ``func`` are swallowed.
+    """
+    def run():
+        for value in values:
+            try:
+                func(value)
+            except Exception:
+                pass
+    best = min(timeit.repeat(run, number=number, repeat=repeat))
+    return number * len(values) / best
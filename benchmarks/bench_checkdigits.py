@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+"""
+Compares the ``CPF`` and ``CNPJ`` check digits of ``generic.checksums`` with
+the inline implementation that ``BRCPFField`` and ``BRCNPJField`` used before.
+"""
+from __future__ import print_function, unicode_literals
+
+from benchmarks import ops_per_sec
+from rest_localflavor.generic.checksums import CNPJ, CPF
+
+
+def DV_maker(v):
+    if v >= 2:
+        return 11 - v
+    return 0
+
+
+def legacy_cpf_is_valid(value):
+    orig_dv = value[-2:]
+    new_1dv = sum([i * int(value[idx]) for idx, i in enumerate(
+        range(10, 1, -1))])
+    new_1dv = DV_maker(new_1dv % 11)
+    value = value[:-2] + str(new_1dv) + value[-1]
+    new_2dv = sum([i * int(value[idx]) for idx, i in enumerate(
+        range(11, 1, -1))])
+    new_2dv = DV_maker(new_2dv % 11)
+    value = value[:-1] + str(new_2dv)
+    return value[-2:] == orig_dv
+
+
+def legacy_cnpj_is_valid(value):
+    orig_dv = value[-2:]
+    new_1dv = sum([i * int(value[idx]) for idx, i in enumerate(
+        list(range(5, 1, -1)) + list(range(9, 1, -1)))])
+    new_1dv = DV_maker(new_1dv % 11)
+    value = value[:-2] + str(new_1dv) + value[-1]
+    new_2dv = sum([i * int(value[idx]) for idx, i in enumerate(
+        list(range(6, 1, -1)) + list(range(9, 1, -1)))])
+    new_2dv = DV_maker(new_2dv % 11)
+    value = value[:-1] + str(new_2dv)
+    return value[-2:] == orig_dv
+
+
+CASES = (
+    ('cpf', legacy_cpf_is_valid, CPF.is_valid, ('66325601726', '48929465454')),
+    ('cnpj', legacy_cnpj_is_valid, CNPJ.is_valid, ('64132916000188', '12345678901210')),
+)
+
+
+def main():
+    for name, legacy, current, values in CASES:
+        for value in values:
+            assert legacy(value) == current(value), value
+        old = ops_per_sec(legacy, values, number=20000)
+        new = ops_per_sec(current, values, number=20000)
+        print('%-5s legacy %12.0f ops/s   checksums %12.0f ops/s   x%.2f' % (
+            name, old, new, new / old))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+"""
+Throughput of the check digit algorithms of ``generic.checksums`` against
+textbook implementations looping over ``int()`` of every character.
+"""
+from __future__ import print_function, unicode_literals
+
+import random
+
+from benchmarks import ops_per_sec
+from rest_localflavor.generic.checksums import ALGORITHMS, CNPJ_WEIGHTS, CPF_WEIGHTS
+
+VERHOEFF_D = [[0, 1, 2, 3, 4, 5, 6, 7, 8, 9], [1, 2, 3, 4, 0, 6, 7, 8, 9, 5],
+              [2, 3, 4, 0, 1, 7, 8, 9, 5, 6], [3, 4, 0, 1, 2, 8, 9, 5, 6, 7],
+              [4, 0, 1, 2, 3, 9, 5, 6, 7, 8], [5, 9, 8, 7, 6, 0, 4, 3, 2, 1],
+              [6, 5, 9, 8, 7, 1, 0, 4, 3, 2], [7, 6, 5, 9, 8, 2, 1, 0, 4, 3],
+              [8, 7, 6, 5, 9, 3, 2, 1, 0, 4], [9, 8, 7, 6, 5, 4, 3, 2, 1, 0]]
+VERHOEFF_P = [[0, 1, 2, 3, 4, 5, 6, 7, 8, 9], [1, 5, 7, 6, 2, 8, 3, 0, 9, 4],
+              [5, 8, 0, 3, 7, 9, 6, 1, 4, 2], [8, 9, 1, 6, 0, 4, 3, 5, 2, 7],
+              [9, 4, 5, 3, 1, 2, 6, 8, 7, 0], [4, 2, 8, 6, 5, 7, 3, 9, 0, 1],
+              [2, 7, 9, 3, 8, 0, 6, 4, 1, 5], [7, 0, 4, 6, 9, 1, 3, 2, 5, 8]]
+DAMM = [[0, 3, 1, 7, 5, 9, 8, 6, 4, 2], [7, 0, 9, 2, 1, 5, 4, 8, 6, 3],
+        [4, 2, 0, 6, 8, 7, 1, 3, 5, 9], [1, 7, 5, 0, 9, 8, 3, 4, 2, 6],
+        [6, 1, 2, 3, 0, 4, 5, 9, 7, 8], [3, 6, 7, 4, 2, 0, 9, 5, 8, 1],
+        [5, 8, 6, 9, 7, 2, 0, 1, 3, 4], [8, 9, 4, 5, 3, 6, 2, 0, 1, 7],
+        [9, 4, 3, 8, 6, 1, 7, 2, 0, 5], [2, 5, 8, 1, 4, 3, 6, 7, 9, 0]]
+
+
+def naive_luhn(value):
+    try:
+        total = 0
+        for i, c in enumerate(reversed(value)):
+            digit = int(c) * (2 if i % 2 else 1)
+            total += digit - 9 if digit > 9 else digit
+        return total % 10 == 0
+    except ValueError:
+        return False
+
+
+def naive_verhoeff(value):
+    try:
+        check = 0
+        for i, c in enumerate(reversed(value)):
+            check = VERHOEFF_D[check][VERHOEFF_P[i % 8][int(c)]]
+        return check == 0
+    except ValueError:
+        return False
+
+
+def naive_damm(value):
+    try:
+        interim = 0
+        for c in value:
+            interim = DAMM[interim][int(c)]
+        return interim == 0
+    except ValueError:
+        return False
+
+
+def naive_mod97_10(value):
+    try:
+        remainder = 0
+        for c in value:
+            remainder = (remainder * 10 + int(c)) % 97
+        return remainder == 1
+    except ValueError:
+        return False
+
+
+def naive_mod11(weights):
+    def is_valid(value):
+        try:
+            digits = [int(c) for c in value]
+        except ValueError:
+            return False
+        if len(digits) != len(weights) + 1:
+            return False
+        for size in (len(weights) - 1, len(weights)):
+            remainder = sum(w * d for w, d in zip(weights[-size:], digits[:size])) % 11
+            if digits[size] != (11 - remainder if remainder >= 2 else 0):
+                return False
+        return True
+    return is_valid
+
+
+NAIVE = {
+    'luhn': naive_luhn,
+    'verhoeff': naive_verhoeff,
+    'damm': naive_damm,
+    'mod97_10': naive_mod97_10,
+    'cpf': naive_mod11(CPF_WEIGHTS),
+    'cnpj': naive_mod11(CNPJ_WEIGHTS),
+}
+
+SIZES = {'cpf': 9, 'cnpj': 12}
+
+
+def samples(algorithm, size, count=100):
+    rnd = random.Random(0)
+    values = []
+    for _ in range(count):
+        payload = ''.join(rnd.choice('0123456789') for _ in range(size))
+        values.append(payload + algorithm.compute(payload))
+    return values
+
+
+def main():
+    for name in sorted(ALGORITHMS):
+        algorithm = ALGORITHMS[name]
+        values = samples(algorithm, SIZES.get(name, 15))
+        values += [value[:-1] + 'x' for value in values[:10]]
+        naive = NAIVE[name]
+        assert [naive(value) for value in values] == algorithm.is_valid_many(values), name
+        old = ops_per_sec(naive, values, number=200)
+        new = ops_per_sec(algorithm.is_valid, values, number=200)
+        print('%-9s naive %10.0f ops/s   is_valid %10.0f ops/s   x%.2f' % (name, old, new, new / old))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+"""
+Cost of instantiating serializers made of CA and US fields, against fields
+built like before, mutating ``error_messages`` in ``__init__`` and deep
+copied by re-running it.
+"""
+from __future__ import print_function, unicode_literals
+
+import timeit
+
+from benchmarks import setup_django
+
+
+def legacy_field(field_class):
+    from rest_framework import serializers
+
+    class LegacyField(serializers.CharField):
+        default_error_messages = {
+            'invalid': field_class.default_error_messages['invalid'],
+        }
+
+        def __init__(self, *args, **kwargs):
+            super(LegacyField, self).__init__(*args, **kwargs)
+            self.error_messages['blank'] = self.error_messages['invalid']
+            self.error_messages['null'] = self.error_messages['invalid']
+
+    return LegacyField
+
+
+def serializer_classes(legacy):
+    from rest_framework import serializers
+
+    from rest_localflavor.ca import serializers as ca
+    from rest_localflavor.us import serializers as us
+
+    wrap = legacy_field if legacy else (lambda field_class: field_class)
+
+    class AddressSerializer(serializers.Serializer):
+        postal_code = wrap(ca.CAPostalCodeField)()
+        province = wrap(ca.CAProvinceField)()
+        state = wrap(us.USStateField)(required=False)
+
+    class CustomerSerializer(serializers.Serializer):
+        phone = wrap(ca.CAPhoneNumberField)()
+        sin = wrap(ca.CASocialInsuranceNumberField)()
+        address = AddressSerializer()
+        billing = AddressSerializer()
+
+    return CustomerSerializer
+
+
+def main(items=50, number=200, repeat=5):
+    setup_django()
+    import copy
+
+    from rest_localflavor.ca import serializers as ca
+    from rest_localflavor.us import serializers as us
+
+    for field_class in (ca.CAPostalCodeField, ca.CAPhoneNumberField, ca.CAProvinceField,
+                        ca.CASocialInsuranceNumberField, us.USStateField):
+        timings = []
+        for field in (legacy_field(field_class)(), field_class()):
+            timings.append(min(timeit.repeat(lambda: copy.deepcopy(field),
+                                             number=number * 50, repeat=repeat)))
+        print('%-30s deepcopy legacy %6.2f us  current %6.2f us' % (
+            field_class.__name__, timings[0] / number / 50 * 1e6,
+            timings[1] / number / 50 * 1e6))
+
+    for name, legacy in (('legacy', True), ('current', False)):
+        serializer_class = serializer_classes(legacy)
+
+        def build():
+            # list endpoints: touching .fields deep copies the declared fields
+            serializer = serializer_class(many=True)
+            for _ in range(items):
+                serializer.child.__class__().fields['address'].fields
+
+        best = min(timeit.repeat(build, number=number, repeat=repeat))
+        print('%-8s %10.1f us per nested list serializer of %d items' % (
+            name, best / number * 1e6, items))
+
+
+if __name__ == '__main__':
+    main()
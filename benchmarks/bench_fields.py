@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+"""
+Per field throughput for valid, invalid, blank and malformed inputs (and
+valid ones through the result cache, for cacheable fields), plus
+the validation of a serializer mixing brazilian, canadian and US fields.
+Run through ``runbenchmarks.py``.
+"""
+from __future__ import print_function, unicode_literals
+
+from benchmarks import ops_per_sec, setup_django
+
+MALFORMED = ['x' * 1000, '٣٣٣', '  \t', '(((', '0' * 200]
+
+#: field class name -> case -> inputs
+FIELD_CASES = {
+    'br.BRStateField': {
+        'valid': ['df', 'go', 'sp'],
+        'invalid': ['TX', 'XX'],
+    },
+    'br.BRCPFField': {
+        'valid': ['663.256.017-26', '66325601726', '375.788.573-20'],
+        'invalid': ['489.294.654-54', '375.788.573-XX', '123.456.78'],
+    },
+    'br.BRCNPJField': {
+        'valid': ['64.132.916/0001-88', '64132916000188'],
+        'invalid': ['12.345.678/9012-10', '64.132.916/0001-XX'],
+    },
+    'br.BRZipCodeField': {
+        'valid': ['73.360-610', '73360-610', '73360610'],
+        'invalid': ['70.000-0000', '700000-000'],
+    },
+    'br.BRPhoneNumberField': {
+        'valid': ['41-3562-3464', '(41) 3562 3464', '41.93562.3464'],
+        'invalid': ['11-914-925', '+55-41-3562-3464'],
+    },
+    'ca.CAPostalCodeField': {
+        'valid': ['K1N 5J9', 'k1n5j9', 'J0X 1G0'],
+        'invalid': ['DDD 111', 'FFF 222'],
+    },
+    'ca.CAPhoneNumberField': {
+        'valid': ['123-123-1234', '(123) 123 1234'],
+        'invalid': ['+1 123-123-1234', 'a'],
+    },
+    'ca.CAProvinceField': {
+        'valid': ['PE', 'p.e.i.', 'British Columbia'],
+        'invalid': ['XX', 'AZ'],
+    },
+    'ca.CASocialInsuranceNumberField': {
+        'valid': ['046-454-286'],
+        'invalid': ['111-222-333', '046 454 286'],
+    },
+    'us.USStateField': {
+        'valid': ['CA', 'calif', 'New York'],
+        'invalid': ['XX', 'AX'],
+    },
+    'us.USZipCodeField': {
+        'valid': ['20500', '20500-0003'],
+        'invalid': ['2050', '20500-03'],
+    },
+    'us.USPhoneNumberField': {
+        'valid': ['312-555-1212', '(312) 555 1212', '1-312-555-1212'],
+        'invalid': ['555-1212', '+1 312-555-1212'],
+    },
+}
+
+PAYLOAD = {
+    'cpf': '663.256.017-26',
+    'cnpj': '64.132.916/0001-88',
+    'uf': 'sp',
+    'cep': '73.360-610',
+    'br_phone': '(41) 3562 3464',
+    'postal_code': 'K1N 5J9',
+    'province': 'Ontario',
+    'ca_phone': '(123) 123 1234',
+    'sin': '046-454-286',
+    'us_state': 'calif',
+}
+
+
+def field_class(path):
+    from importlib import import_module
+    country, name = path.split('.')
+    module = import_module('rest_localflavor.%s.serializers' % country)
+    return getattr(module, name)
+
+
+def payload_serializer():
+    from rest_framework import serializers
+
+    from rest_localflavor.br import serializers as br
+    from rest_localflavor.ca import serializers as ca
+    from rest_localflavor.us import serializers as us
+
+    class CustomerSerializer(serializers.Serializer):
+        cpf = br.BRCPFField()
+        cnpj = br.BRCNPJField()
+        uf = br.BRStateField()
+        cep = br.BRZipCodeField()
+        br_phone = br.BRPhoneNumberField()
+        postal_code = ca.CAPostalCodeField()
+        province = ca.CAProvinceField()
+        ca_phone = ca.CAPhoneNumberField()
+        sin = ca.CASocialInsuranceNumberField()
+        us_state = us.USStateField()
+
+    return CustomerSerializer
+
+
+def run(number=2000, repeat=5):
+    """
+    Returns a list of ``{'name', 'case', 'ops_per_sec'}`` results.
+    """
+    setup_django()
+    from rest_localflavor.cache import CachedValidationMixin
+
+    results = []
+    for path in sorted(FIELD_CASES):
+        cases = dict(FIELD_CASES[path], blank=['', None], malformed=MALFORMED)
+        field = field_class(path)()
+        for case in ('valid', 'invalid', 'blank', 'malformed'):
+            results.append({
+                'name': path,
+                'case': case,
+                'ops_per_sec': ops_per_sec(field.run_validation, cases[case],
+                                           number=number, repeat=repeat),
+            })
+        if isinstance(field, CachedValidationMixin):
+            cached = field_class(path)(cache_size=1024)
+            results.append({
+                'name': path,
+                'case': 'cached',
+                'ops_per_sec': ops_per_sec(cached.run_validation, cases['valid'],
+                                           number=number, repeat=repeat),
+            })
+
+    serializer_class = payload_serializer()
+
+    def validate(payload):
+        return serializer_class(data=payload).is_valid()
+
+    serializer = serializer_class(data=PAYLOAD)
+    assert serializer.is_valid(), serializer.errors
+
+    results.append({
+        'name': 'CustomerSerializer',
+        'case': 'payload',
+        'ops_per_sec': ops_per_sec(validate, [PAYLOAD],
+                                   number=max(number // 10, 1), repeat=repeat),
+    })
+    return results
+
+
+def main():
+    for result in run():
+        print('%(name)-35s %(case)-10s %(ops_per_sec)12.0f ops/s' % result)
+
+
+if __name__ == '__main__':
+    main()
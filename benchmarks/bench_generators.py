@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+"""
+Throughput of the load testing generators of ``rest_localflavor.test.generators``,
+against generating the digits one by one and computing the check digits
+with ``generic.checksums.CPF``.
+"""
+from __future__ import print_function, unicode_literals
+
+import itertools
+import random
+import timeit
+
+from benchmarks import setup_django
+
+COUNT = 100000
+
+
+def naive_cpf(rnd):
+    from rest_localflavor.generic.checksums import CPF
+    digits = ''.join(str(rnd.randrange(10)) for _ in range(9))
+    digits += CPF.compute(digits)
+    return '%s.%s.%s-%s' % (digits[:3], digits[3:6], digits[6:9], digits[9:])
+
+
+def rate(func, number=COUNT, repeat=3):
+    return number / min(timeit.repeat(func, number=1, repeat=repeat))
+
+
+def main():
+    setup_django()
+    from rest_localflavor.test.generators import GENERATORS, generate
+
+    rnd = random.Random(0)
+    rows = [('cpf naive', rate(lambda: [naive_cpf(rnd) for _ in range(COUNT)]))]
+    for name in sorted(GENERATORS):
+        for invalid in (0, 0.1):
+            rows.append(('%s invalid=%g' % (name, invalid), rate(
+                lambda: list(itertools.islice(generate(name, seed=0, invalid=invalid), COUNT)))))
+    for name, ops in rows:
+        print('%-28s %12.0f values/s' % (name, ops))
+
+
+if __name__ == '__main__':
+    main()
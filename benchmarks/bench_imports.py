@@ -0,0 +1,23 @@
+# -*- coding: utf-8 -*-
+"""
+Import time of the field modules, from ``python -X importtime`` in a fresh
+interpreter (Python 3.7+), once Django and DRF are loaded.
+"""
+from __future__ import print_function, unicode_literals
+
+from rest_localflavor.test.imports import MODULES, import_times
+
+
+def main(repeat=5):
+    best = {}
+    for _ in range(repeat):
+        for name, usec in import_times().items():
+            best[name] = min(usec, best.get(name, usec))
+    for name in sorted(best):
+        if name.startswith('rest_localflavor'):
+            print('%-45s %8d us' % (name, best[name]))
+    print('%-45s %8d us' % ('total', sum(best[name] for name in MODULES)))
+
+
+if __name__ == '__main__':
+    main()
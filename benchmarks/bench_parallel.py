@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+"""
+Scaling of ``validate_many`` over 1, 2, 4 and 8 worker processes. The
+speedup is bounded by the number of CPUs of the machine, printed first.
+"""
+from __future__ import print_function, unicode_literals
+
+import multiprocessing
+import time
+
+from benchmarks import setup_django
+from benchmarks.bench_vectorized import make_cpfs
+
+
+def timed(field, values, pool):
+    start = time.time()
+    field.validate_many(values, pool=pool) if pool else field.validate_many(values)
+    return len(values) / (time.time() - start)
+
+
+def main(count=400000, workers=(1, 2, 4, 8)):
+    setup_django()
+    from rest_localflavor.batch import validation_pool
+    from rest_localflavor.br.serializers import BRCPFField
+
+    field = BRCPFField()
+    values = make_cpfs(count)
+    print('%d CPUs' % multiprocessing.cpu_count())
+    serial = None
+    for processes in workers:
+        pool = validation_pool(processes) if processes > 1 else None
+        try:
+            if pool is not None:
+                pool.map(abs, range(processes))  # start the workers
+            rate = timed(field, values, pool)
+        finally:
+            if pool is not None:
+                pool.close()
+                pool.join()
+        serial = serial or rate
+        print('%d workers %12.0f rows/s  x%.2f' % (processes, rate, rate / serial))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+"""
+Worst case latency of every field over pathological payloads: huge digit
+strings, separators, whitespace, NUL characters, unicode digits, runs of
+parentheses and huge integers. Each field runs with its ``max_input_length``
+bound and without it, to show what the bound saves::
+
+    python -m benchmarks.bench_pathological --size 1000000
+
+The Python 3.11+ limit of ``int()`` on long digit strings is lifted while
+running, as older Pythons have none.
+"""
+from __future__ import print_function, unicode_literals
+
+import argparse
+import sys
+import timeit
+
+from benchmarks import setup_django
+from benchmarks.bench_fields import FIELD_CASES
+
+
+def payloads(size):
+    return [
+        ('digits', '9' * size),
+        ('separators', '1-' * (size // 2)),
+        ('whitespace', ' ' * size),
+        ('nul', '\x00' * size),
+        ('unicode digits', '٣' * size),
+        ('parentheses', '(' * size),
+        ('integer', 10 ** min(size, 100000) - 1),
+    ]
+
+
+def worst_case(field, payloads, repeat=3):
+    """
+    Returns the slowest ``(seconds, payload name)`` of ``field.check()``,
+    best of ``repeat`` calls per payload.
+    """
+    worst = (0, None)
+    for name, payload in payloads:
+        def run():
+            try:
+                field.check(payload)
+            except Exception:
+                pass
+        worst = max(worst, (min(timeit.repeat(run, number=1, repeat=repeat)), name))
+    return worst
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--size', type=int, default=200000,
+                        help='length of the payloads (default 200000)')
+    args = parser.parse_args(argv)
+    setup_django()
+    from importlib import import_module
+
+    set_limit = getattr(sys, 'set_int_max_str_digits', None)
+    if set_limit is not None:
+        limit = sys.get_int_max_str_digits()
+        set_limit(0)
+    try:
+        cases = payloads(args.size)
+        print('%-30s %14s %14s  %s' % ('field', 'bounded', 'unbounded', 'worst payload'))
+        for path in sorted(FIELD_CASES):
+            module, name = path.split('.')
+            field_class = getattr(import_module('rest_localflavor.%s.serializers' % module), name)
+            field = field_class()
+            bounded, _ = worst_case(field, cases)
+            field.max_input_length = None
+            unbounded, payload = worst_case(field, cases)
+            print('%-30s %11.1f us %11.1f us  %s' % (
+                name, bounded * 1e6, unbounded * 1e6, payload))
+    finally:
+        if set_limit is not None:
+            set_limit(limit)
+
+
+if __name__ == '__main__':
+    main()
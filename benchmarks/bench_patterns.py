@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+"""
+Throughput of the regex driven fields, against the previous per call
+``re.compile``/``re.sub`` code, and of the phone numbers normalized by
+``generic.phones`` against the two regex passes it replaces. ``tests/test_patterns.py`` guards that no
+field goes back to the ``re`` module functions.
+"""
+from __future__ import print_function, unicode_literals
+
+import re
+
+from benchmarks import ops_per_sec, setup_django
+
+# the precompiled patterns of the fields before generic.phones
+BR_PHONE_DIGITS_RE = re.compile(r'^(\(\d{2}\)|\d{2})[-\.\s]?(\d{4,5})[-\.\s]?(\d{4})$')
+PHONE_STRIP_RE = re.compile(r'(\(|\)|\s+)')
+
+
+def legacy_br_phone(value):
+    phone_digits_re = re.compile(r'^(\(\d{2}\)|\d{2})[-\.\s]?(\d{4,5})[-\.\s]?(\d{4})$')
+    value = re.sub(r'(\(|\)|\s+)', '', value)
+    m = phone_digits_re.search(value)
+    if m:
+        return '%s-%s-%s' % (m.group(1), m.group(2), m.group(3))
+
+
+def legacy_cpf_strip(value):
+    return re.sub(r"[-\.]", "", value)
+
+
+def main():
+    setup_django()
+    from rest_localflavor.br.serializers import CPF_PUNCTUATION, BRPhoneNumberField
+    from rest_localflavor.ca.serializers import CAPhoneNumberField
+    from rest_localflavor.generic.phones import normalize_phone
+    from rest_localflavor.us.serializers import USPhoneNumberField
+
+    def br_phone(value):
+        m = BR_PHONE_DIGITS_RE.search(PHONE_STRIP_RE.sub('', value))
+        if m:
+            return '%s-%s-%s' % (m.group(1), m.group(2), m.group(3))
+
+    phones = ['(41) 3562 3464', '41.93562.3464', '411-9134-9435']
+    nanp_phones = ['(123) 123 1234', '1-123-123-1234', '+1 123-123-1234']
+    rows = [
+        ('br phone legacy', ops_per_sec(legacy_br_phone, phones)),
+        ('br phone regexes', ops_per_sec(br_phone, phones)),
+        ('br phone translate', ops_per_sec(lambda v: normalize_phone('BR', v), phones)),
+        ('cpf strip legacy', ops_per_sec(legacy_cpf_strip, ['663.256.017-26'])),
+        ('cpf strip', ops_per_sec(lambda v: v.translate(CPF_PUNCTUATION), ['663.256.017-26'])),
+        ('BRPhoneNumberField', ops_per_sec(BRPhoneNumberField().run_validation, phones)),
+        ('CAPhoneNumberField', ops_per_sec(CAPhoneNumberField().run_validation, nanp_phones)),
+        ('USPhoneNumberField', ops_per_sec(USPhoneNumberField().run_validation, nanp_phones)),
+    ]
+    for name, rate in rows:
+        print('%-22s %12.0f ops/s' % (name, rate))
+
+
+if __name__ == '__main__':
+    main()
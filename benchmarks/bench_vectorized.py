@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+"""
+Compares the NumPy vectorized validators with row by row validation.
+"""
+from __future__ import print_function, unicode_literals
+
+import random
+import time
+
+from rest_localflavor.generic import vectorized
+from rest_localflavor.generic.checksums import CPF, luhn
+
+
+def make_cpfs(count, seed=0):
+    rng = random.Random(seed)
+    values = []
+    for _ in range(count):
+        body = ''.join(rng.choice('0123456789') for _ in range(9))
+        values.append(body + CPF.compute(body))
+    return values
+
+
+def timed(func, values):
+    func(values[:10])  # warm up lazy imports
+    start = time.time()
+    func(values)
+    return len(values) / (time.time() - start)
+
+
+def main(count=200000):
+    values = make_cpfs(count)
+    array = vectorized.np.array(values)
+    rows = [
+        ('cpf  scalar', timed(lambda vs: [CPF.is_valid(v) for v in vs], values)),
+        ('cpf  vector', timed(vectorized.cpf_many, array)),
+        ('luhn scalar', timed(lambda vs: [luhn(v) for v in vs], values)),
+        ('luhn vector', timed(vectorized.luhn_many, array)),
+    ]
+    for name, rate in rows:
+        print('%s %12.0f rows/s' % (name, rate))
+
+
+if __name__ == '__main__':
+    main()
@@ -1 +1,3 @@
 __version__ = '1.2.4'
+
+default_app_config = 'rest_localflavor.apps.RestLocalflavorConfig'
@@ -0,0 +1,104 @@
+"""
+Asynchronous bulk validation, for ASGI applications. Requires Python 3.6.
+
+``avalidate_many`` validates values in chunks run in an executor, off the
+event loop, and yields ``(value, error)`` pairs as an async iterator while
+the next chunk is validated::
+
+    async for value, error in avalidate_many(BRCPFField(), values):
+        ...
+
+Results are the ones of ``validate_many``, in the order of ``values``.
+"""
+import asyncio
+import collections
+import itertools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from .batch import BatchResult, _validate_chunk
+
+__all__ = ['avalidate_many', 'avalidate_all', 'DEFAULT_MAX_WORKERS']
+
+#: Threads of the shared executor used when none is given.
+DEFAULT_MAX_WORKERS = 4
+
+_executor = None
+_executor_lock = threading.Lock()
+
+# get_event_loop() warns when there is no running loop since Python 3.10,
+# get_running_loop() is new in 3.7
+_get_running_loop = getattr(asyncio, 'get_running_loop', asyncio.get_event_loop)
+
+
+def _default_executor():
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    DEFAULT_MAX_WORKERS, thread_name_prefix='localflavor')
+    return _executor
+
+
+async def _chunks(values, size):
+    if hasattr(values, '__aiter__'):
+        chunk = []
+        async for value in values:
+            chunk.append(value)
+            if len(chunk) == size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+        return
+    iterator = iter(values)
+    while True:
+        chunk = list(itertools.islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+async def avalidate_many(field, values, chunk_size=1000, executor=None, prefetch=2):
+    """
+    Async iterator of the ``(value, error)`` pairs of ``values``, a
+    sequence, iterable or async iterable, validated by ``field``.
+
+    Chunks of ``chunk_size`` values are validated in ``executor``, by
+    default a shared pool of ``DEFAULT_MAX_WORKERS`` threads; a
+    ``ProcessPoolExecutor`` also works. At most ``prefetch`` chunks are
+    pending at a time, so memory stays bounded on slow consumers.
+    """
+    loop = _get_running_loop()
+    if executor is None:
+        executor = _default_executor()
+    # the same picklable spec the process pool of validate_many uses
+    spec = (type(field), field._args, field._kwargs)
+    pending = collections.deque()
+    try:
+        async for chunk in _chunks(values, chunk_size):
+            pending.append(loop.run_in_executor(executor, _validate_chunk, (spec, chunk)))
+            if len(pending) < prefetch:
+                continue
+            chunk_values, chunk_errors = await pending.popleft()
+            for pair in zip(chunk_values, chunk_errors):
+                yield pair
+        while pending:
+            chunk_values, chunk_errors = await pending.popleft()
+            for pair in zip(chunk_values, chunk_errors):
+                yield pair
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+async def avalidate_all(field, values, **kwargs):
+    """
+    Awaitable ``validate_many``: returns a ``BatchResult`` of ``values``,
+    validated like ``avalidate_many`` does.
+    """
+    result = BatchResult()
+    async for value, error in avalidate_many(field, values, **kwargs):
+        result.append(value, error)
+    return result
@@ -0,0 +1,14 @@
+from django.apps import AppConfig
+from django.conf import settings
+
+
+class RestLocalflavorConfig(AppConfig):
+    name = 'rest_localflavor'
+    verbose_name = 'REST localflavor'
+
+    def ready(self):
+        # registers the receiver applying later changes of the setting
+        from . import instrumentation
+
+        if getattr(settings, 'REST_LOCALFLAVOR_INSTRUMENTATION', None) is not None:
+            instrumentation.configure()
@@ -0,0 +1,353 @@
+"""
+Bulk validation of many values against a single localflavor field.
+
+Every field validates in a non-raising ``_check(data)`` method returning
+``(value, None)`` or ``(None, error code)``, which ``run_validation`` wraps,
+raising the ``ValidationError`` of the code. ``check(data)`` returns a
+``ValidationResult`` instead, and ``validate_many`` collects the error codes
+of many values, so normalized outputs are exactly the ones a serializer
+would produce but no exception is built for invalid values, nor any message
+formatted and translated until it is asked for. The checks DRF does itself,
+e.g. ``required`` or the field validators, still raise; while a batch runs
+``fail()`` raises a light exception carrying only the error key for them.
+Large inputs can be validated by a pool of worker processes.
+"""
+import copy
+import itertools
+import os
+
+from django.utils import six
+
+from rest_framework.exceptions import ValidationError
+from rest_framework.fields import empty
+
+__all__ = ['BatchResult', 'BatchValidationMixin', 'ValidationResult', 'error_message',
+           'field_classes', 'validate_many', 'validation_pool']
+
+
+class BatchFailure(Exception):
+    """
+    Raised by ``fail()`` on fields running a batch, with the error key.
+    """
+
+    def __init__(self, code):
+        super(BatchFailure, self).__init__(code)
+        self.code = code
+
+
+class BatchResult(object):
+    """
+    Parallel vectors of normalized values and error codes. For valid inputs
+    ``errors[i]`` is ``None``, for invalid ones ``values[i]`` is ``None``.
+    """
+    __slots__ = ('values', 'errors')
+
+    def __init__(self, values=None, errors=None):
+        self.values = [] if values is None else values
+        self.errors = [] if errors is None else errors
+
+    def __len__(self):
+        return len(self.values)
+
+    def __iter__(self):
+        return zip(self.values, self.errors)
+
+    def __getitem__(self, index):
+        return self.values[index], self.errors[index]
+
+    @property
+    def invalid_count(self):
+        return len(self.errors) - self.errors.count(None)
+
+    def append(self, value, error):
+        self.values.append(value)
+        self.errors.append(error)
+
+    def extend(self, other):
+        self.values.extend(other.values)
+        self.errors.extend(other.errors)
+
+    def messages(self, field, inputs=None):
+        """
+        Returns the error messages of ``field`` for every row, ``None`` for
+        the valid ones. Pass the validated ``inputs`` for messages quoting
+        the input.
+        """
+        if inputs is None:
+            inputs = itertools.repeat(None)
+        return [None if code is None else error_message(field, code, data)
+                for code, data in zip(self.errors, inputs)]
+
+
+class ValidationResult(object):
+    """
+    The outcome of ``check(data)``: the normalized ``value`` of a valid
+    input, or the error ``code`` of an invalid one, whose message is only
+    rendered by ``message()``.
+    """
+    __slots__ = ('value', 'code', 'data', 'field', '_message')
+
+    def __init__(self, value, code, data, field, message=None):
+        self.value = value
+        self.code = code
+        self.data = data
+        self.field = field
+        self._message = message
+
+    @property
+    def valid(self):
+        return self.code is None
+
+    def __bool__(self):
+        return self.code is None
+    __nonzero__ = __bool__
+
+    def message(self):
+        if self.code is None:
+            return None
+        if self._message is not None:
+            return self._message
+        return error_message(self.field, self.code, self.data)
+
+    def __repr__(self):
+        if self.code is None:
+            return '<ValidationResult valid %r>' % (self.value,)
+        return '<ValidationResult invalid %r>' % (self.code,)
+
+
+def error_message(field, code, data=None):
+    """
+    Returns the translated message of the error ``code`` of ``field``, as
+    ``fail()`` renders it.
+    """
+    message = field.error_messages.get(code)
+    if message is None:
+        return code
+    params = {'input': data}
+    for name in ('max_length', 'min_length'):
+        params[name] = getattr(field, name, None)
+    try:
+        return six.text_type(message).format(**params)
+    except (KeyError, IndexError):
+        return six.text_type(message)
+
+
+def _error_code(exc):
+    get_codes = getattr(exc, 'get_codes', None)
+    if get_codes is not None:
+        codes = get_codes()
+        while isinstance(codes, (list, dict)):
+            codes = (list(codes.values()) if isinstance(codes, dict) else codes)[0]
+        return codes
+    return 'invalid'
+
+
+def _first_message(detail):
+    while isinstance(detail, (list, dict)):
+        detail = (list(detail.values()) if isinstance(detail, dict) else detail)[0]
+    return six.text_type(detail)
+
+
+def _checker(field):
+    """
+    Returns ``field._check``, or a function returning the ``(value, None)``
+    of ``field.run_validation`` when it does more than wrapping ``_check``,
+    e.g. when it is instrumented or overridden by a subclass.
+    """
+    run_validation = six.get_unbound_function(type(field).run_validation)
+    if run_validation is _run_validation:
+        return field._check
+    run_validation = field.run_validation
+
+    def check(data):
+        return run_validation(data), None
+    return check
+
+
+def _validate_serial(field, values):
+    batch_field = copy.copy(field)
+    batch_field._batch = True
+    check = _checker(batch_field)
+    result = BatchResult()
+    append_value = result.values.append
+    append_error = result.errors.append
+    for value in values:
+        try:
+            value, code = check(value)
+        except BatchFailure as exc:
+            append_value(None)
+            append_error(exc.code)
+        except ValidationError as exc:
+            # Raised outside of fail(), e.g. by the field validators.
+            append_value(None)
+            append_error(_error_code(exc))
+        else:
+            append_value(value)
+            append_error(code)
+    return result
+
+
+def _setup_django():
+    """
+    Makes sure Django is set up, with minimal settings when there is no
+    settings module, e.g. in ``spawn`` started worker processes.
+    """
+    from django.conf import settings
+    if not settings.configured and not os.environ.get('DJANGO_SETTINGS_MODULE'):
+        settings.configure(INSTALLED_APPS=['rest_localflavor'])
+    import django
+    setup = getattr(django, 'setup', None)
+    if setup is not None:
+        setup()
+
+
+def _validate_chunk(task):
+    # Fields are rebuilt from their arguments in the workers, like DRF does
+    # when copying them, since their state is not always picklable.
+    (field_class, args, kwargs), values = task
+    result = _validate_serial(field_class(*args, **kwargs), values)
+    return result.values, result.errors
+
+
+def _chunks(values, size):
+    iterator = iter(values)
+    while True:
+        chunk = list(itertools.islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _cpu_count():
+    import multiprocessing
+    return multiprocessing.cpu_count()
+
+
+def validation_pool(workers=None):
+    """
+    Returns a process pool for ``validate_many``, with ``workers``
+    processes, by default one per CPU, recorded as its ``workers``
+    attribute. Close it when done.
+    """
+    import multiprocessing
+    workers = workers or multiprocessing.cpu_count()
+    pool = multiprocessing.Pool(workers, initializer=_setup_django)
+    pool.workers = workers
+    return pool
+
+
+def validate_many(field, values, workers=1, chunk_size=10000, pool=None):
+    """
+    Validates every item of ``values`` with ``field`` and returns a
+    ``BatchResult``. Never raises ``ValidationError``.
+
+    With ``workers`` other than 1 (``None`` for one per CPU) or a ``pool``
+    from ``validation_pool()``, ``values`` is split in chunks of at most
+    ``chunk_size`` items, validated in worker processes. The results are
+    in the order of ``values``.
+    """
+    if pool is None and workers == 1:
+        return _validate_serial(field, values)
+
+    if not isinstance(values, (list, tuple)):
+        values = list(values)
+    own_pool = pool is None
+    if own_pool:
+        pool = validation_pool(workers)
+    # other pools default to one process per CPU as well
+    processes = getattr(pool, 'workers', None) or _cpu_count()
+    size = max(1, min(chunk_size, -(-len(values) // processes)))
+    spec = (type(field), field._args, field._kwargs)
+    result = BatchResult()
+    try:
+        for chunk_values, chunk_errors in pool.imap(
+                _validate_chunk, ((spec, chunk) for chunk in _chunks(values, size))):
+            result.values.extend(chunk_values)
+            result.errors.extend(chunk_errors)
+    finally:
+        if own_pool:
+            pool.close()
+            pool.join()
+    return result
+
+
+class BatchValidationMixin(object):
+    """
+    Gives a serializer field the non-raising ``check`` and ``validate_many``
+    methods. Fields implement ``_check(data)``, returning ``(value, None)``
+    or ``(None, error code)``.
+    """
+    _batch = False
+
+    #: Text inputs longer than this, or integers with more digits, are
+    #: rejected by ``_oversized`` before any parsing.
+    max_input_length = None
+
+    def run_validation(self, data=empty):
+        value, code = self._check(data)
+        if code is not None:
+            self.fail(code, input=data)
+        return value
+
+    def _check(self, data):
+        return self._base_validation(data), None
+
+    def _oversized(self, data):
+        limit = self.max_input_length
+        if limit is None:
+            return False
+        if isinstance(data, six.string_types):
+            return len(data) > limit
+        return isinstance(data, six.integer_types) and abs(data) >= 10 ** limit
+
+    def _base_validation(self, data):
+        """
+        Runs the ``run_validation`` of the DRF field class.
+        """
+        return super(BatchValidationMixin, self).run_validation(data)
+
+    def fail(self, key, **kwargs):
+        if self._batch:
+            raise BatchFailure(key)
+        return super(BatchValidationMixin, self).fail(key, **kwargs)
+
+    def check(self, data=empty):
+        """
+        Validates ``data`` without raising, returns a ``ValidationResult``.
+        """
+        try:
+            value, code = _checker(self)(data)
+        except ValidationError as exc:
+            return ValidationResult(None, _error_code(exc), data, self,
+                                    _first_message(exc.detail))
+        return ValidationResult(value, code, data, self)
+
+    def validate_many(self, values, **kwargs):
+        return validate_many(self, values, **kwargs)
+
+    def avalidate_many(self, values, **kwargs):
+        """
+        Async iterator of ``(value, error)`` pairs, see ``rest_localflavor.aio``.
+        """
+        from .aio import avalidate_many
+        return avalidate_many(self, values, **kwargs)
+
+
+_run_validation = six.get_unbound_function(BatchValidationMixin.run_validation)
+
+
+def field_classes():
+    """
+    Returns a map of the name of every localflavor field to its class.
+    """
+    from .br import serializers as br
+    from .ca import serializers as ca
+    from .us import serializers as us
+
+    classes = {}
+    for module in (br, ca, us):
+        for name, value in vars(module).items():
+            if (isinstance(value, type) and issubclass(value, BatchValidationMixin) and
+                    value.__module__ == module.__name__):
+                classes[name] = value
+    return classes
@@ -9,6 +9,15 @@ when explicitly needed.
 """
 from __future__ import unicode_literals
 
+from ..generic.lazy import lazy_attributes
+from ..generic.normalize import build_index
+from ..generic.regions import STATE, RegionRegistry
+
+__all__ = ['AC', 'AL', 'AP', 'AM', 'BA', 'CE', 'DF', 'ES', 'GO',
+           'MA', 'MT', 'MS', 'MG', 'PA', 'PB', 'PR', 'PE', 'PI',
+           'RJ', 'RN', 'RS', 'RO', 'RR', 'SC', 'SP', 'SE', 'TO',
+           'REGIONS', 'STATE_CHOICES']
+
 AC = 'ac'
 AL = 'al'
 AP = 'ap'
@@ -37,32 +46,46 @@ SP = 'sp'
 SE = 'se'
 TO = 'to'
 
-STATE_CHOICES = (
-    (AC, 'Acre'),
-    (AL, 'Alagoas'),
-    (AP, 'Amapá'),
-    (AM, 'Amazonas'),
-    (BA, 'Bahia'),
-    (CE, 'Ceará'),
-    (DF, 'Distrito Federal'),
-    (ES, 'Espírito Santo'),
-    (GO, 'Goiás'),
-    (MA, 'Maranhão'),
-    (MT, 'Mato Grosso'),
-    (MS, 'Mato Grosso do Sul'),
-    (MG, 'Minas Gerais'),
-    (PA, 'Pará'),
-    (PB, 'Paraíba'),
-    (PR, 'Paraná'),
-    (PE, 'Pernambuco'),
-    (PI, 'Piauí'),
-    (RJ, 'Rio de Janeiro'),
-    (RN, 'Rio Grande do Norte'),
-    (RS, 'Rio Grande do Sul'),
-    (RO, 'Rondônia'),
-    (RR, 'Roraima'),
-    (SC, 'Santa Catarina'),
-    (SP, 'São Paulo'),
-    (SE, 'Sergipe'),
-    (TO, 'Tocantins'),
-)
+#: The states and the federal district, alphabetical.
+REGIONS = RegionRegistry('BR', (
+    (AC, 'Acre', STATE),
+    (AL, 'Alagoas', STATE),
+    (AP, 'Amapá', STATE),
+    (AM, 'Amazonas', STATE),
+    (BA, 'Bahia', STATE),
+    (CE, 'Ceará', STATE),
+    (DF, 'Distrito Federal', STATE),
+    (ES, 'Espírito Santo', STATE),
+    (GO, 'Goiás', STATE),
+    (MA, 'Maranhão', STATE),
+    (MT, 'Mato Grosso', STATE),
+    (MS, 'Mato Grosso do Sul', STATE),
+    (MG, 'Minas Gerais', STATE),
+    (PA, 'Pará', STATE),
+    (PB, 'Paraíba', STATE),
+    (PR, 'Paraná', STATE),
+    (PE, 'Pernambuco', STATE),
+    (PI, 'Piauí', STATE),
+    (RJ, 'Rio de Janeiro', STATE),
+    (RN, 'Rio Grande do Norte', STATE),
+    (RS, 'Rio Grande do Sul', STATE),
+    (RO, 'Rondônia', STATE),
+    (RR, 'Roraima', STATE),
+    (SC, 'Santa Catarina', STATE),
+    (SP, 'São Paulo', STATE),
+    (SE, 'Sergipe', STATE),
+    (TO, 'Tocantins', STATE),
+))
+
+STATE_CHOICES = REGIONS.choices()
+
+
+def _states_index():
+    return build_index(dict((region.code, region.code) for region in REGIONS),
+                       dict((region.name, region.code) for region in REGIONS), folded=True)
+
+
+# STATES_INDEX, the read only index of the codes and names, also keyed by
+# the folded names (see ``rest_localflavor.generic.normalize.fold``), is
+# built on first access.
+__getattr__ = lazy_attributes(globals(), {'STATES_INDEX': _states_index})
@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+"""
+The ranges of CEP (zip code) prefixes of every Brazilian state.
+Source: https://pt.wikipedia.org/wiki/C%C3%B3digo_de_Endere%C3%A7amento_Postal
+
+This exists in this standalone file so that it's only imported into memory
+when explicitly needed.
+"""
+from __future__ import unicode_literals
+
+from bisect import bisect_right
+
+from .br_states import (
+    AC, AL, AM, AP, BA, CE, DF, ES, GO, MA, MG, MS, MT, PA, PB, PE, PI, PR, RJ, RN,
+    RO, RR, RS, SC, SE, SP, TO)
+
+__all__ = ['CEP_RANGES', 'cep_state']
+
+#: Sorted, non overlapping ``(first, last, state)`` ranges of the first five
+#: digits of the CEPs.
+CEP_RANGES = (
+    (1000, 19999, SP),
+    (20000, 28999, RJ),
+    (29000, 29999, ES),
+    (30000, 39999, MG),
+    (40000, 48999, BA),
+    (49000, 49999, SE),
+    (50000, 56999, PE),
+    (57000, 57999, AL),
+    (58000, 58999, PB),
+    (59000, 59999, RN),
+    (60000, 63999, CE),
+    (64000, 64999, PI),
+    (65000, 65999, MA),
+    (66000, 68899, PA),
+    (68900, 68999, AP),
+    (69000, 69299, AM),
+    (69300, 69399, RR),
+    (69400, 69899, AM),
+    (69900, 69999, AC),
+    (70000, 72799, DF),
+    (72800, 72999, GO),
+    (73000, 73699, DF),
+    (73700, 76799, GO),
+    (76800, 76999, RO),
+    (77000, 77999, TO),
+    (78000, 78899, MT),
+    (79000, 79999, MS),
+    (80000, 87999, PR),
+    (88000, 89999, SC),
+    (90000, 99999, RS),
+)
+
+_FIRSTS = tuple(first for first, _, _ in CEP_RANGES)
+
+
+def cep_state(cep):
+    """
+    Returns the code of the state of ``cep``, in any of the formats
+    ``BRZipCodeField`` accepts, or ``None`` if it is malformed or in no
+    range.
+    """
+    digits = cep.replace('.', '').replace('-', '')
+    if len(digits) != 8 or not digits.isdigit():
+        return None
+    prefix = int(digits[:5])
+    index = bisect_right(_FIRSTS, prefix) - 1
+    if index >= 0 and prefix <= CEP_RANGES[index][1]:
+        return CEP_RANGES[index][2]
+    return None
@@ -1,7 +1,6 @@
 # -*- coding: utf-8 -*-
 from __future__ import unicode_literals
 
-import re
 import django
 
 from django.utils import six
@@ -9,7 +8,6 @@ from django.core.validators import EMPTY_VALUES
 from django.utils.translation import ugettext_lazy as _
 
 from rest_framework import serializers as drf_serializers
-from rest_framework.fields import empty
 
 # MinValueValidator, MaxValueValidator et al. only accept `message` in 1.8+
 if django.VERSION >= (1, 8):
@@ -17,23 +15,33 @@ if django.VERSION >= (1, 8):
 else:
     from rest_framework.compat import MaxLengthValidator, MinLengthValidator
 
-from .br_states import STATE_CHOICES
+from ..batch import BatchValidationMixin
+from ..cache import CachedValidationMixin, cached_validation
+from ..generic.checksums import CNPJ, CPF
+from ..generic.lazy import LazyPattern, lazy_attributes
+from ..generic.normalize import LazyIndex, lookup
+from ..generic.phones import normalize_phone
 
-try:
-    from django.utils.encoding import smart_text
-except ImportError:
-    from django.utils.encoding import smart_unicode as smart_text
 
+zipcode_re = LazyPattern(r'^(\d{2}\.\d{3}|\d{5})(-\d{3}|\d{3})$')
 
+# str.translate tables dropping the punctuation allowed in CPF/CNPJ numbers
+CPF_PUNCTUATION = dict((ord(c), None) for c in '-.')
+CNPJ_PUNCTUATION = dict((ord(c), None) for c in '-/.')
+
+
+# kept for backwards compatibility, the fields use generic.checksums.CPF and CNPJ
 def DV_maker(v):
     if v >= 2:
         return 11 - v
     return 0
 
 
-class BRStateField(drf_serializers.ChoiceField):
+class BRStateField(BatchValidationMixin, drf_serializers.ChoiceField):
     """
-    A field for list brazilian states.
+    A field for list brazilian states. Accepts the codes and names of the
+    states, in any case and with or without accents, e.g. "GO", "Goias" or
+    "Goiás", and normalizes them to the code of the state.
     """
     type_name = "BRStateField"
 
@@ -42,22 +50,63 @@ class BRStateField(drf_serializers.ChoiceField):
         'invalid_choice': _("You can not insert a invalid state.")
     }
     initial = ''
+    max_input_length = 100
 
-    def __init__(self, choices=STATE_CHOICES, **kwargs):
-        self.allow_blank = kwargs.get('allow_blank', False)
-        super(BRStateField, self).__init__(choices, **kwargs)
+    # Load data in memory only when it is required, see also #17275
+    normalized_index = LazyIndex('rest_localflavor.br.br_states', 'STATES_INDEX')
 
-    def run_validation(self, data=empty):
+    # ChoiceField attributes of the default choices, shared by every instance
+    _shared_choices = None
+
+    def __init__(self, choices=None, **kwargs):
+        self.allow_blank = kwargs.get('allow_blank', False)
+        self._default_choices = choices is None
+        if choices is not None:
+            super(BRStateField, self).__init__(choices, **kwargs)
+            return
+        super(BRStateField, self).__init__((), **kwargs)
+        self.__dict__.update(BRStateField._shared_choices or self._build_shared_choices())
+
+    @staticmethod
+    def _build_shared_choices():
+        from .br_states import STATE_CHOICES
+        field = drf_serializers.ChoiceField(STATE_CHOICES)
+        BRStateField._shared_choices = dict(
+            (name, value) for name, value in vars(field).items()
+            if name in ('choices', '_choices', 'grouped_choices', 'choice_strings_to_values'))
+        return BRStateField._shared_choices
+
+    def _check(self, data):
         if data in EMPTY_VALUES or not isinstance(data, six.text_type):
             if not self.allow_blank:
-                self.fail('empty')
-            return data
-        return super(BRStateField, self).run_validation(data)
+                return None, 'empty'
+            return data, None
+        if self._oversized(data):
+            return None, 'invalid_choice'
+        if not self._default_choices or self.validators:
+            return self._base_validation(data), None
+        value = self._lookup(data)
+        if value is None:
+            return None, 'invalid_choice'
+        return value, None
+
+    def _lookup(self, data):
+        index = self.normalized_index
+        try:
+            return index[data]
+        except KeyError:
+            return lookup(index, data, folded=True)
 
     def to_internal_value(self, data):
         if data == '' and self.allow_blank:
             return ''
 
+        if self._default_choices:
+            value = self._lookup(data)
+            if value is None:
+                self.fail('invalid_choice', input=data)
+            return value
+
         try:
             return self.choice_strings_to_values[six.text_type(data)]
         except KeyError:
@@ -67,7 +116,7 @@ class BRStateField(drf_serializers.ChoiceField):
         return super(BRStateField, self).to_representation(value)
 
 
-class BRCPFField(drf_serializers.CharField):
+class BRCPFField(BatchValidationMixin, drf_serializers.CharField):
     """
     This field validate a CPF number or a CPF string. A CPF number is
     compounded by XXX.XXX.XXX-VD. The two last digits are check digits.
@@ -82,6 +131,7 @@ class BRCPFField(drf_serializers.CharField):
         'max_length': _('Ensure this field has no more than {max_length} characters.'),
         'min_length': _('Ensure this field has at least {min_length} characters.')
     }
+    max_input_length = 64
 
     def __init__(self, max_length=14, min_length=11, **kwargs):
         self.allow_blank = kwargs.get('allow_blank', False)
@@ -102,37 +152,30 @@ class BRCPFField(drf_serializers.CharField):
                 MinLengthValidator(self.min_length, message=message)
             )
 
-    def run_validation(self, value=empty):
+    def _check(self, value):
         if value in EMPTY_VALUES or not isinstance(value, six.text_type):
             if not self.allow_blank:
-                self.fail('invalid')
-            return ''
+                return None, 'invalid'
+            return '', None
+        if self._oversized(value):
+            return None, 'max_digits'
 
         orig_value = value[:]
         if not value.isdigit():
-            value = re.sub("[-\.]", "", value)
-        try:
-            int(value)
-        except ValueError:
-            self.fail('digits_only')
+            value = value.translate(CPF_PUNCTUATION)
+        if not value.isdecimal():
+            try:
+                int(value)
+            except ValueError:
+                return None, 'digits_only'
         if len(value) != 11:
-            self.fail('max_digits')
-        orig_dv = value[-2:]
-
-        new_1dv = sum([i * int(value[idx]) for idx, i in enumerate(
-            range(10, 1, -1))])
-        new_1dv = DV_maker(new_1dv % 11)
-        value = value[:-2] + str(new_1dv) + value[-1]
-        new_2dv = sum([i * int(value[idx]) for idx, i in enumerate(
-            range(11, 1, -1))])
-        new_2dv = DV_maker(new_2dv % 11)
-        value = value[:-1] + str(new_2dv)
-        if value[-2:] != orig_dv:
-            self.fail('invalid')
-        return orig_value
-
-
-class BRCNPJField(drf_serializers.CharField):
+            return None, 'max_digits'
+        if not CPF.is_valid(value):
+            return None, 'invalid'
+        return orig_value, None
+
+
+class BRCNPJField(BatchValidationMixin, drf_serializers.CharField):
     """
     This field validate a CNPJ number or a CNPJ string. A CNPJ number is
     compounded by XXX.XXX.XXX-VD. The two last digits are check digits.
@@ -145,43 +188,37 @@ class BRCNPJField(drf_serializers.CharField):
         'digits_only': _("This field requires only numbers."),
         'max_digits': _("This field requires at least 14 digits"),
     }
+    max_input_length = 64
 
     def __init__(self, **kwargs):
         self.allow_blank = kwargs.get('allow_blank', False)
         super(BRCNPJField, self).__init__(**kwargs)
 
-    def run_validation(self, value=empty):
+    def _check(self, value):
         if value in EMPTY_VALUES or not isinstance(value, six.text_type):
             if not self.allow_blank:
-                self.fail('invalid')
-            return ''
+                return None, 'invalid'
+            return '', None
+        if self._oversized(value):
+            return None, 'max_digits'
 
         orig_value = value[:]
         if not value.isdigit():
-            value = re.sub("[-/\.]", "", value)
-        try:
-            int(value)
-        except ValueError:
-            self.fail('digits_only')
+            value = value.translate(CNPJ_PUNCTUATION)
+        if not value.isdecimal():
+            try:
+                int(value)
+            except ValueError:
+                return None, 'digits_only'
         if len(value) != 14:
-            self.fail('max_digits')
-        orig_dv = value[-2:]
+            return None, 'max_digits'
+        if not CNPJ.is_valid(value):
+            return None, 'invalid'
 
-        new_1dv = sum([i * int(value[idx]) for idx, i in enumerate(
-            list(range(5, 1, -1)) + list(range(9, 1, -1)))])
-        new_1dv = DV_maker(new_1dv % 11)
-        value = value[:-2] + str(new_1dv) + value[-1]
-        new_2dv = sum([i * int(value[idx]) for idx, i in enumerate(
-            list(range(6, 1, -1)) + list(range(9, 1, -1)))])
-        new_2dv = DV_maker(new_2dv % 11)
-        value = value[:-1] + str(new_2dv)
-        if value[-2:] != orig_dv:
-            self.fail('invalid')
+        return orig_value, None
 
-        return orig_value
 
-
-class BRZipCodeField(drf_serializers.RegexField):
+class BRZipCodeField(CachedValidationMixin, BatchValidationMixin, drf_serializers.RegexField):
     """
     This field validate a Zip code number or a Zip code string. A Zip code is
     a number to represent a place, that compounded by XXXXX-XXX, XX.XXX-XXX or
@@ -192,22 +229,24 @@ class BRZipCodeField(drf_serializers.RegexField):
     default_error_messages = {
         'invalid': _('Enter a zip code in the format XXXXX-XXX, XX.XXX-XXX or XXXXXXXX.'),
     }
+    max_input_length = 64
 
     def __init__(self, **kwargs):
         self.allow_blank = kwargs.get('allow_blank', False)
-        super(BRZipCodeField, self).__init__(
-            r'^(\d{2}\.\d{3}|\d{5})(-\d{3}|\d{3})$', **kwargs
-        )
+        super(BRZipCodeField, self).__init__(zipcode_re, **kwargs)
 
-    def run_validation(self, value=empty):
+    @cached_validation
+    def _check(self, value):
         if value in EMPTY_VALUES or not isinstance(value, six.text_type):
             if not self.allow_blank:
-                self.fail('invalid')
-            return ''
-        return super(BRZipCodeField, self).run_validation(value)
+                return None, 'invalid'
+            return '', None
+        if self._oversized(value):
+            return None, 'invalid'
+        return self._base_validation(value), None
 
 
-class BRPhoneNumberField(drf_serializers.CharField):
+class BRPhoneNumberField(CachedValidationMixin, BatchValidationMixin, drf_serializers.CharField):
     """
     A form field that validates input as a Brazilian phone number, that must
     be in either of the following formats: XX-XXXX-XXXX or XX-XXXXX-XXXX.
@@ -218,22 +257,31 @@ class BRPhoneNumberField(drf_serializers.CharField):
         'invalid': _(('Phone numbers must be in either of the following '
                       'formats: XX-XXXX-XXXX or XX-XXXXX-XXXX.')),
     }
+    max_input_length = 64
 
     def __init__(self, **kwargs):
         self.allow_blank = kwargs.get('allow_blank', False)
         super(BRPhoneNumberField, self).__init__(**kwargs)
 
-    def run_validation(self, value=empty):
+    @cached_validation
+    def _check(self, value):
         if value in EMPTY_VALUES or not isinstance(value, six.text_type):
             if not self.allow_blank:
-                self.fail('invalid')
+                return None, 'invalid'
             else:
-                return value
-
-        phone_digits_re = re.compile(r'^(\(\d{2}\)|\d{2})[-\.\s]?(\d{4,5})[-\.\s]?(\d{4})$')
-        value = re.sub('(\(|\)|\s+)', '', smart_text(value))
-        m = phone_digits_re.search(value)
-        if m:
-            return '%s-%s-%s' % (m.group(1), m.group(2), m.group(3))
-        else:
-            self.fail('invalid')
+                return value, None
+        if self._oversized(value):
+            return None, 'invalid'
+
+        value = normalize_phone('BR', value)
+        if value is None:
+            return None, 'invalid'
+        return value, None
+
+
+def _state_choices():
+    from .br_states import STATE_CHOICES
+    return STATE_CHOICES
+
+
+__getattr__ = lazy_attributes(globals(), {'STATE_CHOICES': _state_choices})
@@ -0,0 +1,35 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from django.utils.translation import ugettext_lazy as _
+
+from ..generic.normalize import LazyIndex, lookup
+from ..generic.validators import PostalCodeRegionValidator
+
+__all__ = ['BRZipCodeStateValidator']
+
+
+class BRZipCodeStateValidator(PostalCodeRegionValidator):
+    """
+    Checks that a CEP belongs to the state (code or name) of another field
+    of the payload, against the CEP ranges of every state::
+
+        class AddressSerializer(serializers.Serializer):
+            cep = BRZipCodeField()
+            uf = BRStateField()
+
+            class Meta:
+                validators = [BRZipCodeStateValidator('cep', 'uf')]
+    """
+    message = _('The zip code {postal_code} is not from the state {region}.')
+
+    # Load data in memory only when it is required, see also #17275
+    states_index = LazyIndex('rest_localflavor.br.br_states', 'STATES_INDEX')
+
+    def regions(self, postal_code):
+        from .cep_ranges import cep_state
+        state = cep_state(postal_code)
+        return (state,) if state else ()
+
+    def normalize_region(self, region):
+        return lookup(self.states_index, region, folded=True)
@@ -1,22 +1,30 @@
 from django.utils.translation import ugettext_lazy as _
 
+from ..generic.lazy import lazy_attributes
+from ..generic.normalize import build_index
+from ..generic.regions import STATE, TERRITORY, RegionRegistry
+
+#: The provinces and territories, alphabetical.
+#: Source: http://www.canada.gc.ca/othergov/prov_e.html
+REGIONS = RegionRegistry('CA', (
+    ('AB', _('Alberta'), STATE),
+    ('BC', _('British Columbia'), STATE),
+    ('MB', _('Manitoba'), STATE),
+    ('NB', _('New Brunswick'), STATE),
+    ('NL', _('Newfoundland and Labrador'), STATE),
+    ('NT', _('Northwest Territories'), TERRITORY),
+    ('NS', _('Nova Scotia'), STATE),
+    ('NU', _('Nunavut'), TERRITORY),
+    ('ON', _('Ontario'), STATE),
+    ('PE', _('Prince Edward Island'), STATE),
+    ('QC', _('Quebec'), STATE),
+    ('SK', _('Saskatchewan'), STATE),
+    ('YT', _('Yukon'), TERRITORY),
+))
+
 #: An alphabetical list of provinces and territories for use as `choices`
-#: in a formfield. Source: http://www.canada.gc.ca/othergov/prov_e.html
-PROVINCE_CHOICES = (
-    ('AB', _('Alberta')),
-    ('BC', _('British Columbia')),
-    ('MB', _('Manitoba')),
-    ('NB', _('New Brunswick')),
-    ('NL', _('Newfoundland and Labrador')),
-    ('NT', _('Northwest Territories')),
-    ('NS', _('Nova Scotia')),
-    ('NU', _('Nunavut')),
-    ('ON', _('Ontario')),
-    ('PE', _('Prince Edward Island')),
-    ('QC', _('Quebec')),
-    ('SK', _('Saskatchewan')),
-    ('YT', _('Yukon'))
-)
+#: in a formfield.
+PROVINCE_CHOICES = REGIONS.choices()
 
 #: a mapping of province misspellings/abbreviations to normalized abbreviations
 PROVINCES_NORMALIZED = {
@@ -55,3 +63,9 @@ PROVINCES_NORMALIZED = {
     'yukon': 'YT',
     'yukon territory': 'YT',
 }
+
+# PROVINCES_INDEX, the read only index of PROVINCES_NORMALIZED, is built on
+# first access.
+__getattr__ = lazy_attributes(globals(), {
+    'PROVINCES_INDEX': lambda: build_index(PROVINCES_NORMALIZED),
+})
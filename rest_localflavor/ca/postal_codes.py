@@ -0,0 +1,84 @@
+"""
+The provinces of the canadian postal codes, from their first letter and,
+where the letter is shared by several provinces, their forward sortation
+area (FSA, the first three characters).
+Source: https://en.wikipedia.org/wiki/List_of_postal_codes_of_Canada
+
+This exists in this standalone file so that it's only imported into memory
+when explicitly needed.
+"""
+from array import array
+
+from .ca_provinces import PROVINCE_CHOICES
+
+__all__ = ['LETTER_PROVINCES', 'FSA_PROVINCES', 'postal_code_provinces',
+           'in_province']
+
+#: The provinces of every first letter of the postal codes.
+LETTER_PROVINCES = {
+    'A': ('NL',),
+    'B': ('NS',),
+    'C': ('PE',),
+    'E': ('NB',),
+    'G': ('QC',),
+    'H': ('QC',),
+    'J': ('QC',),
+    'K': ('ON',),
+    'L': ('ON',),
+    'M': ('ON',),
+    'N': ('ON',),
+    'P': ('ON',),
+    'R': ('MB',),
+    'S': ('SK',),
+    'T': ('AB',),
+    'V': ('BC',),
+    'X': ('NT', 'NU'),
+    'Y': ('YT',),
+}
+
+#: The province of the FSAs of the letters shared by several provinces.
+FSA_PROVINCES = {
+    'X0A': 'NU',
+    'X0B': 'NU',
+    'X0C': 'NU',
+    'X0E': 'NT',
+    'X0G': 'NT',
+    'X1A': 'NT',
+}
+
+# one bit per province, in the order of PROVINCE_CHOICES
+PROVINCE_BITS = dict((code, 1 << bit) for bit, (code, _) in enumerate(PROVINCE_CHOICES))
+
+# the provinces of every letter from A to Z, and the same as bitsets
+_LETTER_TUPLES = tuple(LETTER_PROVINCES.get(chr(letter), ())
+                       for letter in range(ord('A'), ord('Z') + 1))
+_LETTER_MASKS = array('H', [sum(PROVINCE_BITS[code] for code in codes)
+                            for codes in _LETTER_TUPLES])
+_A = ord('A')
+
+
+def postal_code_provinces(postal_code):
+    """
+    Returns the codes of the provinces ``postal_code`` may be from, from
+    its FSA or only its first letter, an empty tuple when none.
+    """
+    fsa = postal_code[:3].upper()
+    province = FSA_PROVINCES.get(fsa)
+    if province is not None:
+        return (province,)
+    index = ord(fsa[0]) - _A if fsa else -1
+    if 0 <= index < 26:
+        return _LETTER_TUPLES[index]
+    return ()
+
+
+def in_province(postal_code, province):
+    """
+    Returns whether ``postal_code`` may be from ``province``, a province
+    code.
+    """
+    fsa = postal_code[:3].upper()
+    if fsa in FSA_PROVINCES:
+        return FSA_PROVINCES[fsa] == province
+    index = ord(fsa[0]) - _A if fsa else -1
+    return 0 <= index < 26 and bool(_LETTER_MASKS[index] & PROVINCE_BITS.get(province, 0))
@@ -1,6 +1,4 @@
 
-import re
-
 from django.core.validators import EMPTY_VALUES
 from django.utils.translation import ugettext_lazy as _
 
@@ -10,17 +8,21 @@ except ImportError:
     from django.utils.encoding import smart_unicode as smart_text
 
 from rest_framework import serializers
-from rest_framework.fields import empty
 
+from ..batch import BatchValidationMixin
+from ..cache import CachedValidationMixin, cached_validation
 from ..generic.checksums import luhn
+from ..generic.fields import BlankInvalidMixin, ShallowCopyMixin, invalid_messages
+from ..generic.lazy import LazyPattern
+from ..generic.normalize import LazyIndex, lookup
+from ..generic.phones import normalize_phone
 
 
-postcode_re = re.compile(r'^([ABCEGHJKLMNPRSTVXY]\d[ABCEGHJKLMNPRSTVWXYZ]) *(\d[ABCEGHJKLMNPRSTVWXYZ]\d)$')
-phone_digits_re = re.compile(r'^(?:1-?)?(\d{3})[-\.]?(\d{3})[-\.]?(\d{4})$')
-sin_re = re.compile(r"^(\d{3})-(\d{3})-(\d{3})$")
+postcode_re = LazyPattern(r'^([ABCEGHJKLMNPRSTVXY]\d[ABCEGHJKLMNPRSTVWXYZ]) *(\d[ABCEGHJKLMNPRSTVWXYZ]\d)$')
+sin_re = LazyPattern(r"^(\d{3})-(\d{3})-(\d{3})$")
 
 
-class CAPostalCodeField(serializers.CharField):
+class CAPostalCodeField(BlankInvalidMixin, CachedValidationMixin, ShallowCopyMixin, BatchValidationMixin, serializers.CharField):
     """
     Canadian postal code field.
 
@@ -30,89 +32,76 @@ class CAPostalCodeField(serializers.CharField):
     http://www.canadapost.ca/tools/pg/manual/PGaddress-e.asp#1402170
     """
 
-    default_error_messages = {
-        'invalid': _('Enter a postal code in the format XXX XXX.'),
-    }
+    default_error_messages = invalid_messages(_('Enter a postal code in the format XXX XXX.'))
 
-    def __init__(self, *args, **kwargs):
-        super(CAPostalCodeField, self).__init__(*args, **kwargs)
-        self.error_messages['blank'] = self.error_messages['invalid']
-        self.error_messages['null'] = self.error_messages['invalid']
+    max_input_length = 64
 
-    def run_validation(self, data=empty):
-        data = super(CAPostalCodeField, self).run_validation(data)
+    @cached_validation
+    def _check(self, data):
+        if self._oversized(data):
+            return None, 'invalid'
+        data = self._base_validation(data)
         if data in EMPTY_VALUES:
-            return ''
+            return '', None
 
         postcode = data.upper().strip()
         m = postcode_re.match(postcode)
         if not m:
-            self.fail('invalid')
-        return "%s %s" % (m.group(1), m.group(2))
+            return None, 'invalid'
+        return "%s %s" % (m.group(1), m.group(2)), None
 
 
-class CAPhoneNumberField(serializers.CharField):
+class CAPhoneNumberField(BlankInvalidMixin, ShallowCopyMixin, BatchValidationMixin, serializers.CharField):
     """
     Canadian phone number field.
     """
 
-    default_error_messages = {
-        'invalid': _('Phone numbers must be in XXX-XXX-XXXX format.'),
-    }
+    default_error_messages = invalid_messages(_('Phone numbers must be in XXX-XXX-XXXX format.'))
 
-    def __init__(self, *args, **kwargs):
-        super(CAPhoneNumberField, self).__init__(*args, **kwargs)
-        self.error_messages['blank'] = self.error_messages['invalid']
-        self.error_messages['null'] = self.error_messages['invalid']
+    max_input_length = 64
 
-    def run_validation(self, data=empty):
-        super(CAPhoneNumberField, self).run_validation(data)
+    def _check(self, data):
+        if self._oversized(data):
+            return None, 'invalid'
+        self._base_validation(data)
         if data in EMPTY_VALUES:
-            return ''
+            return '', None
 
-        value = re.sub('(\(|\)|\s+)', '', smart_text(data))
-        m = phone_digits_re.search(value)
-        if m:
-            return '%s-%s-%s' % (m.group(1), m.group(2), m.group(3))
-        self.fail('invalid')
+        value = normalize_phone('CA', smart_text(data))
+        if value is None:
+            return None, 'invalid'
+        return value, None
 
 
-class CAProvinceField(serializers.CharField):
+class CAProvinceField(BlankInvalidMixin, CachedValidationMixin, ShallowCopyMixin, BatchValidationMixin, serializers.CharField):
     """
     A field that validates its input is a Canadian province name or abbreviation.
     It normalizes the input to the standard two-letter postal service
     abbreviation for the given province.
     """
 
-    default_error_messages = {
-        'invalid': _('Enter a Canadian province or territory.'),
-    }
+    default_error_messages = invalid_messages(_('Enter a Canadian province or territory.'))
+
+    # Load data in memory only when it is required, see also #17275
+    normalized_index = LazyIndex('rest_localflavor.ca.ca_provinces', 'PROVINCES_INDEX')
 
-    def __init__(self, *args, **kwargs):
-        super(CAProvinceField, self).__init__(*args, **kwargs)
-        self.error_messages['blank'] = self.error_messages['invalid']
-        self.error_messages['null'] = self.error_messages['invalid']
+    max_input_length = 100
 
-    def run_validation(self, data=empty):
-        super(CAProvinceField, self).run_validation(data)
+    @cached_validation
+    def _check(self, data):
+        if self._oversized(data):
+            return None, 'invalid'
+        self._base_validation(data)
         if data in EMPTY_VALUES:
-            return ''
-
-        try:
-            value = data.strip().lower()
-        except AttributeError:
-            pass
-        else:
-            # Load data in memory only when it is required, see also #17275
-            from .ca_provinces import PROVINCES_NORMALIZED
-            try:
-                return PROVINCES_NORMALIZED[value.strip().lower()]
-            except KeyError:
-                pass
-        self.fail('invalid')
-
-
-class CASocialInsuranceNumberField(serializers.CharField):
+            return '', None
+
+        value = lookup(self.normalized_index, data)
+        if value is None:
+            return None, 'invalid'
+        return value, None
+
+
+class CASocialInsuranceNumberField(BlankInvalidMixin, ShallowCopyMixin, BatchValidationMixin, serializers.CharField):
     """
     A Canadian Social Insurance Number (SIN).
 
@@ -124,23 +113,20 @@ class CASocialInsuranceNumberField(serializers.CharField):
          See: http://en.wikipedia.org/wiki/Social_Insurance_Number
     """
 
-    default_error_messages = {
-        'invalid': _('Enter a valid Canadian Social Insurance number in XXX-XXX-XXX format.'),
-    }
+    default_error_messages = invalid_messages(_('Enter a valid Canadian Social Insurance number in XXX-XXX-XXX format.'))
 
-    def __init__(self, *args, **kwargs):
-        super(CASocialInsuranceNumberField, self).__init__(*args, **kwargs)
-        self.error_messages['blank'] = self.error_messages['invalid']
-        self.error_messages['null'] = self.error_messages['invalid']
+    max_input_length = 64
 
-    def run_validation(self, data=empty):
-        super(CASocialInsuranceNumberField, self).run_validation(data)
+    def _check(self, data):
+        if self._oversized(data):
+            return None, 'invalid'
+        self._base_validation(data)
         if data in EMPTY_VALUES:
-            return ''
+            return '', None
 
-        match = re.match(sin_re, data)
+        match = sin_re.match(data)
         if not match:
-            self.fail('invalid')
+            return None, 'invalid'
 
         number = '%s-%s-%s' % (match.group(1), match.group(2), match.group(3))
         check_number = '%s%s%s' % (
@@ -148,5 +134,5 @@ class CASocialInsuranceNumberField(serializers.CharField):
             match.group(2),
             match.group(3))
         if not luhn(check_number):
-            self.fail('invalid')
-        return number
+            return None, 'invalid'
+        return number, None
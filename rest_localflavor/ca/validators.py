@@ -0,0 +1,31 @@
+from django.utils.translation import ugettext_lazy as _
+
+from ..generic.normalize import LazyIndex, lookup
+from ..generic.validators import PostalCodeRegionValidator
+
+__all__ = ['CAPostalCodeProvinceValidator']
+
+
+class CAPostalCodeProvinceValidator(PostalCodeRegionValidator):
+    """
+    Checks that a postal code is from the province (code or name) of
+    another field of the payload, from its first letter and FSA::
+
+        class AddressSerializer(serializers.Serializer):
+            postal_code = CAPostalCodeField()
+            province = CAProvinceField()
+
+            class Meta:
+                validators = [CAPostalCodeProvinceValidator('postal_code', 'province')]
+    """
+    message = _('The postal code {postal_code} is not from the province {region}.')
+
+    # Load data in memory only when it is required, see also #17275
+    provinces_index = LazyIndex('rest_localflavor.ca.ca_provinces', 'PROVINCES_INDEX')
+
+    def regions(self, postal_code):
+        from .postal_codes import postal_code_provinces
+        return postal_code_provinces(postal_code)
+
+    def normalize_region(self, region):
+        return lookup(self.provinces_index, region)
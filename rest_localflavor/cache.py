@@ -0,0 +1,222 @@
+"""
+Opt-in LRU cache of validation results for pure fields, the ones
+whose output only depends on the input string and on their options.
+
+Caching is off by default. Enable it for every cacheable field, or per
+field class, in the Django settings::
+
+    REST_LOCALFLAVOR_CACHE = {
+        'DEFAULT_SIZE': 1024,
+        'USStateField': 4096,
+    }
+
+or per field with the ``cache_size`` argument. Instances of the same class
+with the same options share one cache, since DRF creates new field
+instances for every serializer. Fields built with custom ``validators`` or
+``error_messages`` are never cached. Both normalized values and failure codes
+are cached; failure messages are still rendered on every call, except the
+ones raised by validators, which are cached for the active language.
+"""
+import threading
+from functools import wraps
+from collections import OrderedDict
+
+from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.utils import six
+from django.utils.translation import get_language
+
+from rest_framework.exceptions import ValidationError
+
+from .batch import BatchFailure
+
+__all__ = ['LRUCache', 'CachedValidationMixin', 'cached_validation',
+           'cache_stats', 'clear_caches']
+
+#: Inputs longer than this are never cached.
+MAX_KEY_LENGTH = 100
+
+_MISSING = object()
+
+
+class LRUCache(object):
+    """
+    A bounded, thread safe, least recently used mapping with hit, miss and
+    eviction counters.
+    """
+
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self.hits = self.misses = self.evictions = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            try:
+                value = self._data.pop(key)
+            except KeyError:
+                self.misses += 1
+                return default
+            self._data[key] = value
+            self.hits += 1
+            return value
+
+    def set(self, key, value):
+        with self._lock:
+            self._data.pop(key, None)
+            self._data[key] = value
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def __len__(self):
+        return len(self._data)
+
+    def stats(self):
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'size': len(self._data),
+            'maxsize': self.maxsize,
+        }
+
+
+#: The options changing the output of a field, part of its cache key.
+_SIGNATURE_OPTIONS = ('required', 'allow_blank', 'allow_null',
+                      'max_length', 'min_length', 'trim_whitespace')
+
+_caches = {}
+_caches_lock = threading.Lock()
+_state = threading.local()
+
+
+def _get_cache(signature, size):
+    cache = _caches.get(signature)
+    if cache is None:
+        with _caches_lock:
+            cache = _caches.setdefault(signature, LRUCache(size))
+    return cache
+
+
+# field class -> configured size, cleared when the settings change
+_configured_sizes = {}
+
+
+def _configured_size(field_class):
+    try:
+        return _configured_sizes[field_class]
+    except KeyError:
+        pass
+    config = getattr(settings, 'REST_LOCALFLAVOR_CACHE', None) or {}
+    size = config.get(field_class.__name__)
+    if size is None:
+        size = config.get('DEFAULT_SIZE', 0)
+    _configured_sizes[field_class] = size
+    return size
+
+
+@receiver(setting_changed)
+def _reset_configured_sizes(setting, **kwargs):
+    if setting == 'REST_LOCALFLAVOR_CACHE':
+        _configured_sizes.clear()
+
+
+def cache_stats():
+    """
+    Returns the counters of every field cache, one dict per cache with the
+    field class name and its options.
+    """
+    stats = []
+    for signature, cache in list(_caches.items()):
+        info = cache.stats()
+        info['field'] = signature[0].__name__
+        info['options'] = dict(zip(_SIGNATURE_OPTIONS, signature[1:]))
+        stats.append(info)
+    return stats
+
+
+def clear_caches():
+    with _caches_lock:
+        _caches.clear()
+
+
+class CachedValidationMixin(object):
+    """
+    Sets up the cache of a pure field, whose ``_check`` is wrapped
+    with ``cached_validation``. Fields built with custom ``validators`` or
+    ``error_messages`` are never cached: the messages of validators are
+    cached with the results.
+    """
+
+    def __init__(self, *args, **kwargs):
+        cache_size = kwargs.pop('cache_size', None)
+        pure = 'validators' not in kwargs and 'error_messages' not in kwargs
+        super(CachedValidationMixin, self).__init__(*args, **kwargs)
+        if cache_size is None:
+            cache_size = _configured_size(type(self))
+        self._validation_cache = None
+        if cache_size and pure:
+            signature = (type(self),) + tuple(
+                getattr(self, name, None) for name in _SIGNATURE_OPTIONS)
+            self._validation_cache = _get_cache(signature, cache_size)
+
+    def fail(self, key, **kwargs):
+        _state.code = key
+        return super(CachedValidationMixin, self).fail(key, **kwargs)
+
+
+def _cached_result(cache, data):
+    """
+    Returns the cached ``(value, code)`` of ``data``, or ``_MISSING``.
+    Raises the cached validator errors of the active language.
+    """
+    cached = cache.get(data, _MISSING)
+    if cached is _MISSING:
+        return _MISSING
+    value, code, detail, language = cached
+    if detail is None:
+        return value, code
+    if language == get_language():
+        raise ValidationError(detail)
+    return _MISSING
+
+
+def cached_validation(check):
+    """
+    Decorates the ``_check`` of a ``CachedValidationMixin`` field.
+    """
+    @wraps(check)
+    def wrapper(self, data):
+        cache = self._validation_cache
+        if (cache is None or not isinstance(data, six.text_type) or
+                len(data) > MAX_KEY_LENGTH):
+            return check(self, data)
+
+        result = _cached_result(cache, data)
+        if result is not _MISSING:
+            return result
+
+        _state.code = None
+        try:
+            value, code = check(self, data)
+        except BatchFailure as exc:
+            cache.set(data, (None, exc.code, None, None))
+            raise
+        except ValidationError as exc:
+            if _state.code is not None:
+                cache.set(data, (None, _state.code, None, None))
+            else:
+                # raised by a validator, its message is already rendered
+                cache.set(data, (None, None, exc.detail, get_language()))
+            raise
+        cache.set(data, (value, code, None, None))
+        return value, code
+    return wrapper
@@ -1,13 +1,59 @@
 """
 Common checksum routines.
+
+Besides ``luhn``, check digit algorithms are instances of
+``CheckDigitAlgorithm`` subclasses: ``Luhn``, ``Mod11`` with configurable
+weights, ``Verhoeff``, ``Damm`` and ISO 7064 ``Mod97_10``. They share
+``decode``, turning a string of digits or an integer into a ``bytearray``
+of digit values, and run over precomputed tables. Each one validates
+(``is_valid``) and computes check digits (``compute``) of a single value,
+or, as a convenience, of every value of a sequence (``is_valid_many``,
+``compute_many``)::
+
+    >>> VERHOEFF.compute('236')
+    '3'
+    >>> DAMM.is_valid_many(['5724', '5727'])
+    [True, False]
 """
+from __future__ import unicode_literals
+
+from operator import mul
 
-__all__ = ['luhn']
+__all__ = ['luhn', 'decode', 'CheckDigitAlgorithm', 'Luhn', 'Mod11', 'Verhoeff',
+           'Damm', 'Mod97_10', 'LUHN', 'VERHOEFF', 'DAMM', 'MOD97_10', 'CPF',
+           'CNPJ', 'CPF_WEIGHTS', 'CNPJ_WEIGHTS', 'DV_MAKER', 'ALGORITHMS']
+
+import unicodedata
 
 from django.utils import six
 
 LUHN_ODD_LOOKUP = (0, 2, 4, 6, 8, 1, 3, 5, 7, 9)  # sum_of_digits(index * 2)
 
+#: Luhn sum of every two digit number, its tens digit doubled.
+LUHN_PAIRS = tuple(LUHN_ODD_LOOKUP[pair // 10] + pair % 10 for pair in range(100))
+
+# bytes.translate tables of the ASCII digits to their values, and to the
+# sum of the digits of their double
+_ASCII_DIGITS = bytearray(range(256))
+_ASCII_DOUBLED = bytearray(range(256))
+for _digit in range(10):
+    _ASCII_DIGITS[48 + _digit] = _digit
+    _ASCII_DOUBLED[48 + _digit] = LUHN_ODD_LOOKUP[_digit]
+_ASCII_DIGITS = bytes(_ASCII_DIGITS)
+_ASCII_DOUBLED = bytes(_ASCII_DOUBLED)
+del _digit
+
+_CHUNK = 10 ** 18
+
+#: Weights of the second verifier digit of the brazilian CPF and CNPJ
+#: numbers. The first verifier digit uses the same tuple without its first
+#: element.
+CPF_WEIGHTS = (11, 10, 9, 8, 7, 6, 5, 4, 3, 2)
+CNPJ_WEIGHTS = (6, 5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2)
+
+# DV_MAKER[remainder] -> verifier digit
+DV_MAKER = tuple(11 - r if r >= 2 else 0 for r in range(11))
+
 
 def luhn(candidate):
     """
@@ -15,11 +61,358 @@ def luhn(candidate):
     algorithm (used in validation of, for example, credit cards).
     Both numeric and string candidates are accepted.
     """
+    if type(candidate) in six.integer_types:  # not bool, whose str() is no number
+        return candidate >= 0 and _luhn_int(candidate)
     if not isinstance(candidate, six.string_types):
         candidate = str(candidate)
+    try:
+        raw = bytearray(candidate.encode('ascii'))
+    except UnicodeError:
+        return _luhn_text(candidate)
+    if not raw.isdigit():
+        return not raw  # no digits at all sum to 0
+    evens = raw[-1::-2]
+    return (sum(evens) - 48 * len(evens) + sum(raw[-2::-2].translate(_ASCII_DOUBLED))) % 10 == 0
+
+
+def _luhn_int(number):
+    # two digits at a time, from the right, in chunks of 18 digits so that
+    # huge numbers are split in few big int divisions
+    total = 0
+    while number:
+        if number >= _CHUNK:
+            number, chunk = divmod(number, _CHUNK)
+        else:
+            number, chunk = 0, number
+        while chunk:
+            chunk, pair = divmod(chunk, 100)
+            total += LUHN_PAIRS[pair]
+    return total % 10 == 0
+
+
+def _luhn_text(candidate):
+    # non ASCII candidates, e.g. with arabic-indic digits int() accepts
     try:
         evens = sum(int(c) for c in candidate[-1::-2])
         odds = sum(LUHN_ODD_LOOKUP[int(c)] for c in candidate[-2::-2])
         return ((evens + odds) % 10 == 0)
     except ValueError:  # Raised if an int conversion fails
         return False
+
+
+class _DigitTable(dict):
+    """
+    Maps a single character to its decimal value. ASCII digits are
+    precomputed, any other unicode decimal digit (the ones ``int()`` also
+    accepts) is resolved once and cached. Non-digits raise ``ValueError``.
+    """
+
+    def __missing__(self, key):
+        value = self[key] = unicodedata.decimal(key)
+        return value
+
+
+_DIGITS = _DigitTable((six.text_type(d), d) for d in range(10))
+
+
+def decode(value):
+    """
+    Returns the digits of ``value``, a non empty string of decimal digits
+    (unicode ones included, like ``int()``) or a non negative integer, as
+    a ``bytearray`` of their values. Raises ``ValueError`` otherwise.
+    """
+    if not isinstance(value, six.string_types):
+        value = six.text_type(value)
+    try:
+        raw = value.encode('ascii')
+    except UnicodeEncodeError:
+        return bytearray(_DIGITS[c] for c in value)
+    if not raw.isdigit():
+        raise ValueError('%r is not a number' % value)
+    return bytearray(raw.translate(_ASCII_DIGITS))
+
+
+class CheckDigitAlgorithm(object):
+    """
+    Base class of the check digit algorithms, appending ``check_digits``
+    digits to a payload. Subclasses implement ``_compute``, returning the
+    check digits of a decoded payload, and may implement ``_is_valid`` in
+    a single pass.
+    """
+    check_digits = 1
+
+    def compute(self, payload):
+        """
+        Returns the check digits of ``payload``, as a string.
+        Raises ``ValueError`` if ``payload`` is not a number.
+        """
+        return ''.join(['%d' % digit for digit in self._compute(decode(payload))])
+
+    def is_valid(self, value):
+        """
+        Checks the trailing check digits of ``value``. Returns ``False`` if
+        ``value`` is not a number.
+        """
+        try:
+            digits = decode(value)
+        except ValueError:
+            return False
+        return self._is_valid(digits)
+
+    def compute_many(self, payloads):
+        """
+        Returns the list of the ``compute`` results of ``payloads``. No
+        faster than a loop, see ``generic.vectorized`` for bulk validation.
+        """
+        compute = self.compute
+        return [compute(payload) for payload in payloads]
+
+    def is_valid_many(self, values):
+        """
+        Returns the list of the ``is_valid`` results of ``values``. No
+        faster than a loop, see ``generic.vectorized`` for bulk validation.
+        """
+        is_valid = self.is_valid
+        return [is_valid(value) for value in values]
+
+    def _is_valid(self, digits):
+        size = len(digits) - self.check_digits
+        if size < 1:
+            return False
+        try:
+            return self._compute(digits[:size]) == digits[size:]
+        except ValueError:
+            return False
+
+    def _compute(self, digits):
+        raise NotImplementedError
+
+    def __repr__(self):
+        return '<%s>' % type(self).__name__
+
+
+class Luhn(CheckDigitAlgorithm):
+    """
+    The Luhn algorithm, of credit card and canadian SIN numbers. Unlike
+    ``luhn()``, an empty string is not valid.
+    """
+
+    _doubled = bytes(bytearray(LUHN_ODD_LOOKUP) + bytearray(range(10, 256)))
+
+    def _compute(self, digits):
+        # the last digit of the payload is doubled once the check digit is appended
+        total = sum(digits[-2::-2]) + sum(digits[-1::-2].translate(self._doubled))
+        return bytearray((-total % 10,))
+
+    def _is_valid(self, digits):
+        return (sum(digits[-1::-2]) + sum(digits[-2::-2].translate(self._doubled))) % 10 == 0
+
+
+class Mod11(CheckDigitAlgorithm):
+    """
+    Weighted modulus 11 check digits, as in the brazilian CPF and CNPJ
+    numbers. The weights are aligned to the right of the payload: the last
+    digit has the last weight. Each of the ``check_digits`` digits is
+    ``remainders[sum % 11]``, by default ``11 - remainder`` or ``0``, and
+    is part of the payload of the next one. With ``length``, only values of
+    that length are valid. The check digits of a valid string are ASCII
+    ones, as the ``str()`` comparison the brazilian fields always made;
+    the payload may hold any unicode decimal digit.
+    """
+
+    def __init__(self, weights, check_digits=1, remainders=DV_MAKER, length=None):
+        self.weights = tuple(weights)
+        self.check_digits = check_digits
+        self.remainders = tuple(remainders)
+        self.length = length
+        if len(self.remainders) != 11:
+            raise ValueError('remainders must have 11 digits')
+        if min(self.weights or (0,)) < 0:
+            raise ValueError('weights must not be negative')
+        # the weights of all the check digits packed in one integer per
+        # digit, by payload length, so that one pass sums them all: the sum
+        # of the k-th check digit is ``total >> shift * k & mask``
+        shift = (9 * sum(self.weights)).bit_length()
+        self._mask = (1 << shift) - 1
+        self._packed = dict(
+            (size, tuple(sum(self.weights[-(size + k):][j] << shift * k for k in range(check_digits))
+                         for j in range(size)))
+            for size in range(1, len(self.weights) - check_digits + 2))
+        # the shift of each check digit, and its packed weights in the next ones
+        self._lanes = tuple(
+            (shift * k, sum(self.weights[k - i] << shift * i for i in range(k + 1, check_digits)))
+            for k in range(check_digits))
+
+    def is_valid(self, value):
+        if not isinstance(value, six.string_types):
+            return super(Mod11, self).is_valid(value)
+        try:
+            digits = decode(value)
+        except ValueError:
+            return False
+        return self._is_valid(digits) and not value[-self.check_digits:].strip('0123456789')
+
+    def _compute(self, digits):
+        try:
+            packed = self._packed[len(digits)]
+        except KeyError:
+            raise ValueError('at most %d digits' % (len(self.weights) - self.check_digits + 1))
+        total = sum(map(mul, packed, digits))
+        mask = self._mask
+        remainders = self.remainders
+        check = bytearray()
+        for shift, weights in self._lanes:
+            digit = remainders[(total >> shift & mask) % 11]
+            check.append(digit)
+            total += digit * weights
+        return check
+
+    def _is_valid(self, digits):
+        size = len(digits) - self.check_digits
+        if size < 1 or self.length is not None and len(digits) != self.length:
+            return False
+        try:
+            return self._compute(digits[:size]) == digits[size:]
+        except ValueError:
+            return False
+
+    def __repr__(self):
+        return '<Mod11 %r>' % (self.weights,)
+
+
+def _verhoeff_tables():
+    # multiplication in the dihedral group D5
+    def d5(i, j):
+        if i < 5:
+            return (i + j) % 5 + (j >= 5) * 5
+        return (i - j) % 5 + (j < 5) * 5
+
+    # the permutation applied to the digit at position i from the right
+    permutations = [tuple(range(10))]
+    for _ in range(7):
+        permutations.append(tuple((1, 5, 7, 6, 2, 8, 3, 0, 9, 4)[d] for d in permutations[-1]))
+    # table[position % 8 * 100 + check * 10 + digit] -> next check
+    table = bytearray(d5(check, permutation[digit])
+                      for permutation in permutations
+                      for check in range(10) for digit in range(10))
+    inverse = bytearray((0, 4, 3, 2, 1, 5, 6, 7, 8, 9))
+    return bytes(table), inverse
+
+
+class Verhoeff(CheckDigitAlgorithm):
+    """
+    The Verhoeff algorithm, detecting every single digit error and every
+    transposition of adjacent digits.
+    """
+    _table, _inverse = _verhoeff_tables()
+
+    def _run(self, digits, offset):
+        table = self._table
+        check = 0
+        position = offset
+        for digit in reversed(digits):
+            check = table[(position & 7) * 100 + check * 10 + digit]
+            position += 1
+        return check
+
+    def _compute(self, digits):
+        return bytearray((self._inverse[self._run(digits, 1)],))
+
+    def _is_valid(self, digits):
+        return self._run(digits, 0) == 0
+
+
+# Damm's totally anti-symmetric quasigroup of order 10, table[interim * 10 + digit]
+_DAMM = bytes(bytearray((
+    0, 3, 1, 7, 5, 9, 8, 6, 4, 2,
+    7, 0, 9, 2, 1, 5, 4, 8, 6, 3,
+    4, 2, 0, 6, 8, 7, 1, 3, 5, 9,
+    1, 7, 5, 0, 9, 8, 3, 4, 2, 6,
+    6, 1, 2, 3, 0, 4, 5, 9, 7, 8,
+    3, 6, 7, 4, 2, 0, 9, 5, 8, 1,
+    5, 8, 6, 9, 7, 2, 0, 1, 3, 4,
+    8, 9, 4, 5, 3, 6, 2, 0, 1, 7,
+    9, 4, 3, 8, 6, 1, 7, 2, 0, 5,
+    2, 5, 8, 1, 4, 3, 6, 7, 9, 0,
+)))
+
+
+class Damm(CheckDigitAlgorithm):
+    """
+    The Damm algorithm, detecting every single digit error and every
+    transposition of adjacent digits.
+    """
+
+    def _run(self, digits):
+        interim = 0
+        for digit in digits:
+            interim = _DAMM[interim * 10 + digit]
+        return interim
+
+    def _compute(self, digits):
+        return bytearray((self._run(digits),))
+
+    def _is_valid(self, digits):
+        return self._run(digits) == 0
+
+
+# bytes.translate table of the digit values back to ASCII
+_VALUE_DIGITS = bytearray(range(256))
+_VALUE_DIGITS[:10] = b'0123456789'
+_VALUE_DIGITS = bytes(_VALUE_DIGITS)
+
+
+class Mod97_10(CheckDigitAlgorithm):
+    """
+    ISO 7064 MOD 97-10, the two check digits of IBANs: the value is a
+    multiple of 97 plus 1.
+    """
+    check_digits = 2
+
+    def _run(self, digits):
+        raw = bytes(digits).translate(_VALUE_DIGITS)
+        if len(raw) <= 18:
+            return int(raw) % 97
+        # int() of 18 digits chunks, linear in the length of the value
+        remainder = 0
+        for start in range(0, len(raw), 18):
+            chunk = raw[start:start + 18]
+            remainder = (remainder * 10 ** len(chunk) + int(chunk)) % 97
+        return remainder
+
+    def _compute(self, digits):
+        check = 98 - self._run(digits) * 100 % 97
+        return bytearray(divmod(check, 10))
+
+    def is_valid(self, value):
+        # int() of the string itself, which also accepts signs, underscores
+        # and surrounding whitespace, hence isdigit() once it matches
+        if type(value) is six.text_type:
+            try:
+                return int(value) % 97 == 1 and value.isdigit() and len(value) > 2
+            except ValueError:
+                if len(value) <= 4000:  # int() of more digits raises on recent Pythons
+                    return False
+        return super(Mod97_10, self).is_valid(value)
+
+    def _is_valid(self, digits):
+        return len(digits) > 2 and self._run(digits) == 1
+
+
+LUHN = Luhn()
+VERHOEFF = Verhoeff()
+DAMM = Damm()
+MOD97_10 = Mod97_10()
+#: The two verifier digits of the brazilian CPF and CNPJ numbers.
+CPF = Mod11(CPF_WEIGHTS, check_digits=2, length=len(CPF_WEIGHTS) + 1)
+CNPJ = Mod11(CNPJ_WEIGHTS, check_digits=2, length=len(CNPJ_WEIGHTS) + 1)
+
+#: Check digit algorithms by name.
+ALGORITHMS = {
+    'luhn': LUHN,
+    'verhoeff': VERHOEFF,
+    'damm': DAMM,
+    'mod97_10': MOD97_10,
+    'cpf': CPF,
+    'cnpj': CNPJ,
+}
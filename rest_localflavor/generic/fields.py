@@ -0,0 +1,59 @@
+"""
+Helpers shared by the serializer fields of every country.
+"""
+from django.utils import six
+from django.utils.functional import Promise
+
+__all__ = ['invalid_messages', 'BlankInvalidMixin', 'ShallowCopyMixin']
+
+_IMMUTABLE_TYPES = six.string_types + six.integer_types + (bool, float, type(None), Promise)
+
+
+def invalid_messages(message):
+    """
+    Returns a ``default_error_messages`` map reporting blank and null
+    inputs with the same ``message`` as invalid ones.
+    """
+    return {
+        'invalid': message,
+        'blank': message,
+        'null': message,
+    }
+
+
+class BlankInvalidMixin(object):
+    """
+    Keeps the blank and null messages equal to the invalid one when a
+    custom ``error_messages['invalid']`` is given. Without custom messages
+    the class level map from ``invalid_messages`` is used as is.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super(BlankInvalidMixin, self).__init__(*args, **kwargs)
+        if 'invalid' in (kwargs.get('error_messages') or ()):
+            messages = self.error_messages
+            messages['blank'] = messages['null'] = messages['invalid']
+
+
+class ShallowCopyMixin(object):
+    """
+    DRF deep copies every declared field for each serializer instance, by
+    calling ``__init__`` again with deep copies of its arguments. Unbound
+    fields built from keyword arguments of immutable types are cloned
+    instead, with their own copies of the containers DRF lets serializers
+    change, e.g. ``error_messages`` in ``Serializer.__init__``.
+    """
+
+    def __deepcopy__(self, memo):
+        if self._args or self.parent is not None or not all(
+                isinstance(value, _IMMUTABLE_TYPES) for value in self._kwargs.values()):
+            return super(ShallowCopyMixin, self).__deepcopy__(memo)
+        clone = object.__new__(self.__class__)
+        state = clone.__dict__
+        state.update(self.__dict__)
+        for name in ('style', 'error_messages', '_kwargs'):
+            state[name] = dict(state[name])
+        for name in ('validators', '_validators'):
+            if name in state:
+                state[name] = list(state[name])
+        return clone
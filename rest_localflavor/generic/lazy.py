@@ -0,0 +1,59 @@
+"""
+Module level attributes and regular expressions computed on first access,
+to keep importing the field modules cheap.
+"""
+import re
+import sys
+
+__all__ = ['lazy_attributes', 'LazyPattern']
+
+
+def lazy_attributes(namespace, factories):
+    """
+    Returns a PEP 562 module ``__getattr__`` computing the attributes named in
+    ``factories`` (a map of name to callable) on first access and storing
+    them in ``namespace``, the ``globals()`` of the module::
+
+        __getattr__ = lazy_attributes(globals(), {'STATE_CHOICES': _state_choices})
+
+    Python versions before 3.7 ignore module ``__getattr__``, there the
+    attributes are computed right away.
+    """
+    module = namespace['__name__']
+
+    def __getattr__(name):
+        try:
+            factory = factories[name]
+        except KeyError:
+            raise AttributeError('module %r has no attribute %r' % (module, name))
+        value = namespace[name] = factory()
+        return value
+
+    if sys.version_info < (3, 7):
+        for name in factories:
+            __getattr__(name)
+    return __getattr__
+
+
+class LazyPattern(object):
+    """
+    A regular expression compiled on first use. The attributes of the
+    compiled pattern are copied on the instance as they are accessed, so
+    later calls to e.g. ``match`` cost a plain attribute lookup.
+    """
+
+    def __init__(self, pattern, flags=0):
+        self._args = (pattern, flags)
+
+    def __getattr__(self, name):
+        if name.startswith('__'):
+            raise AttributeError(name)
+        compiled = self.__dict__.get('_compiled')
+        if compiled is None:
+            compiled = self._compiled = re.compile(*self._args)
+        value = getattr(compiled, name)
+        setattr(self, name, value)
+        return value
+
+    def __repr__(self):
+        return 'LazyPattern(%r)' % (self._args[0],)
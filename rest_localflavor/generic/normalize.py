@@ -0,0 +1,91 @@
+"""
+Normalization indexes for names and abbreviations of states, provinces
+and the like, ignoring case and surrounding whitespace, and optionally
+accents.
+"""
+import unicodedata
+from importlib import import_module
+
+from django.utils import six
+
+try:
+    from types import MappingProxyType
+except ImportError:  # Python 2
+    MappingProxyType = dict
+
+__all__ = ['fold', 'build_index', 'lookup', 'LazyIndex']
+
+#: Longer inputs are not folded by lookup(), no index key comes close.
+MAX_FOLD_LENGTH = 100
+
+
+def fold(value):
+    """
+    Returns ``value`` stripped, lower cased and without accents, e.g.
+    ``' Goiás'`` folds to ``'goias'``. Punctuation and inner spacing are
+    kept: ``'B.C.'`` folds to ``'b.c.'``.
+    """
+    value = six.text_type(value).strip().lower()
+    try:
+        value.encode('ascii')
+    except UnicodeEncodeError:
+        value = ''.join(c for c in unicodedata.normalize('NFD', value)
+                        if not unicodedata.combining(c))
+    return value
+
+
+def build_index(*mappings, **kwargs):
+    """
+    Builds a read only mapping from each key of ``mappings`` to its
+    normalized value. With ``folded=True`` the folded keys are added, for
+    ``lookup(index, value, folded=True)``. Raises ``ValueError`` if two keys
+    fold to the same string with different values.
+    """
+    folded = kwargs.pop('folded', False)
+    index = {}
+    for mapping in mappings:
+        for key, value in mapping.items():
+            for variant in ((key, fold(key)) if folded else (key,)):
+                if index.setdefault(variant, value) != value:
+                    raise ValueError("%r is ambiguous: %r or %r" % (
+                        variant, index[variant], value))
+    return MappingProxyType(index)
+
+
+def lookup(index, value, folded=False):
+    """
+    Returns the normalized value of ``value``, stripped and lower cased, in
+    ``index``, or ``None``. With ``folded``, the folded value is tried on a
+    miss, so that accents do not matter either.
+    """
+    try:
+        value = value.strip().lower()
+    except AttributeError:
+        return None
+    try:
+        return index[value]
+    except KeyError:
+        if not folded or len(value) > MAX_FOLD_LENGTH:
+            return None
+        return index.get(fold(value))
+
+
+class LazyIndex(object):
+    """
+    Class attribute loading ``module.name`` on first access, then replacing
+    itself with it on the owner class, so the data is imported only when
+    needed and resolved once per class.
+    """
+
+    def __init__(self, module, name):
+        self.module = module
+        self.name = name
+
+    def __get__(self, instance, owner):
+        value = getattr(import_module(self.module), self.name)
+        for klass in owner.__mro__:
+            for attname, attr in list(vars(klass).items()):
+                if attr is self:
+                    setattr(klass, attname, value)
+                    return value
+        return value
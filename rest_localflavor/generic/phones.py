@@ -0,0 +1,111 @@
+"""
+Phone number normalization shared by the phone fields of every country.
+
+Parentheses and whitespace are dropped with one ``translate`` pass and
+another one maps every digit to ``9``, giving the shape of the number, e.g.
+``99-9999-9999``. The shapes a country accepts, its digit groups with one
+optional separator between them, are precomputed along with the slices of
+the groups, so a dict lookup classifies the number and the output is joined
+from its slices. Only non ASCII inputs, e.g. with arabic-indic digits, take
+a slower path.
+"""
+from __future__ import unicode_literals
+
+import itertools
+
+__all__ = ['PhoneRule', 'PHONE_RULES', 'NANP', 'normalize_phone']
+
+# The whitespace of the former r'\s+' pattern, i.e. str.isspace()
+WHITESPACE = ('\t\n\x0b\x0c\r\x1c\x1d\x1e\x1f \x85\xa0\u1680\u2000\u2001\u2002\u2003'
+              '\u2004\u2005\u2006\u2007\u2008\u2009\u200a\u2028\u2029\u202f\u205f\u3000')
+
+_STRIP = dict((ord(c), None) for c in '()' + WHITESPACE)
+_ASCII_STRIP = ('()' + WHITESPACE[:10]).encode('ascii')
+
+# bytes.translate table of the shapes, digits to 9
+_SHAPE = bytearray(range(256))
+for _digit in bytearray(b'0123456789'):
+    _SHAPE[_digit] = ord('9')
+_SHAPE = bytes(_SHAPE)
+del _digit
+
+
+class PhoneRule(object):
+    """
+    The phone numbers of a country: ``formats`` are the sizes of the digit
+    groups of its numbers, one of ``separators`` may stand between groups.
+    A leading ``prefix`` (e.g. a country code) may be followed by one of
+    ``prefix_separators``, it is dropped from the output. Groups are joined
+    with ``joiner``.
+    """
+
+    def __init__(self, formats, separators='-.', prefix='', prefix_separators='', joiner='-'):
+        self.formats = tuple(tuple(groups) for groups in formats)
+        self.separators = separators
+        self.prefix = prefix
+        self.prefix_separators = prefix_separators
+        self.joiner = joiner
+        self._shapes = self._build_shapes()
+
+    def _build_shapes(self):
+        # shape -> (prefix to check, slices of the groups)
+        shapes = {}
+        prefixes = [('', '')]
+        if self.prefix:
+            prefixes.extend((self.prefix, separator)
+                            for separator in ('',) + tuple(self.prefix_separators))
+        for groups in self.formats:
+            for separators in itertools.product(('',) + tuple(self.separators),
+                                                repeat=len(groups) - 1):
+                for prefix, prefix_separator in prefixes:
+                    shape = '9' * len(prefix) + prefix_separator
+                    slices = []
+                    for separator, size in zip(('',) + separators, groups):
+                        shape += separator
+                        slices.append((len(shape), len(shape) + size))
+                        shape += '9' * size
+                    key = shape.encode('ascii')
+                    if key in shapes:
+                        raise ValueError("%r is ambiguous" % shape)
+                    shapes[key] = (prefix, tuple(slices))
+        return shapes
+
+    def normalize(self, value):
+        """
+        Returns ``value``, a text string, formatted, or ``None`` when it is
+        not a phone number of the country.
+        """
+        try:
+            stripped = value.encode('ascii').translate(None, _ASCII_STRIP)
+        except UnicodeEncodeError:
+            value = value.translate(_STRIP)
+            shape = ''.join('9' if c.isdecimal() else c for c in value)
+            shape = shape.encode('ascii', 'replace')
+        else:
+            shape = stripped.translate(_SHAPE)
+            value = stripped.decode('ascii')
+        try:
+            prefix, slices = self._shapes[shape]
+        except KeyError:
+            return None
+        if prefix and not value.startswith(prefix):
+            return None
+        return self.joiner.join([value[start:end] for start, end in slices])
+
+
+#: North American Numbering Plan, with an optional "1" or "1-" prefix.
+NANP = PhoneRule([(3, 3, 4)], prefix='1', prefix_separators='-')
+
+#: Phone number rules by country code.
+PHONE_RULES = {
+    'BR': PhoneRule([(2, 4, 4), (2, 5, 4)]),
+    'CA': NANP,
+    'US': NANP,
+}
+
+
+def normalize_phone(country, value):
+    """
+    Returns ``value`` formatted with the rules of ``country``, or ``None``.
+    """
+    return PHONE_RULES[country].normalize(value)
@@ -0,0 +1,84 @@
+"""
+Registries of the states, provinces and territories of a country, the
+source every ``*_CHOICES`` tuple is derived from.
+"""
+from .normalize import fold
+
+__all__ = ['STATE', 'TERRITORY', 'ARMED_FORCES', 'FREELY_ASSOCIATED',
+           'OBSOLETE', 'CONTIGUOUS', 'Region', 'RegionRegistry']
+
+#: Category flags of a region, combined with ``|``.
+STATE = 1  # or province
+TERRITORY = 2
+ARMED_FORCES = 4
+FREELY_ASSOCIATED = 8
+OBSOLETE = 16
+CONTIGUOUS = 32
+
+
+class Region(object):
+    """
+    A state, province or territory: its code, (lazily translated) name,
+    country code and category flags.
+    """
+    __slots__ = ('code', 'name', 'country', 'flags')
+
+    def __init__(self, code, name, country, flags=STATE):
+        self.code = code
+        self.name = name
+        self.country = country
+        self.flags = flags
+
+    @property
+    def choice(self):
+        return self.code, self.name
+
+    def __repr__(self):
+        return '<Region %s-%s>' % (self.country, self.code)
+
+
+class RegionRegistry(object):
+    """
+    The regions of ``country``, in the order given, with indexes by code and
+    by folded name (see ``rest_localflavor.generic.normalize.fold``).
+    """
+    __slots__ = ('country', 'regions', 'by_code', '_by_name')
+
+    def __init__(self, country, regions):
+        self.country = country
+        self.regions = tuple(Region(code, name, country, flags)
+                             for code, name, flags in regions)
+        self.by_code = dict((region.code, region) for region in self.regions)
+        self._by_name = None
+
+    def __iter__(self):
+        return iter(self.regions)
+
+    def __len__(self):
+        return len(self.regions)
+
+    @property
+    def by_name(self):
+        # names are translation proxies, folded on first use only
+        if self._by_name is None:
+            self._by_name = dict((fold(region.name), region) for region in self.regions)
+        return self._by_name
+
+    def get(self, code, default=None):
+        return self.by_code.get(code, default)
+
+    def get_by_name(self, name, default=None):
+        return self.by_name.get(fold(name), default)
+
+    def choices(self, include=None, exclude=0, sort=False):
+        """
+        Returns a ``(code, name)`` tuple of the regions having any of the
+        ``include`` flags (all by default) and none of the ``exclude`` ones,
+        in registry order or, with ``sort``, by name.
+        """
+        regions = [region for region in self.regions
+                   if (include is None or region.flags & include) and
+                   not region.flags & exclude]
+        if sort:
+            regions.sort(key=lambda region: region.name)
+        return tuple(region.choice for region in regions)
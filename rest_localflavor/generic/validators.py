@@ -0,0 +1,49 @@
+"""
+Serializer level validators shared by the countries.
+"""
+from django.utils import six
+from django.utils.translation import ugettext_lazy as _
+
+from rest_framework.exceptions import ValidationError
+
+__all__ = ['PostalCodeRegionValidator']
+
+
+class PostalCodeRegionValidator(object):
+    """
+    Checks that the postal code in ``postal_code_field`` belongs to the
+    region in ``region_field`` of the same payload, with local tables only.
+    Add it to the ``validators`` of a serializer's ``Meta``. Payloads
+    missing one of the fields, or with blank ones, are left to the fields.
+
+    Subclasses implement ``regions(postal_code)``, returning the codes of
+    the regions a postal code may belong to, empty when it is unknown, and
+    may override ``normalize_region(region)`` to map the region input to
+    its code, ``None`` when it is unknown.
+    """
+    message = _('{postal_code} is not a postal code of {region}.')
+
+    def __init__(self, postal_code_field, region_field, message=None):
+        self.postal_code_field = postal_code_field
+        self.region_field = region_field
+        self.message = message or self.message
+
+    def regions(self, postal_code):
+        raise NotImplementedError('subclasses must implement regions()')
+
+    def normalize_region(self, region):
+        return region
+
+    def __call__(self, attrs):
+        postal_code = attrs.get(self.postal_code_field)
+        region = attrs.get(self.region_field)
+        if not postal_code or not region:
+            return
+        code = self.normalize_region(region)
+        if code is None or code not in self.regions(postal_code):
+            message = six.text_type(self.message).format(postal_code=postal_code, region=region)
+            raise ValidationError({self.postal_code_field: [message]})
+
+    def __repr__(self):
+        return '<%s(postal_code_field=%r, region_field=%r)>' % (
+            self.__class__.__name__, self.postal_code_field, self.region_field)
@@ -0,0 +1,222 @@
+"""
+NumPy vectorized Luhn, CPF and CNPJ validation for columnar data.
+
+Every function takes a sequence or array of strings (or a 2D integer array
+holding one digit per column) and returns a ``(mask, reasons)`` pair of
+arrays: ``mask`` is ``True`` for valid rows, ``reasons`` holds one of the
+reason codes below. Rows made only of ASCII digits and the punctuation the
+fields strip are computed as array operations; any other row (non-ASCII
+digits, non-strings, blanks...) goes through the scalar code, so results
+are always the same as ``luhn()``, ``BRCPFField`` and ``BRCNPJField``.
+
+NumPy is optional and only needed when these functions are called. Note
+that NumPy string arrays drop trailing NUL characters.
+"""
+from django.utils import six
+
+from .checksums import CNPJ, CPF, LUHN_ODD_LOOKUP, decode, luhn
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+__all__ = ['VALID', 'INVALID', 'DIGITS_ONLY', 'MAX_DIGITS', 'REASONS',
+           'luhn_many', 'cpf_many', 'cnpj_many']
+
+#: Reason codes. ``REASONS[code]`` is the matching field error key.
+VALID = 0
+INVALID = 1
+DIGITS_ONLY = 2
+MAX_DIGITS = 3
+REASONS = (None, 'invalid', 'digits_only', 'max_digits')
+
+_ZERO = ord('0')
+_NINE = ord('9')
+
+
+def _require_numpy():
+    if np is None:
+        raise ImportError("NumPy is required for vectorized validation, "
+                          "run: pip install numpy")
+
+
+def _as_codepoints(values):
+    """
+    Returns ``(codes, lengths, scalar)``: a 2D uint32 array of code points,
+    the length of every row and a mask of rows that are not strings. Rows
+    of arrays of anything but strings (numbers, bytes...) are all scalar.
+    """
+    array = np.asarray(values)
+    if array.dtype.kind == 'O':
+        scalar = np.fromiter((not isinstance(v, six.text_type) for v in array.flat),
+                             dtype=bool, count=array.size)
+        array = np.array([v if not s else '' for v, s in zip(array.flat, scalar)],
+                         dtype=six.text_type)
+    elif array.dtype.kind != 'U':
+        scalar = np.ones(array.shape[0], dtype=bool)
+        array = np.zeros(array.shape[0], dtype='U1')
+    else:
+        scalar = np.zeros(array.shape[0], dtype=bool)
+    width = max(array.dtype.itemsize // 4, 1)
+    array = np.ascontiguousarray(array, dtype='U%d' % width)
+    codes = array.view(np.uint32).reshape(array.shape[0], width)
+    lengths = np.char.str_len(array)
+    return codes, lengths, scalar
+
+
+def _digit_matrix(values):
+    """
+    Recognizes the 2D integer input form, one digit per column.
+    """
+    array = np.asarray(values)
+    if array.ndim == 2 and array.dtype.kind in 'iu':
+        return array
+    return None
+
+
+def _scalar_fallback(values, rows, validate):
+    """
+    Runs ``validate`` on the original values of ``rows`` and returns the
+    matching reason codes.
+    """
+    source = np.asarray(values, dtype=object)
+    return np.array([validate(source[i]) for i in rows], dtype=np.uint8)
+
+
+def _luhn_reason(value):
+    if luhn(value):
+        return VALID
+    if not isinstance(value, six.string_types):
+        value = str(value)
+    try:
+        decode(value)
+    except ValueError:
+        return DIGITS_ONLY
+    return INVALID
+
+
+def luhn_many(values):
+    """
+    Vectorized ``luhn()``. Integer arrays are validated on their decimal
+    representation, as ``luhn()`` does; other non-string values run
+    through ``luhn()`` itself.
+    """
+    _require_numpy()
+    matrix = _digit_matrix(values)
+    if matrix is not None:
+        bad = (matrix < 0) | (matrix > 9)
+        digits = np.where(bad, 0, matrix)[:, ::-1]
+        lookup = np.array(LUHN_ODD_LOOKUP, dtype=np.int64)
+        total = digits[:, ::2].sum(axis=1) + lookup[digits[:, 1::2]].sum(axis=1)
+        reasons = np.where(total % 10 == 0, VALID, INVALID).astype(np.uint8)
+        reasons[bad.any(axis=1)] = DIGITS_ONLY
+        return reasons == VALID, reasons
+
+    array = np.asarray(values)
+    if array.dtype.kind in 'iu':
+        values = array = array.astype(six.text_type)
+    codes, lengths, scalar = _as_codepoints(values)
+    width = codes.shape[1]
+    position = lengths[:, None] - 1 - np.arange(width)  # index from the right
+    used = position >= 0
+    digit = (codes >= _ZERO) & (codes <= _NINE)
+    scalar |= (used & (codes > 127)).any(axis=1)
+    non_digit = (used & ~digit).any(axis=1)
+
+    digits = np.where(used & digit, codes - _ZERO, 0).astype(np.int64)
+    lookup = np.array(LUHN_ODD_LOOKUP, dtype=np.int64)
+    total = np.where(position % 2 == 0, digits, lookup[digits]).sum(axis=1)
+    reasons = np.where(total % 10 == 0, VALID, INVALID).astype(np.uint8)
+    reasons[non_digit] = DIGITS_ONLY
+
+    rows = np.flatnonzero(scalar)
+    if rows.size:
+        reasons[rows] = _scalar_fallback(values, rows, _luhn_reason)
+    return reasons == VALID, reasons
+
+
+def _mod11_many(values, algorithm, punctuation, field_class):
+    """
+    Vectorized ``algorithm``, a two check digits ``checksums.Mod11`` of a
+    fixed length, behind ``field_class``.
+    """
+    _require_numpy()
+    weights = algorithm.weights
+    size = algorithm.length
+    first_weights = np.array(weights[1:], dtype=np.int64)
+    second_weights = np.array(weights[:-1], dtype=np.int64)
+    dv_maker = np.array(algorithm.remainders, dtype=np.int64)
+
+    matrix = _digit_matrix(values)
+    if matrix is not None:
+        count = matrix.shape[0]
+        if matrix.shape[1] != size:
+            reasons = np.full(count, MAX_DIGITS, dtype=np.uint8)
+            return reasons == VALID, reasons
+        bad = ((matrix < 0) | (matrix > 9)).any(axis=1)
+        digits = np.where(bad[:, None], 0, matrix).astype(np.int64)
+        scalar = np.zeros(count, dtype=bool)
+        reasons = np.full(count, INVALID, dtype=np.uint8)
+        reasons[bad] = DIGITS_ONLY
+        count_ok = ~bad
+    else:
+        codes, lengths, scalar = _as_codepoints(values)
+        width = codes.shape[1]
+        used = np.arange(width) < lengths[:, None]
+        digit = used & (codes >= _ZERO) & (codes <= _NINE)
+        punct = np.zeros_like(digit)
+        for char in punctuation:
+            punct |= codes == ord(char)
+        # blanks and anything besides digits and punctuation run scalar
+        scalar |= (lengths == 0) | (used & ~digit & ~punct).any(axis=1)
+        ndigits = digit.sum(axis=1)
+
+        reasons = np.full(codes.shape[0], INVALID, dtype=np.uint8)
+        reasons[ndigits != size] = MAX_DIGITS
+        reasons[ndigits == 0] = DIGITS_ONLY  # only punctuation: int('') fails
+        # rejected before any parsing, see max_input_length
+        oversized = lengths > field_class.max_input_length
+        reasons[oversized] = MAX_DIGITS
+        scalar &= ~oversized
+        count_ok = (ndigits == size) & ~oversized
+
+        if width < size:
+            codes = np.pad(codes, ((0, 0), (0, size - width)), 'constant')
+            digit = np.pad(digit, ((0, 0), (0, size - width)), 'constant')
+        digits = codes[:, :size].astype(np.int64) - _ZERO
+        punctuated = np.flatnonzero(punct.any(axis=1) & count_ok)
+        if punctuated.size:
+            # move the digits to the front of the row, keeping their order
+            order = np.argsort(~digit[punctuated], axis=1, kind='stable')[:, :size]
+            digits[punctuated] = np.take_along_axis(
+                codes[punctuated], order, axis=1).astype(np.int64) - _ZERO
+        digits[~count_ok] = 0
+
+    body = digits[:, :size - 2]
+    first = dv_maker[body.dot(first_weights) % 11]
+    second = dv_maker[(body.dot(second_weights) + first * weights[-1]) % 11]
+    ok = count_ok & (digits[:, -2] == first) & (digits[:, -1] == second)
+    reasons[ok] = VALID
+
+    rows = np.flatnonzero(scalar)
+    if rows.size:
+        result = field_class().validate_many(np.asarray(values, dtype=object)[rows].tolist())
+        reasons[rows] = [REASONS.index(error) for error in result.errors]
+    return reasons == VALID, reasons
+
+
+def cpf_many(values):
+    """
+    Vectorized ``BRCPFField`` validation, punctuation included.
+    """
+    from ..br.serializers import BRCPFField
+    return _mod11_many(values, CPF, '-.', BRCPFField)
+
+
+def cnpj_many(values):
+    """
+    Vectorized ``BRCNPJField`` validation, punctuation included.
+    """
+    from ..br.serializers import BRCNPJField
+    return _mod11_many(values, CNPJ, '-/.', BRCNPJField)
@@ -0,0 +1,192 @@
+"""
+Optional timing of every localflavor field ``run_validation`` call.
+
+Set a callback, or its dotted path, in the Django settings::
+
+    REST_LOCALFLAVOR_INSTRUMENTATION = 'rest_localflavor.instrumentation.aggregator'
+
+or call ``enable(callback)``. The callback receives the field class name,
+the outcome (``None`` when the value is valid, the error code otherwise)
+and the elapsed time in nanoseconds. Instrumentation wraps the
+``run_validation`` methods of the field classes only while it is enabled,
+so it costs nothing when it is off.
+
+``aggregator`` is a ready made callback keeping counts per outcome and a
+latency histogram per field, see ``Aggregator.snapshot()`` and
+``Aggregator.prometheus()``.
+"""
+import bisect
+import threading
+import time
+from functools import wraps
+
+from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.utils import six
+
+from rest_framework.exceptions import ValidationError
+from rest_framework.fields import empty
+
+from .batch import BatchFailure, _error_code, field_classes
+
+__all__ = ['Aggregator', 'aggregator', 'enable', 'disable', 'configure', 'BUCKETS']
+
+try:
+    _clock_ns = time.perf_counter_ns
+except AttributeError:  # Python < 3.7
+    _clock = getattr(time, 'perf_counter', time.time)
+
+    def _clock_ns():
+        return int(_clock() * 1e9)
+
+#: Upper bounds, in nanoseconds, of the latency histogram buckets.
+BUCKETS = (250, 500, 1000, 2500, 5000, 10000, 25000, 50000, 100000, 250000, 1000000)
+
+# field class -> its own run_validation, or None when inherited, while enabled
+_originals = {}
+_lock = threading.Lock()
+
+
+class Aggregator(object):
+    """
+    Thread safe instrumentation callback counting validations per field
+    and outcome, with a latency histogram per field.
+    """
+
+    def __init__(self, buckets=BUCKETS):
+        self.buckets = tuple(buckets)
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self._counts = {}
+            self._histograms = {}
+            self._sums = {}
+
+    def __call__(self, field, outcome, elapsed_ns):
+        bucket = bisect.bisect_left(self.buckets, elapsed_ns)
+        with self._lock:
+            key = (field, outcome)
+            self._counts[key] = self._counts.get(key, 0) + 1
+            histogram = self._histograms.get(field)
+            if histogram is None:
+                histogram = self._histograms[field] = [0] * (len(self.buckets) + 1)
+            histogram[bucket] += 1
+            self._sums[field] = self._sums.get(field, 0) + elapsed_ns
+
+    def snapshot(self):
+        """
+        Returns ``{field: {'outcomes': {outcome: count}, 'buckets': [...],
+        'count': n, 'sum_ns': total}}``, ``buckets`` holding the count of
+        calls per bucket of ``BUCKETS`` plus one for slower calls.
+        """
+        with self._lock:
+            result = {}
+            for (field, outcome), count in self._counts.items():
+                result.setdefault(field, {'outcomes': {}})['outcomes'][outcome or 'valid'] = count
+            for field, histogram in self._histograms.items():
+                result[field].update({
+                    'buckets': list(histogram),
+                    'count': sum(histogram),
+                    'sum_ns': self._sums[field],
+                })
+        return result
+
+    def prometheus(self, prefix='localflavor'):
+        """
+        Returns the counters and histograms in the Prometheus text format.
+        """
+        lines = [
+            '# TYPE %s_validations_total counter' % prefix,
+        ]
+        snapshot = self.snapshot()
+        for field in sorted(snapshot):
+            for outcome, count in sorted(snapshot[field]['outcomes'].items()):
+                lines.append('%s_validations_total{field="%s",outcome="%s"} %d' % (
+                    prefix, field, outcome, count))
+        lines.append('# TYPE %s_validation_seconds histogram' % prefix)
+        for field in sorted(snapshot):
+            stats = snapshot[field]
+            cumulative = 0
+            bounds = ['%g' % (bound / 1e9) for bound in self.buckets] + ['+Inf']
+            for bound, count in zip(bounds, stats['buckets']):
+                cumulative += count
+                lines.append('%s_validation_seconds_bucket{field="%s",le="%s"} %d' % (
+                    prefix, field, bound, cumulative))
+            lines.append('%s_validation_seconds_sum{field="%s"} %g' % (
+                prefix, field, stats['sum_ns'] / 1e9))
+            lines.append('%s_validation_seconds_count{field="%s"} %d' % (
+                prefix, field, stats['count']))
+        return '\n'.join(lines) + '\n'
+
+
+#: Default aggregator, to use as callback.
+aggregator = Aggregator()
+
+
+def _instrument(name, run_validation, callback):
+    @wraps(run_validation)
+    def wrapper(self, data=empty):
+        start = _clock_ns()
+        try:
+            value = run_validation(self, data)
+        except BatchFailure as exc:
+            callback(name, exc.code, _clock_ns() - start)
+            raise
+        except ValidationError as exc:
+            callback(name, _error_code(exc), _clock_ns() - start)
+            raise
+        callback(name, None, _clock_ns() - start)
+        return value
+    wrapper.instrumented = run_validation
+    return wrapper
+
+
+def enable(callback):
+    """
+    Calls ``callback(field_name, outcome, elapsed_ns)`` after every
+    ``run_validation`` of the localflavor fields, replacing the previous
+    callback if any.
+    """
+    with _lock:
+        _disable()
+        for name, cls in field_classes().items():
+            _originals[cls] = cls.__dict__.get('run_validation')
+            cls.run_validation = _instrument(
+                name, six.get_unbound_function(cls.run_validation), callback)
+
+
+def disable():
+    with _lock:
+        _disable()
+
+
+def _disable():
+    while _originals:
+        cls, run_validation = _originals.popitem()
+        if run_validation is None:
+            del cls.run_validation
+        else:
+            cls.run_validation = run_validation
+
+
+def configure():
+    """
+    Applies the ``REST_LOCALFLAVOR_INSTRUMENTATION`` setting.
+    """
+    callback = getattr(settings, 'REST_LOCALFLAVOR_INSTRUMENTATION', None)
+    if isinstance(callback, six.string_types):
+        from django.utils.module_loading import import_string
+        callback = import_string(callback)
+    if callback is None:
+        disable()
+    else:
+        enable(callback)
+
+
+@receiver(setting_changed)
+def _reconfigure(setting, **kwargs):
+    if setting == 'REST_LOCALFLAVOR_INSTRUMENTATION':
+        configure()
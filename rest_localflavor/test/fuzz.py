@@ -0,0 +1,548 @@
+# -*- coding: utf-8 -*-
+"""
+Differential fuzzing of the localflavor fields against frozen reference
+implementations, written for clarity rather than speed: the original regex
+and ``int()`` based code, the check digit loops, the Luhn generator
+expressions and plain dict lookups of the state names.
+
+Inputs are random and adversarial: valid documents generated from their
+check digit rules, near misses one edit away from them, unicode digits,
+control characters, whitespace and huge strings. Every input goes through
+``field.check()`` and the reference, and both the normalized value and the
+error code must match. Runs offline, within a time budget::
+
+    python -m rest_localflavor.test.fuzz --budget 60 BRCPFField CASocialInsuranceNumberField
+
+and reports the throughput of both implementations.
+"""
+from __future__ import print_function, unicode_literals
+
+import argparse
+import random
+import re
+import sys
+import time
+import unicodedata
+
+from django.core.validators import EMPTY_VALUES
+from django.utils import six
+
+from rest_framework import serializers
+from rest_framework.exceptions import ValidationError
+
+from . import generators
+
+__all__ = ['FuzzCase', 'FuzzReport', 'CASES', 'fuzz', 'main']
+
+#: Longer inputs are rejected before any parsing, see ``max_input_length``.
+MAX_NAME_LENGTH = 100
+MAX_NUMBER_LENGTH = 64
+
+UNICODE_DIGITS = (
+    '\u0660\u0661\u0662\u0663\u0664\u0665\u0666\u0667\u0668\u0669',  # arabic-indic
+    '\u0966\u0967\u0968\u0969\u096a\u096b\u096c\u096d\u096e\u096f',  # devanagari
+    '\uff10\uff11\uff12\uff13\uff14\uff15\uff16\uff17\uff18\uff19',  # fullwidth
+)
+
+ALPHABET = ('0123456789' * 3 + '-./() \t\n' + 'aAbBzZkK\xe9\xc9\xe7\xdf' +
+            '\x00\x85\xa0\u2003\u3000' + '\xb2\xb3\xb9' + ''.join(UNICODE_DIGITS))
+
+
+def _error_code(exc):
+    codes = exc.get_codes()
+    while isinstance(codes, (list, dict)):
+        codes = (list(codes.values()) if isinstance(codes, dict) else codes)[0]
+    return codes
+
+
+def _drf(field, data):
+    # the DRF part of the fields is not under test, it is its own reference
+    try:
+        return field.run_validation(data), None
+    except ValidationError as exc:
+        return None, _error_code(exc)
+
+
+def _dv(remainder):
+    if remainder >= 2:
+        return 11 - remainder
+    return 0
+
+
+def _mod11(digits, weights):
+    return _dv(sum(weight * digit for weight, digit in zip(weights, digits)) % 11)
+
+
+CPF_WEIGHTS = (list(range(10, 1, -1)), list(range(11, 1, -1)))
+CNPJ_WEIGHTS = (list(range(5, 1, -1)) + list(range(9, 1, -1)),
+                list(range(6, 1, -1)) + list(range(9, 1, -1)))
+
+
+def _mod11_clean(value, size, punctuation):
+    if not value.isdigit():
+        value = re.sub(punctuation, '', value)
+    try:
+        int(value)
+    except ValueError:
+        return None, 'digits_only'
+    if len(value) != size:
+        return None, 'max_digits'
+    return value, None
+
+
+def _mod11_valid(value, weights):
+    try:
+        digits = [int(c) for c in value]
+    except ValueError:
+        return False
+    first = _mod11(digits, weights[0])
+    second = _mod11(digits[:-2] + [first], weights[1])
+    # like the str() comparison of the original fields, only ASCII
+    # verifier digits match
+    return value[-2:] == str(first) + str(second)
+
+
+def _mod11_reference(size, punctuation, weights):
+    def reference(value):
+        if value in EMPTY_VALUES or not isinstance(value, six.text_type):
+            return None, 'invalid'
+        if len(value) > MAX_NUMBER_LENGTH:
+            return None, 'max_digits'
+        digits, code = _mod11_clean(value, size, punctuation)
+        if code is not None:
+            return None, code
+        if not _mod11_valid(digits, weights):
+            return None, 'invalid'
+        return value, None
+    return reference
+
+
+def _luhn(candidate):
+    evens = sum(int(c) for c in candidate[-1::-2])
+    odds = sum((0, 2, 4, 6, 8, 1, 3, 5, 7, 9)[int(c)] for c in candidate[-2::-2])
+    return (evens + odds) % 10 == 0
+
+
+def _name_lookup(mapping):
+    # the original lookups of the US and CA fields
+    def lookup(value):
+        return mapping.get(value.strip().lower())
+    return lookup
+
+
+def _without_accents(value):
+    return ''.join(c for c in unicodedata.normalize('NFD', value)
+                   if not unicodedata.combining(c))
+
+
+def _accents_lookup(mapping):
+    # names of BRStateField, in any case and with or without accents
+    lowered = dict((key.lower(), value) for key, value in mapping.items())
+    unaccented = dict((_without_accents(key), value) for key, value in lowered.items())
+
+    def lookup(value):
+        value = value.strip().lower()
+        if value in lowered:
+            return lowered[value]
+        return unaccented.get(_without_accents(value))
+    return lookup
+
+
+def _phone(pattern, value):
+    m = re.search(pattern, re.sub(r'(\(|\)|\s+)', '', value))
+    if m:
+        return '%s-%s-%s' % (m.group(1), m.group(2), m.group(3))
+
+
+def br_state_reference():
+    from ..br.br_states import REGIONS
+    mapping = dict((region.code, region.code) for region in REGIONS)
+    mapping.update((region.name, region.code) for region in REGIONS)
+    lookup = _accents_lookup(mapping)
+
+    def reference(value):
+        if value in EMPTY_VALUES or not isinstance(value, six.text_type):
+            return None, 'empty'
+        if len(value) > MAX_NAME_LENGTH:
+            return None, 'invalid_choice'
+        value = lookup(value)
+        return (None, 'invalid_choice') if value is None else (value, None)
+    return reference
+
+
+def br_zipcode_reference():
+    regex = serializers.RegexField(r'^(\d{2}\.\d{3}|\d{5})(-\d{3}|\d{3})$')
+
+    def reference(value):
+        if value in EMPTY_VALUES or not isinstance(value, six.text_type):
+            return None, 'invalid'
+        if len(value) > MAX_NUMBER_LENGTH:
+            return None, 'invalid'
+        return _drf(regex, value)
+    return reference
+
+
+def br_phone_reference():
+    def reference(value):
+        if value in EMPTY_VALUES or not isinstance(value, six.text_type):
+            return None, 'invalid'
+        if len(value) > MAX_NUMBER_LENGTH:
+            return None, 'invalid'
+        value = _phone(r'^(\(\d{2}\)|\d{2})[-\.\s]?(\d{4,5})[-\.\s]?(\d{4})$', value)
+        return (None, 'invalid') if value is None else (value, None)
+    return reference
+
+
+def _char_reference(check, use_cleaned=False, limit=MAX_NUMBER_LENGTH):
+    # CharField based fields, the DRF checks run first
+    char = serializers.CharField()
+
+    def reference(value):
+        if isinstance(value, six.string_types) and len(value) > limit:
+            return None, 'invalid'
+        if isinstance(value, six.integer_types) and abs(value) >= 10 ** limit:
+            return None, 'invalid'
+        cleaned, code = _drf(char, value)
+        if code is not None:
+            return None, code
+        if value in EMPTY_VALUES:
+            return '', None
+        value = check(cleaned if use_cleaned else value)
+        return (None, 'invalid') if value is None else (value, None)
+    return reference
+
+
+def ca_postal_code_reference():
+    def check(data):
+        m = re.match(r'^([ABCEGHJKLMNPRSTVXY]\d[ABCEGHJKLMNPRSTVWXYZ]) *(\d[ABCEGHJKLMNPRSTVWXYZ]\d)$',
+                     data.upper().strip())
+        if m:
+            return '%s %s' % (m.group(1), m.group(2))
+    return _char_reference(check, use_cleaned=True)
+
+
+def nanp_phone_reference():
+    def check(data):
+        return _phone(r'^(?:1-?)?(\d{3})[-\.]?(\d{3})[-\.]?(\d{4})$', six.text_type(data))
+    return _char_reference(check)
+
+
+def ca_province_reference():
+    from ..ca.ca_provinces import PROVINCES_NORMALIZED
+    return _char_reference(_name_lookup(PROVINCES_NORMALIZED), limit=MAX_NAME_LENGTH)
+
+
+def ca_sin_reference():
+    def check(data):
+        m = re.match(r'^(\d{3})-(\d{3})-(\d{3})$', data)
+        if m and _luhn(''.join(m.groups())):
+            return '-'.join(m.groups())
+    return _char_reference(check)
+
+
+def us_state_reference():
+    from ..us.us_states import STATES_NORMALIZED
+    return _char_reference(_name_lookup(STATES_NORMALIZED), limit=MAX_NAME_LENGTH)
+
+
+def us_zip_code_reference():
+    def check(data):
+        data = data.strip()
+        if re.match(r'^[0-9]{5}(?:-[0-9]{4})?$', data):
+            return data
+    return _char_reference(check, use_cleaned=True)
+
+
+# Generators of valid inputs, from the rules of each document.
+
+def _digits(rnd, count):
+    return [rnd.randrange(10) for _ in range(count)]
+
+
+def _join(digits):
+    return ''.join(map(str, digits))
+
+
+def _format(rnd, value, template):
+    # fills the X of template with the chars of value, or returns it bare
+    if rnd.random() < 0.3:
+        return value
+    chars = iter(value)
+    return ''.join(next(chars) if c == 'X' else c for c in template)
+
+
+def valid_cpf(rnd):
+    return generators.cpf(rnd, formatted=rnd.random() >= 0.3)
+
+
+def valid_cnpj(rnd):
+    return generators.cnpj(rnd, formatted=rnd.random() >= 0.3)
+
+
+def valid_sin(rnd):
+    return generators.sin(rnd, formatted=rnd.random() >= 0.3)
+
+
+def valid_br_zipcode(rnd):
+    return _format(rnd, _join(_digits(rnd, 8)), rnd.choice(('XXXXX-XXX', 'XX.XXX-XXX')))
+
+
+def _separator(rnd):
+    return rnd.choice(('', '', '-', '.', ' '))
+
+
+def valid_br_phone(rnd):
+    area = _join(_digits(rnd, 2))
+    if rnd.random() < 0.3:
+        area = '(%s)' % area
+    return ''.join((area, _separator(rnd), _join(_digits(rnd, rnd.choice((4, 5)))),
+                    _separator(rnd), _join(_digits(rnd, 4))))
+
+
+def valid_nanp_phone(rnd):
+    area = _join(_digits(rnd, 3))
+    if rnd.random() < 0.3:
+        area = '(%s)' % area
+    prefix = rnd.choice(('', '', '1', '1-'))
+    return ''.join((prefix, area, _separator(rnd), _join(_digits(rnd, 3)),
+                    _separator(rnd), _join(_digits(rnd, 4))))
+
+
+def valid_ca_postal_code(rnd):
+    value = generators.ca_postal_code(rnd, formatted=False)
+    value = value[:3] + rnd.choice(('', ' ', '  ')) + value[3:]
+    return value.lower() if rnd.random() < 0.3 else value
+
+
+def valid_us_zip_code(rnd):
+    value = _join(_digits(rnd, 5))
+    if rnd.random() < 0.5:
+        value += '-' + _join(_digits(rnd, 4))
+    return value
+
+
+def _names(module, name):
+    names = []
+
+    def valid(rnd):
+        if not names:
+            from importlib import import_module
+            names.extend(sorted(getattr(import_module(module, __package__), name)))
+        value = rnd.choice(names)
+        return rnd.choice((value, value.upper(), value.title(), ' %s ' % value))
+    return valid
+
+
+def _br_state_names(rnd):
+    from ..br.br_states import REGIONS
+    region = rnd.choice(REGIONS.regions)
+    value = six.text_type(rnd.choice((region.code, region.name)))
+    return rnd.choice((value, value.upper(), value.lower(), ' %s' % value))
+
+
+# Adversarial variations of the valid inputs.
+
+def _near_miss(rnd, value):
+    if not value:
+        return rnd.choice(ALPHABET)
+    position = rnd.randrange(len(value))
+    operation = rnd.randrange(5)
+    if operation == 0:
+        return value[:position] + rnd.choice(ALPHABET) + value[position + 1:]
+    if operation == 1:
+        return value[:position] + value[position + 1:]
+    if operation == 2:
+        return value[:position] + rnd.choice(ALPHABET) + value[position:]
+    if operation == 3 and position + 1 < len(value):
+        return (value[:position] + value[position + 1] + value[position] +
+                value[position + 2:])
+    digit = rnd.choice('0123456789')
+    return value[:position] + value[position:].replace(digit, str((int(digit) + 1) % 10), 1)
+
+
+def _unicode_digits(rnd, value):
+    digits = rnd.choice(UNICODE_DIGITS)
+    return value.translate(dict((ord(str(d)), digits[d]) for d in range(10)))
+
+
+def _garbage(rnd):
+    return ''.join(rnd.choice(ALPHABET) for _ in range(rnd.randrange(30)))
+
+
+def _huge(rnd, value):
+    size = rnd.choice((60, 65, 95, 101, 1000, 4301, 5000))
+    return rnd.choice((
+        '9' * size,
+        value * (size // max(len(value), 1)),
+        ' ' * size + value,
+        value + '.' * size,
+        ''.join(rnd.choice(ALPHABET) for _ in range(size)),
+    ))
+
+
+def adversarial(valid):
+    """
+    Returns an input generator taking a ``random.Random``, mixing the
+    inputs of ``valid`` with near misses, unicode digits, garbage, huge
+    strings and empty values.
+    """
+    def generate(rnd):
+        value = valid(rnd)
+        kind = rnd.random()
+        if kind < 0.35:
+            return value
+        if kind < 0.65:
+            value = _near_miss(rnd, value)
+            return _near_miss(rnd, value) if rnd.random() < 0.3 else value
+        if kind < 0.75:
+            return _unicode_digits(rnd, value)
+        if kind < 0.88:
+            return _garbage(rnd)
+        if kind < 0.96:
+            return _huge(rnd, value)
+        return rnd.choice((None, '', ' ', '\t\n', '\x00', value + '\x00'))
+    return generate
+
+
+class FuzzCase(object):
+    """
+    A field under test, the factory of its reference implementation and the
+    generator of its inputs.
+    """
+
+    def __init__(self, field_class, reference, generator):
+        self.field_class = field_class
+        self.reference = reference
+        self.generator = generator
+
+
+def _field(module, name):
+    def field_class():
+        from importlib import import_module
+        return getattr(import_module(module, __package__), name)
+    return field_class
+
+
+CASES = {
+    'BRStateField': FuzzCase(_field('..br.serializers', 'BRStateField'),
+                             br_state_reference, adversarial(_br_state_names)),
+    'BRCPFField': FuzzCase(_field('..br.serializers', 'BRCPFField'),
+                           lambda: _mod11_reference(11, r'[-\.]', CPF_WEIGHTS),
+                           adversarial(valid_cpf)),
+    'BRCNPJField': FuzzCase(_field('..br.serializers', 'BRCNPJField'),
+                            lambda: _mod11_reference(14, r'[-/\.]', CNPJ_WEIGHTS),
+                            adversarial(valid_cnpj)),
+    'BRZipCodeField': FuzzCase(_field('..br.serializers', 'BRZipCodeField'),
+                               br_zipcode_reference, adversarial(valid_br_zipcode)),
+    'BRPhoneNumberField': FuzzCase(_field('..br.serializers', 'BRPhoneNumberField'),
+                                   br_phone_reference, adversarial(valid_br_phone)),
+    'CAPostalCodeField': FuzzCase(_field('..ca.serializers', 'CAPostalCodeField'),
+                                  ca_postal_code_reference, adversarial(valid_ca_postal_code)),
+    'CAPhoneNumberField': FuzzCase(_field('..ca.serializers', 'CAPhoneNumberField'),
+                                   nanp_phone_reference, adversarial(valid_nanp_phone)),
+    'CAProvinceField': FuzzCase(_field('..ca.serializers', 'CAProvinceField'),
+                                ca_province_reference,
+                                adversarial(_names('..ca.ca_provinces', 'PROVINCES_NORMALIZED'))),
+    'CASocialInsuranceNumberField': FuzzCase(_field('..ca.serializers', 'CASocialInsuranceNumberField'),
+                                             ca_sin_reference, adversarial(valid_sin)),
+    'USStateField': FuzzCase(_field('..us.serializers', 'USStateField'),
+                             us_state_reference,
+                             adversarial(_names('..us.us_states', 'STATES_NORMALIZED'))),
+    'USZipCodeField': FuzzCase(_field('..us.serializers', 'USZipCodeField'),
+                               us_zip_code_reference, adversarial(valid_us_zip_code)),
+    'USPhoneNumberField': FuzzCase(_field('..us.serializers', 'USPhoneNumberField'),
+                                   nanp_phone_reference, adversarial(valid_nanp_phone)),
+}
+
+
+class FuzzReport(object):
+    """
+    The outcome of ``fuzz()``: the count of inputs, the first mismatches as
+    ``(input, reference outcome, field outcome)`` tuples and the time spent
+    in each implementation.
+    """
+    MAX_MISMATCHES = 20
+
+    def __init__(self, name):
+        self.name = name
+        self.inputs = 0
+        self.mismatch_count = 0
+        self.mismatches = []
+        self.reference_time = self.field_time = 0.0
+
+    @property
+    def reference_rate(self):
+        return self.inputs / self.reference_time if self.reference_time else 0.0
+
+    @property
+    def field_rate(self):
+        return self.inputs / self.field_time if self.field_time else 0.0
+
+    def __str__(self):
+        return '%-30s %9d inputs %6d mismatches %10.0f ref/s %10.0f field/s %5.1fx' % (
+            self.name, self.inputs, self.mismatch_count, self.reference_rate,
+            self.field_rate, self.field_rate / self.reference_rate if self.reference_rate else 0)
+
+
+def fuzz(name, budget=1.0, seed=0, max_inputs=None, chunk_size=500):
+    """
+    Fuzzes the field of ``CASES[name]`` for ``budget`` seconds, or until
+    ``max_inputs`` inputs, generated with a ``random.Random(seed)``.
+    Returns a ``FuzzReport``.
+    """
+    case = CASES[name]
+    reference = case.reference()
+    check = case.field_class()().check
+    rnd = random.Random(seed)
+    report = FuzzReport(name)
+    clock = getattr(time, 'perf_counter', time.time)
+    deadline = clock() + budget
+    while clock() < deadline and (max_inputs is None or report.inputs < max_inputs):
+        size = chunk_size if max_inputs is None else min(chunk_size, max_inputs - report.inputs)
+        values = [case.generator(rnd) for _ in range(size)]
+
+        start = clock()
+        expected = [reference(value) for value in values]
+        report.reference_time += clock() - start
+
+        start = clock()
+        results = [check(value) for value in values]
+        report.field_time += clock() - start
+
+        report.inputs += size
+        for value, outcome, result in zip(values, expected, results):
+            if outcome != (result.value, result.code):
+                report.mismatch_count += 1
+                if len(report.mismatches) < report.MAX_MISMATCHES:
+                    report.mismatches.append((value, outcome, (result.value, result.code)))
+    return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog='python -m rest_localflavor.test.fuzz',
+        description='Differential fuzzing of the fields against reference implementations.')
+    parser.add_argument('fields', nargs='*', metavar='FIELD',
+                        help='fields to fuzz, all by default: %s' % ', '.join(sorted(CASES)))
+    parser.add_argument('--budget', type=float, default=10.0,
+                        help='seconds per field (default 10)')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+    unknown = set(args.fields) - set(CASES)
+    if unknown:
+        parser.error('unknown fields: %s' % ', '.join(sorted(unknown)))
+
+    from ..batch import _setup_django
+    _setup_django()
+    failed = False
+    for name in args.fields or sorted(CASES):
+        report = fuzz(name, budget=args.budget, seed=args.seed)
+        print(report)
+        for value, expected, actual in report.mismatches:
+            print('    %r: reference %r, field %r' % (value[:80] if value else value, expected, actual))
+        failed = failed or bool(report.mismatch_count)
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,211 @@
+# -*- coding: utf-8 -*-
+"""
+Seeded generators of valid, and optionally deliberately invalid, CPF, CNPJ,
+SIN numbers and canadian postal codes, to load test the services using the
+fields. The check digits come from the mod 11 weights and the Luhn table
+of ``generic.checksums``, summed over precomputed tables of three or four
+digit groups, and the postal code letters from ``ca.serializers.postcode_re``::
+
+    for cpf in generate('cpf', count=10 ** 6, seed=42, invalid=0.1):
+        ...
+
+or from the command line, one value per line::
+
+    python -m rest_localflavor.test.generators cpf --count 1000000 --seed 42
+
+Invalid values have a wrong last check digit, or a letter a postal code
+cannot have.
+"""
+from __future__ import print_function, unicode_literals
+
+import argparse
+import itertools
+import random
+import re
+import sys
+
+from ..generic.checksums import CNPJ_WEIGHTS, CPF_WEIGHTS, DV_MAKER, LUHN_ODD_LOOKUP
+
+__all__ = ['cpf', 'cnpj', 'sin', 'ca_postal_code', 'GENERATORS', 'generate', 'main']
+
+
+def _mod11_tables(weights):
+    # for every group of three leading digits, the sums of their weights for
+    # the first and the second verifier digits, packed as first + second << 16
+    pairs = list(zip(weights[1:], weights[:-1]))
+    tables = []
+    for start in range(0, len(pairs), 3):
+        group = pairs[start:start + 3]
+        tables.append(tuple(
+            sum(int(digit) * (w1 + (w2 << 16)) for digit, (w1, w2) in zip('%03d' % n, group))
+            for n in range(1000)))
+    return tables
+
+
+_CPF_TABLES = _mod11_tables(CPF_WEIGHTS)
+_CNPJ_TABLES = _mod11_tables(CNPJ_WEIGHTS)
+
+# Luhn sums of the two four digit groups before the check digit of a SIN
+_LUHN_TABLE = tuple(
+    sum(int(d) if i % 2 == 0 else LUHN_ODD_LOOKUP[int(d)] for i, d in enumerate('%04d' % n))
+    for n in range(10000))
+
+
+def _wrong(rnd, digit):
+    return (digit + rnd.randrange(1, 10)) % 10
+
+
+def cpf(rnd, formatted=True, valid=True):
+    """
+    Returns a random CPF, ``XXX.XXX.XXX-XX`` or 11 bare digits.
+    """
+    t0, t1, t2 = _CPF_TABLES
+    a, b, c = int(rnd.random() * 1000), int(rnd.random() * 1000), int(rnd.random() * 1000)
+    total = t0[a] + t1[b] + t2[c]
+    first = DV_MAKER[(total & 0xffff) % 11]
+    second = DV_MAKER[((total >> 16) + first * CPF_WEIGHTS[-1]) % 11]
+    if not valid:
+        second = _wrong(rnd, second)
+    return ('%03d.%03d.%03d-%d%d' if formatted else '%03d%03d%03d%d%d') % (a, b, c, first, second)
+
+
+def cnpj(rnd, formatted=True, valid=True):
+    """
+    Returns a random CNPJ, ``XX.XXX.XXX/XXXX-XX`` or 14 bare digits.
+    """
+    t0, t1, t2, t3 = _CNPJ_TABLES
+    a, b = int(rnd.random() * 1000), int(rnd.random() * 1000)
+    c, d = int(rnd.random() * 1000), int(rnd.random() * 1000)
+    total = t0[a] + t1[b] + t2[c] + t3[d]
+    first = DV_MAKER[(total & 0xffff) % 11]
+    second = DV_MAKER[((total >> 16) + first * CNPJ_WEIGHTS[-1]) % 11]
+    if not valid:
+        second = _wrong(rnd, second)
+    digits = '%03d%03d%03d%03d%d%d' % (a, b, c, d, first, second)
+    if formatted:
+        return '%s.%s.%s/%s-%s' % (digits[:2], digits[2:5], digits[5:8], digits[8:12], digits[12:])
+    return digits
+
+
+def sin(rnd, formatted=True, valid=True):
+    """
+    Returns a random canadian Social Insurance Number, ``XXX-XXX-XXX`` or 9
+    bare digits; ``CASocialInsuranceNumberField`` only accepts the former.
+    """
+    high, low = int(rnd.random() * 10000), int(rnd.random() * 10000)
+    check = -(_LUHN_TABLE[high] + _LUHN_TABLE[low]) % 10
+    if not valid:
+        check = _wrong(rnd, check)
+    digits = '%04d%04d%d' % (high, low, check)
+    if formatted:
+        return '%s-%s-%s' % (digits[:3], digits[3:6], digits[6:])
+    return digits
+
+
+class _PostalCodes(object):
+    # the halves of every postal code postcode_re accepts, e.g. K1N and 5J9
+
+    def __init__(self):
+        from ..ca.serializers import postcode_re
+        classes = re.findall(r'\[([A-Z]+)\]', postcode_re.pattern)
+        digits = '0123456789'
+        self.first = tuple(''.join(chars) for chars in itertools.product(classes[0], digits, classes[1]))
+        self.second = tuple(''.join(chars) for chars in itertools.product(digits, classes[2], digits))
+        # the letters each letter position of 'A1A1A1' does not accept
+        self.wrong = dict(
+            (position, ''.join(sorted(set('ABCDEFGHIJKLMNOPQRSTUVWXYZ') - set(letters))))
+            for position, letters in zip((0, 2, 4), classes))
+
+
+_postal_codes = None
+
+
+def _load_postal_codes():
+    global _postal_codes
+    _postal_codes = _PostalCodes()
+    return _postal_codes
+
+
+def ca_postal_code(rnd, formatted=True, valid=True):
+    """
+    Returns a random canadian postal code, ``XXX XXX`` or ``XXXXXX``.
+    """
+    codes = _postal_codes or _load_postal_codes()
+    value = (codes.first[int(rnd.random() * len(codes.first))] +
+             codes.second[int(rnd.random() * len(codes.second))])
+    if not valid:
+        position = rnd.choice((0, 2, 4))
+        value = value[:position] + rnd.choice(codes.wrong[position]) + value[position + 1:]
+    if formatted:
+        return value[:3] + ' ' + value[3:]
+    return value
+
+
+#: Generator functions by name, taking ``(rnd, formatted, valid)``.
+GENERATORS = {
+    'cpf': cpf,
+    'cnpj': cnpj,
+    'sin': sin,
+    'ca_postal_code': ca_postal_code,
+}
+
+
+def generate(name, count=None, seed=None, invalid=0.0, formatted=True, chunk_size=1000):
+    """
+    Iterator of ``count`` values, endless by default, of the generator
+    ``name`` of ``GENERATORS``. A share ``invalid`` of them, between 0 and
+    1, is deliberately invalid. The same ``seed`` always gives the same
+    values.
+    """
+    if not 0 <= invalid <= 1:
+        raise ValueError('invalid must be between 0 and 1, not %r' % (invalid,))
+    return _generate(GENERATORS[name], random.Random(seed), count, invalid, formatted, chunk_size)
+
+
+def _generate(make, rnd, count, invalid, formatted, chunk_size):
+    remaining = count
+    while remaining is None or remaining > 0:
+        size = chunk_size if remaining is None else min(chunk_size, remaining)
+        if invalid:
+            chunk = [make(rnd, formatted, rnd.random() >= invalid) for _ in range(size)]
+        else:
+            chunk = [make(rnd, formatted) for _ in range(size)]
+        for value in chunk:
+            yield value
+        if remaining is not None:
+            remaining -= size
+
+
+def _share(text):
+    try:
+        share = float(text)
+    except ValueError:
+        share = None
+    if share is None or not 0 <= share <= 1:
+        raise argparse.ArgumentTypeError('expected a number between 0 and 1, got %r' % text)
+    return share
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog='python -m rest_localflavor.test.generators',
+        description='Writes random CPF, CNPJ, SIN numbers or postal codes, one per line.')
+    parser.add_argument('name', choices=sorted(GENERATORS))
+    parser.add_argument('--count', type=int, default=1000,
+                        help='number of values (default 1000)')
+    parser.add_argument('--seed', type=int, default=None)
+    parser.add_argument('--invalid', type=_share, default=0.0,
+                        help='share of deliberately invalid values, between 0 and 1')
+    parser.add_argument('--bare', action='store_true', help='digits and letters only')
+    args = parser.parse_args(argv)
+
+    from ..batch import _setup_django
+    _setup_django()
+    lines = generate(args.name, args.count, args.seed, args.invalid, not args.bare)
+    write = sys.stdout.write
+    for chunk in iter(lambda: list(itertools.islice(lines, 10000)), []):
+        write('\n'.join(chunk) + '\n')
+
+
+if __name__ == '__main__':
+    main()
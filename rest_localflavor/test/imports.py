@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+"""
+Import time of the field modules, from ``python -X importtime`` in a fresh
+interpreter (Python 3.7+), once Django and DRF are loaded. Shared by the
+import tests and ``benchmarks/bench_imports.py``.
+"""
+from __future__ import unicode_literals
+
+import os
+import subprocess
+import sys
+
+MODULES = ('rest_localflavor.br.serializers', 'rest_localflavor.ca.serializers',
+           'rest_localflavor.us.serializers')
+
+SETUP = (
+    "import django\n"
+    "from django.conf import settings\n"
+    "settings.configure(INSTALLED_APPS=['rest_localflavor'])\n"
+    "django.setup()\n"
+    "import rest_framework.serializers\n"
+)
+
+
+def import_times(modules=MODULES):
+    """
+    Imports ``modules`` in a subprocess, returns a map of every module it
+    loaded to its cumulative import time in microseconds.
+    """
+    code = SETUP + "import sys\nsys.stderr.write('-- start\\n')\n" + ''.join(
+        'import %s\n' % module for module in modules)
+    # the directory holding the rest_localflavor package
+    root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(
+        filter(None, [root, os.environ.get('PYTHONPATH')])))
+    output = subprocess.check_output(
+        [sys.executable, '-X', 'importtime', '-c', code],
+        stderr=subprocess.STDOUT, env=env, cwd=root).decode('utf-8')
+    times = {}
+    for line in output.split('-- start\n', 1)[1].splitlines():
+        if not line.startswith('import time:') or '|' not in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        if cumulative.strip().isdigit():
+            times[name.strip()] = int(cumulative)
+    return times
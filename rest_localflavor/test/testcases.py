@@ -63,3 +63,14 @@ class DRFTestCase(SimpleTestCase):
             field_kwargs.update({'min_length': 2, 'max_length': 20})
             self.assertIsInstance(fieldclass(*field_args, **field_kwargs),
                                   fieldclass)
+
+    def assertMatchesReference(self, name, inputs=2000, seed=0):
+        """
+        Asserts that the field of ``fuzz.CASES[name]`` agrees with its
+        reference implementation on ``inputs`` generated inputs, see
+        ``rest_localflavor.test.fuzz``.
+        """
+        from .fuzz import fuzz
+        report = fuzz(name, budget=float('inf'), seed=seed, max_inputs=inputs)
+        self.assertEqual(report.inputs, inputs)
+        self.assertEqual(report.mismatches, [], '%d mismatches' % report.mismatch_count)
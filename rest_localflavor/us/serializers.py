@@ -3,39 +3,93 @@ from django.core.validators import EMPTY_VALUES
 from django.utils.translation import ugettext_lazy as __
 
 from rest_framework import serializers
-from rest_framework.fields import empty
 
+from ..batch import BatchValidationMixin
+from ..cache import CachedValidationMixin, cached_validation
+from ..generic.fields import BlankInvalidMixin, ShallowCopyMixin, invalid_messages
+from ..generic.lazy import LazyPattern
+from ..generic.normalize import LazyIndex, lookup
+from ..generic.phones import normalize_phone
 
-class USStateField(serializers.CharField):
+try:
+    from django.utils.encoding import smart_text
+except ImportError:
+    from django.utils.encoding import smart_unicode as smart_text
+
+
+zipcode_re = LazyPattern(r'^[0-9]{5}(?:-[0-9]{4})?$')
+
+
+class USStateField(BlankInvalidMixin, CachedValidationMixin, ShallowCopyMixin, BatchValidationMixin, serializers.CharField):
     """
     A field that validates its input is a U.S. state name or abbreviation.
     It normalizes the input to the standard two-letter postal service
     abbreviation for the given province.
     """
 
-    default_error_messages = {
-        'invalid': __('Enter a U.S. state or territory.'),
-    }
+    default_error_messages = invalid_messages(__('Enter a U.S. state or territory.'))
+
+    # Load data in memory only when it is required, see also #17275
+    normalized_index = LazyIndex('rest_localflavor.us.us_states', 'STATES_INDEX')
+
+    max_input_length = 100
+
+    @cached_validation
+    def _check(self, data):
+        if self._oversized(data):
+            return None, 'invalid'
+        self._base_validation(data)
+        if data in EMPTY_VALUES:
+            return '', None
+
+        value = lookup(self.normalized_index, data)
+        if value is None:
+            return None, 'invalid'
+        return value, None
+
+
+class USZipCodeField(BlankInvalidMixin, CachedValidationMixin, ShallowCopyMixin, BatchValidationMixin, serializers.CharField):
+    """
+    A field that validates its input is a U.S. ZIP code, in the format
+    XXXXX or XXXXX-XXXX (ZIP+4).
+    """
+
+    default_error_messages = invalid_messages(__('Enter a zip code in the format XXXXX or XXXXX-XXXX.'))
+
+    max_input_length = 64
+
+    @cached_validation
+    def _check(self, data):
+        if self._oversized(data):
+            return None, 'invalid'
+        data = self._base_validation(data)
+        if data in EMPTY_VALUES:
+            return '', None
+
+        data = data.strip()
+        if not zipcode_re.match(data):
+            return None, 'invalid'
+        return data, None
+
+
+class USPhoneNumberField(BlankInvalidMixin, ShallowCopyMixin, BatchValidationMixin, serializers.CharField):
+    """
+    A U.S. phone number field, normalized to the XXX-XXX-XXXX format. An
+    optional leading "1" country code is dropped.
+    """
+
+    default_error_messages = invalid_messages(__('Phone numbers must be in XXX-XXX-XXXX format.'))
 
-    def __init__(self, *args, **kwargs):
-        super(USStateField, self).__init__(*args, **kwargs)
-        self.error_messages['blank'] = self.error_messages['invalid']
-        self.error_messages['null'] = self.error_messages['invalid']
+    max_input_length = 64
 
-    def run_validation(self, data=empty):
-        super(USStateField, self).run_validation(data)
+    def _check(self, data):
+        if self._oversized(data):
+            return None, 'invalid'
+        self._base_validation(data)
         if data in EMPTY_VALUES:
-            return ''
-
-        try:
-            value = data.strip().lower()
-        except AttributeError:
-            pass
-        else:
-            # Load data in memory only when it is required, see also #17275
-            from .us_states import STATES_NORMALIZED
-            try:
-                return STATES_NORMALIZED[value.strip().lower()]
-            except KeyError:
-                pass
-        self.fail('invalid')
+            return '', None
+
+        value = normalize_phone('US', smart_text(data))
+        if value is None:
+            return None, 'invalid'
+        return value, None
@@ -9,155 +9,114 @@ when explicitly needed.
 """
 from django.utils.translation import ugettext_lazy as _
 
+from ..generic.lazy import lazy_attributes
+from ..generic.normalize import build_index
+from ..generic.regions import (
+    ARMED_FORCES, CONTIGUOUS, FREELY_ASSOCIATED, OBSOLETE, STATE, TERRITORY, RegionRegistry)
+
+
+#: Every US state, territory, military mail region, freely associated and
+#: obsolete USPS location, alphabetical.
+REGIONS = RegionRegistry('US', (
+    ('AL', _('Alabama'), STATE | CONTIGUOUS),
+    ('AK', _('Alaska'), STATE),
+    ('AS', _('American Samoa'), TERRITORY),
+    ('AZ', _('Arizona'), STATE | CONTIGUOUS),
+    ('AR', _('Arkansas'), STATE | CONTIGUOUS),
+    ('AA', _('Armed Forces Americas'), ARMED_FORCES),
+    ('AE', _('Armed Forces Europe'), ARMED_FORCES),
+    ('AP', _('Armed Forces Pacific'), ARMED_FORCES),
+    ('CA', _('California'), STATE | CONTIGUOUS),
+    ('CO', _('Colorado'), STATE | CONTIGUOUS),
+    ('CM', _('Commonwealth of the Northern Mariana Islands'), OBSOLETE),  # Is now 'MP'
+    ('CT', _('Connecticut'), STATE | CONTIGUOUS),
+    ('DE', _('Delaware'), STATE | CONTIGUOUS),
+    ('DC', _('District of Columbia'), STATE | CONTIGUOUS),
+    ('FM', _('Federated States of Micronesia'), FREELY_ASSOCIATED),
+    ('FL', _('Florida'), STATE | CONTIGUOUS),
+    ('GA', _('Georgia'), STATE | CONTIGUOUS),
+    ('GU', _('Guam'), TERRITORY),
+    ('HI', _('Hawaii'), STATE),
+    ('ID', _('Idaho'), STATE | CONTIGUOUS),
+    ('IL', _('Illinois'), STATE | CONTIGUOUS),
+    ('IN', _('Indiana'), STATE | CONTIGUOUS),
+    ('IA', _('Iowa'), STATE | CONTIGUOUS),
+    ('KS', _('Kansas'), STATE | CONTIGUOUS),
+    ('KY', _('Kentucky'), STATE | CONTIGUOUS),
+    ('LA', _('Louisiana'), STATE | CONTIGUOUS),
+    ('ME', _('Maine'), STATE | CONTIGUOUS),
+    ('MH', _('Marshall Islands'), FREELY_ASSOCIATED),
+    ('MD', _('Maryland'), STATE | CONTIGUOUS),
+    ('MA', _('Massachusetts'), STATE | CONTIGUOUS),
+    ('MI', _('Michigan'), STATE | CONTIGUOUS),
+    ('MN', _('Minnesota'), STATE | CONTIGUOUS),
+    ('MS', _('Mississippi'), STATE | CONTIGUOUS),
+    ('MO', _('Missouri'), STATE | CONTIGUOUS),
+    ('MT', _('Montana'), STATE | CONTIGUOUS),
+    ('NE', _('Nebraska'), STATE | CONTIGUOUS),
+    ('NV', _('Nevada'), STATE | CONTIGUOUS),
+    ('NH', _('New Hampshire'), STATE | CONTIGUOUS),
+    ('NJ', _('New Jersey'), STATE | CONTIGUOUS),
+    ('NM', _('New Mexico'), STATE | CONTIGUOUS),
+    ('NY', _('New York'), STATE | CONTIGUOUS),
+    ('NC', _('North Carolina'), STATE | CONTIGUOUS),
+    ('ND', _('North Dakota'), STATE | CONTIGUOUS),
+    ('MP', _('Northern Mariana Islands'), TERRITORY),
+    ('OH', _('Ohio'), STATE | CONTIGUOUS),
+    ('OK', _('Oklahoma'), STATE | CONTIGUOUS),
+    ('OR', _('Oregon'), STATE | CONTIGUOUS),
+    ('PW', _('Palau'), FREELY_ASSOCIATED),
+    ('CZ', _('Panama Canal Zone'), OBSOLETE),  # Reverted to Panama 1979
+    ('PA', _('Pennsylvania'), STATE | CONTIGUOUS),
+    ('PI', _('Philippine Islands'), OBSOLETE),  # Philippine independence 1946
+    ('PR', _('Puerto Rico'), TERRITORY),
+    ('RI', _('Rhode Island'), STATE | CONTIGUOUS),
+    ('SC', _('South Carolina'), STATE | CONTIGUOUS),
+    ('SD', _('South Dakota'), STATE | CONTIGUOUS),
+    ('TN', _('Tennessee'), STATE | CONTIGUOUS),
+    ('TX', _('Texas'), STATE | CONTIGUOUS),
+    ('TT', _('Trust Territory of the Pacific Islands'), OBSOLETE),  # Became the independent COFA states + Northern Mariana Islands 1979-1994
+    ('UT', _('Utah'), STATE | CONTIGUOUS),
+    ('VT', _('Vermont'), STATE | CONTIGUOUS),
+    ('VI', _('Virgin Islands'), TERRITORY),
+    ('VA', _('Virginia'), STATE | CONTIGUOUS),
+    ('WA', _('Washington'), STATE | CONTIGUOUS),
+    ('WV', _('West Virginia'), STATE | CONTIGUOUS),
+    ('WI', _('Wisconsin'), STATE | CONTIGUOUS),
+    ('WY', _('Wyoming'), STATE | CONTIGUOUS),
+))
 
 #: The 48 contiguous states, plus the District of Columbia.
-CONTIGUOUS_STATES = (
-    ('AL', _('Alabama')),
-    ('AZ', _('Arizona')),
-    ('AR', _('Arkansas')),
-    ('CA', _('California')),
-    ('CO', _('Colorado')),
-    ('CT', _('Connecticut')),
-    ('DE', _('Delaware')),
-    ('DC', _('District of Columbia')),
-    ('FL', _('Florida')),
-    ('GA', _('Georgia')),
-    ('ID', _('Idaho')),
-    ('IL', _('Illinois')),
-    ('IN', _('Indiana')),
-    ('IA', _('Iowa')),
-    ('KS', _('Kansas')),
-    ('KY', _('Kentucky')),
-    ('LA', _('Louisiana')),
-    ('ME', _('Maine')),
-    ('MD', _('Maryland')),
-    ('MA', _('Massachusetts')),
-    ('MI', _('Michigan')),
-    ('MN', _('Minnesota')),
-    ('MS', _('Mississippi')),
-    ('MO', _('Missouri')),
-    ('MT', _('Montana')),
-    ('NE', _('Nebraska')),
-    ('NV', _('Nevada')),
-    ('NH', _('New Hampshire')),
-    ('NJ', _('New Jersey')),
-    ('NM', _('New Mexico')),
-    ('NY', _('New York')),
-    ('NC', _('North Carolina')),
-    ('ND', _('North Dakota')),
-    ('OH', _('Ohio')),
-    ('OK', _('Oklahoma')),
-    ('OR', _('Oregon')),
-    ('PA', _('Pennsylvania')),
-    ('RI', _('Rhode Island')),
-    ('SC', _('South Carolina')),
-    ('SD', _('South Dakota')),
-    ('TN', _('Tennessee')),
-    ('TX', _('Texas')),
-    ('UT', _('Utah')),
-    ('VT', _('Vermont')),
-    ('VA', _('Virginia')),
-    ('WA', _('Washington')),
-    ('WV', _('West Virginia')),
-    ('WI', _('Wisconsin')),
-    ('WY', _('Wyoming')),
-)
+CONTIGUOUS_STATES = REGIONS.choices(CONTIGUOUS)
 
 #: All 50 states, plus the District of Columbia.
-US_STATES = (
-    ('AL', _('Alabama')),
-    ('AK', _('Alaska')),
-    ('AZ', _('Arizona')),
-    ('AR', _('Arkansas')),
-    ('CA', _('California')),
-    ('CO', _('Colorado')),
-    ('CT', _('Connecticut')),
-    ('DE', _('Delaware')),
-    ('DC', _('District of Columbia')),
-    ('FL', _('Florida')),
-    ('GA', _('Georgia')),
-    ('HI', _('Hawaii')),
-    ('ID', _('Idaho')),
-    ('IL', _('Illinois')),
-    ('IN', _('Indiana')),
-    ('IA', _('Iowa')),
-    ('KS', _('Kansas')),
-    ('KY', _('Kentucky')),
-    ('LA', _('Louisiana')),
-    ('ME', _('Maine')),
-    ('MD', _('Maryland')),
-    ('MA', _('Massachusetts')),
-    ('MI', _('Michigan')),
-    ('MN', _('Minnesota')),
-    ('MS', _('Mississippi')),
-    ('MO', _('Missouri')),
-    ('MT', _('Montana')),
-    ('NE', _('Nebraska')),
-    ('NV', _('Nevada')),
-    ('NH', _('New Hampshire')),
-    ('NJ', _('New Jersey')),
-    ('NM', _('New Mexico')),
-    ('NY', _('New York')),
-    ('NC', _('North Carolina')),
-    ('ND', _('North Dakota')),
-    ('OH', _('Ohio')),
-    ('OK', _('Oklahoma')),
-    ('OR', _('Oregon')),
-    ('PA', _('Pennsylvania')),
-    ('RI', _('Rhode Island')),
-    ('SC', _('South Carolina')),
-    ('SD', _('South Dakota')),
-    ('TN', _('Tennessee')),
-    ('TX', _('Texas')),
-    ('UT', _('Utah')),
-    ('VT', _('Vermont')),
-    ('VA', _('Virginia')),
-    ('WA', _('Washington')),
-    ('WV', _('West Virginia')),
-    ('WI', _('Wisconsin')),
-    ('WY', _('Wyoming')),
-)
+US_STATES = REGIONS.choices(STATE)
 
 #: Non-state territories.
-US_TERRITORIES = (
-    ('AS', _('American Samoa')),
-    ('GU', _('Guam')),
-    ('MP', _('Northern Mariana Islands')),
-    ('PR', _('Puerto Rico')),
-    ('VI', _('Virgin Islands')),
-)
+US_TERRITORIES = REGIONS.choices(TERRITORY)
 
 #: Military postal "states". Note that 'AE' actually encompasses
 #: Europe, Canada, Africa and the Middle East.
-ARMED_FORCES_STATES = (
-    ('AA', _('Armed Forces Americas')),
-    ('AE', _('Armed Forces Europe')),
-    ('AP', _('Armed Forces Pacific')),
-)
+ARMED_FORCES_STATES = REGIONS.choices(ARMED_FORCES)
 
 #: Non-US locations serviced by USPS (under Compact of Free
 #: Association).
-COFA_STATES = (
-    ('FM', _('Federated States of Micronesia')),
-    ('MH', _('Marshall Islands')),
-    ('PW', _('Palau')),
-)
+COFA_STATES = REGIONS.choices(FREELY_ASSOCIATED)
 
 #: Obsolete abbreviations (no longer US territories/USPS service, or
 #: code changed).
-OBSOLETE_STATES = (
-    ('CM', _('Commonwealth of the Northern Mariana Islands')),  # Is now 'MP'
-    ('CZ', _('Panama Canal Zone')),                             # Reverted to Panama 1979
-    ('PI', _('Philippine Islands')),                            # Philippine independence 1946
-    ('TT', _('Trust Territory of the Pacific Islands')),        # Became the independent COFA states + Northern Mariana Islands 1979-1994
-)
+OBSOLETE_STATES = REGIONS.choices(OBSOLETE)
+
 
+def _state_choices():
+    """All US states and territories plus DC and military mail."""
+    return REGIONS.choices(STATE | TERRITORY | ARMED_FORCES, sort=True)
 
-#: All US states and territories plus DC and military mail.
-STATE_CHOICES = tuple(sorted(US_STATES + US_TERRITORIES + ARMED_FORCES_STATES, key=lambda obj: obj[1]))
 
-#: All US Postal Service locations.
-USPS_CHOICES = tuple(sorted(US_STATES + US_TERRITORIES + ARMED_FORCES_STATES + COFA_STATES, key=lambda obj: obj[1]))
+def _usps_choices():
+    """All US Postal Service locations."""
+    return REGIONS.choices(STATE | TERRITORY | ARMED_FORCES | FREELY_ASSOCIATED, sort=True)
+
 
 #: Normalized versions of state names
 STATES_NORMALIZED = {
@@ -330,3 +289,12 @@ STATES_NORMALIZED = {
     'wyo': 'WY',
     'wyoming': 'WY',
 }
+
+# STATE_CHOICES and USPS_CHOICES sort translated names, and STATES_INDEX
+# is the read only index of STATES_NORMALIZED, so they are only built on
+# first access.
+__getattr__ = lazy_attributes(globals(), {
+    'STATE_CHOICES': _state_choices,
+    'USPS_CHOICES': _usps_choices,
+    'STATES_INDEX': lambda: build_index(STATES_NORMALIZED),
+})
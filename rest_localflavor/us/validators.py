@@ -0,0 +1,31 @@
+from django.utils.translation import ugettext_lazy as _
+
+from ..generic.normalize import LazyIndex, lookup
+from ..generic.validators import PostalCodeRegionValidator
+
+__all__ = ['USZipCodeStateValidator']
+
+
+class USZipCodeStateValidator(PostalCodeRegionValidator):
+    """
+    Checks that a ZIP code is from the state (USPS code or name) of another
+    field of the payload, from its first three digits::
+
+        class AddressSerializer(serializers.Serializer):
+            zip_code = USZipCodeField()
+            state = USStateField()
+
+            class Meta:
+                validators = [USZipCodeStateValidator('zip_code', 'state')]
+    """
+    message = _('The zip code {postal_code} is not from the state {region}.')
+
+    # Load data in memory only when it is required, see also #17275
+    states_index = LazyIndex('rest_localflavor.us.us_states', 'STATES_INDEX')
+
+    def regions(self, postal_code):
+        from .zip_codes import zip_code_states
+        return zip_code_states(postal_code)
+
+    def normalize_region(self, region):
+        return lookup(self.states_index, region)
@@ -0,0 +1,108 @@
+"""
+The states of the US ZIP codes, from their first three digits.
+Source: https://en.wikipedia.org/wiki/List_of_ZIP_Code_prefixes
+
+This exists in this standalone file so that it's only imported into memory
+when explicitly needed.
+"""
+from array import array
+
+__all__ = ['ZIP_PREFIX_RANGES', 'zip_code_states']
+
+#: Sorted ``(first, last, states)`` ranges of ZIP code prefixes, with the
+#: USPS codes of their states. A few prefixes serve several states or
+#: territories.
+ZIP_PREFIX_RANGES = (
+    (5, 5, ('NY',)),
+    (6, 7, ('PR',)),
+    (8, 8, ('VI',)),
+    (9, 9, ('PR',)),
+    (10, 27, ('MA',)),
+    (28, 29, ('RI',)),
+    (30, 38, ('NH',)),
+    (39, 49, ('ME',)),
+    (50, 54, ('VT',)),
+    (55, 55, ('MA',)),
+    (56, 59, ('VT',)),
+    (60, 69, ('CT',)),
+    (70, 89, ('NJ',)),
+    (90, 98, ('AE',)),
+    (100, 149, ('NY',)),
+    (150, 196, ('PA',)),
+    (197, 199, ('DE',)),
+    (200, 200, ('DC',)),
+    (201, 201, ('VA',)),
+    (202, 205, ('DC',)),
+    (206, 219, ('MD',)),
+    (220, 246, ('VA',)),
+    (247, 268, ('WV',)),
+    (270, 289, ('NC',)),
+    (290, 299, ('SC',)),
+    (300, 319, ('GA',)),
+    (320, 339, ('FL',)),
+    (340, 340, ('AA',)),
+    (341, 349, ('FL',)),
+    (350, 369, ('AL',)),
+    (370, 385, ('TN',)),
+    (386, 397, ('MS',)),
+    (398, 399, ('GA',)),
+    (400, 427, ('KY',)),
+    (430, 459, ('OH',)),
+    (460, 479, ('IN',)),
+    (480, 499, ('MI',)),
+    (500, 528, ('IA',)),
+    (530, 549, ('WI',)),
+    (550, 567, ('MN',)),
+    (569, 569, ('DC',)),
+    (570, 577, ('SD',)),
+    (580, 588, ('ND',)),
+    (590, 599, ('MT',)),
+    (600, 629, ('IL',)),
+    (630, 658, ('MO',)),
+    (660, 679, ('KS',)),
+    (680, 693, ('NE',)),
+    (700, 714, ('LA',)),
+    (716, 729, ('AR',)),
+    (730, 731, ('OK',)),
+    (733, 733, ('TX',)),
+    (734, 749, ('OK',)),
+    (750, 799, ('TX',)),
+    (800, 816, ('CO',)),
+    (820, 831, ('WY',)),
+    (832, 838, ('ID',)),
+    (840, 847, ('UT',)),
+    (850, 865, ('AZ',)),
+    (870, 884, ('NM',)),
+    (885, 885, ('TX',)),
+    (889, 898, ('NV',)),
+    (900, 961, ('CA',)),
+    (962, 966, ('AP',)),
+    (967, 967, ('HI', 'AS')),
+    (968, 968, ('HI',)),
+    (969, 969, ('GU', 'MP', 'FM', 'MH', 'PW')),
+    (970, 979, ('OR',)),
+    (980, 994, ('WA',)),
+    (995, 999, ('AK',)),
+)
+
+# the distinct state tuples, _GROUPS[0] being the one of unused prefixes
+_GROUPS = ((),) + tuple(sorted(set(states for _, _, states in ZIP_PREFIX_RANGES)))
+
+# prefix -> index in _GROUPS, one byte for each of the 1000 prefixes
+_PREFIXES = array('B', [0]) * 1000
+for _first, _last, _states in ZIP_PREFIX_RANGES:
+    for _prefix in range(_first, _last + 1):
+        _PREFIXES[_prefix] = _GROUPS.index(_states)
+del _first, _last, _states, _prefix
+
+
+def zip_code_states(zip_code):
+    """
+    Returns the USPS codes of the states ``zip_code`` (5 digits or ZIP+4)
+    may be from, an empty tuple when its prefix is unused or it does not
+    start with three digits.
+    """
+    prefix = zip_code[:3]
+    if len(prefix) != 3 or not prefix.isdigit():
+        return ()
+    return _GROUPS[_PREFIXES[int(prefix)]]
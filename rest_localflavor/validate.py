@@ -0,0 +1,229 @@
+"""
+Streams a CSV or JSON lines file through localflavor fields, writing the
+normalized rows and a CSV report of the invalid values::
+
+    python -m rest_localflavor.validate customers.csv \\
+        --map cpf=BRCPFField --map cep=BRZipCodeField --map state=USStateField \\
+        --output normalized.csv --errors errors.csv
+
+Rows are read, validated and written in chunks of ``--chunk-size`` rows,
+so memory use does not depend on the size of the input. ``--workers``
+spreads the validation over several processes. Rows that cannot be read
+(CSV rows with more fields than the header, JSON lines that are not
+objects) are reported with an empty column and left out of the output.
+The exit status is 1 when an invalid value or row was found.
+"""
+from __future__ import print_function, unicode_literals
+
+import argparse
+import csv
+import io
+import itertools
+import json
+import sys
+import time
+
+from .batch import _setup_django, field_classes, validation_pool
+
+__all__ = ['field_classes', 'MalformedRow', 'read_rows', 'validate_rows', 'main']
+
+
+class MalformedRow(dict):
+    """
+    An empty row standing for input that could not be read, ``error``
+    telling why and ``raw`` holding the offending text.
+    """
+
+    def __init__(self, error, raw):
+        super(MalformedRow, self).__init__()
+        self.error = error
+        self.raw = raw
+
+
+def read_rows(stream, format, fieldnames=None):
+    """
+    Yields the rows of ``stream`` as dicts, and a ``MalformedRow`` for every
+    CSV row with extra fields or JSON line that is not an object. With
+    ``fieldnames``, CSV streams have no header row.
+    """
+    if format == 'csv':
+        for row in csv.DictReader(stream, fieldnames=fieldnames):
+            extra = row.get(None)
+            if extra is not None:
+                yield MalformedRow('extra_fields', ','.join(extra))
+            else:
+                yield row
+    else:
+        for line in stream:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                row = json.loads(line)
+            except ValueError:
+                yield MalformedRow('invalid_json', line)
+                continue
+            yield row if isinstance(row, dict) else MalformedRow('not_an_object', line)
+
+
+def chunked(iterable, size):
+    iterator = iter(iterable)
+    while True:
+        chunk = list(itertools.islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def validate_rows(rows, fields, chunk_size=1000, pool=None):
+    """
+    Validates the ``fields`` columns (a map of column name to field
+    instance) of ``rows``. Yields ``(row, errors)`` pairs, the row with the
+    normalized values and a map of column name to error code. The errors of
+    ``MalformedRow`` rows, which are not validated, are keyed by ``None``.
+    With a ``pool`` from ``batch.validation_pool()`` every chunk is split
+    among its worker processes.
+    """
+    kwargs = {} if pool is None else {'pool': pool}
+    for chunk in chunked(rows, chunk_size):
+        readable = [row for row in chunk if not isinstance(row, MalformedRow)]
+        results = dict(
+            (column, iter(field.validate_many([row.get(column, '') for row in readable], **kwargs)))
+            for column, field in fields.items())
+        for row in chunk:
+            if isinstance(row, MalformedRow):
+                yield row, {None: row.error}
+                continue
+            errors = {}
+            for column, result in results.items():
+                value, error = next(result)
+                if error is None:
+                    row[column] = value
+                else:
+                    errors[column] = error
+            yield row, errors
+
+
+class _Writer(object):
+    def __init__(self, stream, format, fieldnames=None):
+        self.stream = stream
+        self.format = format
+        self.fieldnames = fieldnames
+        self.writer = None
+
+    def write(self, row):
+        if self.format == 'jsonl':
+            self.stream.write(json.dumps(row) + '\n')
+            return
+        if self.writer is None:
+            self.writer = csv.DictWriter(self.stream, fieldnames=self.fieldnames or list(row),
+                                         extrasaction='ignore')
+            self.writer.writeheader()
+        self.writer.writerow(row)
+
+
+def _write_rows(validated, writer, report_writer, drop_invalid):
+    """
+    Writes the ``validate_rows()`` output and reports its errors. Returns
+    the number of rows and of invalid rows.
+    """
+    total = invalid = 0
+    for number, (row, errors) in enumerate(validated, 1):
+        total += 1
+        if errors:
+            invalid += 1
+            if report_writer is not None:
+                for column in sorted(errors):
+                    value = row.raw if column is None else row.get(column)
+                    report_writer.writerow([number, column, value, errors[column]])
+            if drop_invalid or isinstance(row, MalformedRow):
+                continue
+        writer.write(row)
+    return total, invalid
+
+
+def _open(path, mode):
+    if path in (None, '-'):
+        return sys.stdin if mode == 'r' else sys.stdout
+    return io.open(path, mode, newline='' if path.endswith('.csv') else None,
+                   encoding='utf-8')
+
+
+def _parse_map(values, classes, allow_blank):
+    fields = {}
+    for item in values:
+        column, _, name = item.partition('=')
+        name = name.rsplit('.', 1)[-1]
+        if not column or name not in classes:
+            raise argparse.ArgumentTypeError(
+                "invalid --map %r, expected column=Field with Field one of: %s" % (
+                    item, ', '.join(sorted(classes))))
+        kwargs = {'required': False, 'allow_blank': True} if allow_blank else {}
+        fields[column] = classes[name](**kwargs)
+    return fields
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog='python -m rest_localflavor.validate',
+        description='Validates and normalizes columns of a CSV or JSON lines file.')
+    parser.add_argument('input', help="input file, '-' for stdin")
+    parser.add_argument('--map', action='append', default=[], metavar='COLUMN=FIELD',
+                        help='validate COLUMN with FIELD, e.g. cpf=BRCPFField')
+    parser.add_argument('--format', choices=('csv', 'jsonl'),
+                        help='input and output format, by default from the input extension')
+    parser.add_argument('--output', help="normalized rows, '-' for stdout (default)")
+    parser.add_argument('--errors', help='CSV report of the invalid values')
+    parser.add_argument('--drop-invalid', action='store_true',
+                        help='do not write rows with invalid values')
+    parser.add_argument('--allow-blank', action='store_true',
+                        help='accept blank values')
+    parser.add_argument('--chunk-size', type=int, default=1000)
+    parser.add_argument('--workers', type=int, default=1,
+                        help='worker processes, 0 for one per CPU (default 1)')
+    args = parser.parse_args(argv)
+
+    _setup_django()
+    try:
+        fields = _parse_map(args.map, field_classes(), args.allow_blank)
+    except argparse.ArgumentTypeError as exc:
+        parser.error(str(exc))
+    if not fields:
+        parser.error('at least one --map is required')
+    format = args.format or ('jsonl' if args.input.endswith(('.jsonl', '.json')) else 'csv')
+
+    source = _open(args.input, 'r')
+    output = _open(args.output, 'w')
+    report = _open(args.errors, 'w') if args.errors else None
+    report_writer = None
+    if report is not None:
+        report_writer = csv.writer(report)
+        report_writer.writerow(['row', 'column', 'value', 'error'])
+
+    # the header, so that the output has the input columns even when rows
+    # have extra or missing fields
+    fieldnames = next(csv.reader(source), []) if format == 'csv' else None
+    writer = _Writer(output, format, fieldnames)
+    pool = validation_pool(args.workers) if args.workers != 1 else None
+    start = time.time()
+    try:
+        rows = read_rows(source, format, fieldnames)
+        # the original values of invalid columns are kept in the row
+        validated = validate_rows(rows, fields, args.chunk_size, pool)
+        total, invalid = _write_rows(validated, writer, report_writer, args.drop_invalid)
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+        for stream in (source, output, report):
+            if stream not in (None, sys.stdin, sys.stdout):
+                stream.close()
+
+    elapsed = time.time() - start
+    print('%d rows, %d invalid, %.0f rows/s' % (
+        total, invalid, total / elapsed if elapsed else 0), file=sys.stderr)
+    return 1 if invalid else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,84 @@
+"""
+Runs the field benchmarks and reports ops/sec, optionally as JSON and
+compared to the results of a previous run::
+
+    python runbenchmarks.py --output current.json --compare baseline.json
+"""
+import argparse
+import json
+import platform
+import sys
+
+
+def collect(number, repeat):
+    import django
+    import rest_framework
+
+    import rest_localflavor
+    from benchmarks import bench_fields
+
+    return {
+        'version': rest_localflavor.__version__,
+        'python': platform.python_version(),
+        'django': django.get_version(),
+        'djangorestframework': rest_framework.VERSION,
+        'number': number,
+        'repeat': repeat,
+        'results': bench_fields.run(number=number, repeat=repeat),
+    }
+
+
+def compare(report, baseline, max_regression=None):
+    """
+    Prints the change of every result against ``baseline``, returns the
+    number of results slower than ``max_regression`` percent.
+    """
+    previous = dict(((r['name'], r['case']), r['ops_per_sec'])
+                    for r in baseline['results'])
+    regressions = 0
+    for result in report['results']:
+        before = previous.get((result['name'], result['case']))
+        if not before:
+            continue
+        change = (result['ops_per_sec'] - before) * 100.0 / before
+        result['change'] = change
+        if max_regression is not None and change < -max_regression:
+            regressions += 1
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--number', type=int, default=2000,
+                        help='calls per input in each run')
+    parser.add_argument('--repeat', type=int, default=5,
+                        help='runs per benchmark, the best one is kept')
+    parser.add_argument('--output', help='write the results as JSON to this file')
+    parser.add_argument('--compare', help='JSON results of a previous run')
+    parser.add_argument('--max-regression', type=float,
+                        help='fail if a benchmark is this percent slower than --compare')
+    args = parser.parse_args(argv)
+
+    report = collect(args.number, args.repeat)
+    regressions = 0
+    if args.compare:
+        with open(args.compare) as baseline:
+            regressions = compare(report, json.load(baseline), args.max_regression)
+
+    for result in report['results']:
+        line = '%(name)-35s %(case)-10s %(ops_per_sec)12.0f ops/s' % result
+        if 'change' in result:
+            line += '  %+6.1f%%' % result['change']
+        print(line)
+
+    if args.output:
+        with open(args.output, 'w') as output:
+            json.dump(report, output, indent=2, sort_keys=True)
+
+    if regressions:
+        print('%d benchmark(s) regressed more than %s%%' % (regressions, args.max_regression))
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
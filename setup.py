@@ -41,6 +41,9 @@ setup(
     include_package_data=True,
     install_requires=[
     ],
+    extras_require={
+        'numpy': ['numpy'],
+    },
     license="BSD",
     zip_safe=False,
     keywords='django-rest-localflavor',
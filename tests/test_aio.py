@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+import sys
+import unittest
+
+from django.test import TestCase
+
+from rest_localflavor.br import serializers as br
+from rest_localflavor.ca import serializers as ca
+from rest_localflavor.us import serializers as us
+
+from . import test_batch
+
+if sys.version_info >= (3, 6):
+    import asyncio
+    from concurrent.futures import ThreadPoolExecutor
+
+    from rest_localflavor import aio
+
+
+@unittest.skipIf(sys.version_info < (3, 6), 'requires Python 3.6')
+class AsyncValidateManyTest(TestCase):
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+
+    def tearDown(self):
+        self.loop.close()
+
+    def run_async(self, awaitable):
+        return self.loop.run_until_complete(awaitable)
+
+    def test_matches_validate_many(self):
+        for field_class, values in test_batch.ValidateManyTest.samples:
+            for field in (field_class(), field_class(allow_blank=True)):
+                expected = field.validate_many(values * 3)
+                result = self.run_async(aio.avalidate_all(field, values * 3, chunk_size=2))
+                self.assertEqual(result.values, expected.values)
+                self.assertEqual(result.errors, expected.errors)
+
+    def test_incremental(self):
+        iterator = br.BRCPFField().avalidate_many(
+            ['663.256.017-26', '489.294.654-54', 'x'], chunk_size=1)
+        self.assertEqual(self.run_async(iterator.__anext__()), ('663.256.017-26', None))
+        self.assertEqual(self.run_async(iterator.__anext__()), (None, 'invalid'))
+        self.assertEqual(self.run_async(iterator.__anext__()), (None, 'digits_only'))
+        with self.assertRaises(StopAsyncIteration):
+            self.run_async(iterator.__anext__())
+
+    def test_async_iterable_source(self):
+        class Source(object):
+            def __init__(self, values):
+                self.values = iter(values)
+
+            def __aiter__(self):
+                return self
+
+            def __anext__(self):
+                future = self.loop.create_future()
+                try:
+                    future.set_result(next(self.values))
+                except StopIteration:
+                    future.set_exception(StopAsyncIteration())
+                return future
+
+        source = Source(['calif', 'XX', 'ny'])
+        source.loop = self.loop
+        result = self.run_async(aio.avalidate_all(us.USStateField(), source, chunk_size=2))
+        self.assertEqual(result.values, ['CA', None, 'NY'])
+        self.assertEqual(result.errors, [None, 'invalid', None])
+
+    def test_executor(self):
+        field = ca.CAPostalCodeField(max_length=3)
+        with ThreadPoolExecutor(1) as executor:
+            result = self.run_async(aio.avalidate_all(field, ['K1N 5J9', 'k1n'],
+                                                      executor=executor))
+        self.assertEqual(result.errors, field.validate_many(['K1N 5J9', 'k1n']).errors)
+
+    def test_loop_not_blocked(self):
+        ticks = []
+
+        def tick():
+            ticks.append(None)
+            handles.append(self.loop.call_soon(tick))
+
+        handles = [self.loop.call_soon(tick)]
+        result = self.run_async(aio.avalidate_all(
+            br.BRCPFField(), ['663.256.017-26'] * 20000, chunk_size=5000))
+        handles[-1].cancel()
+        self.assertEqual(result.invalid_count, 0)
+        self.assertGreater(len(ticks), 1)
@@ -0,0 +1,214 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from django.test import TestCase
+
+from rest_framework.exceptions import ValidationError
+
+from rest_localflavor import instrumentation
+from rest_localflavor.batch import BatchResult, ValidationResult, validate_many, validation_pool
+from rest_localflavor.br import serializers as br
+from rest_localflavor.ca import serializers as ca
+from rest_localflavor.us import serializers as us
+
+
+class ValidateManyTest(TestCase):
+    samples = (
+        (br.BRStateField, ['DF', 'go', 'TX', '', None]),
+        (br.BRCPFField, ['663.256.017-26', '66325601726', '489.294.654-54',
+                         '375.788.573-XX', '123.456.78', '', None]),
+        (br.BRCNPJField, ['64.132.916/0001-88', '12.345.678/9012-10',
+                          '64.132.916/0001-XX', '641329160001', '']),
+        (br.BRZipCodeField, ['73.360-610', '73360610', '70.000-0000', '']),
+        (br.BRPhoneNumberField, ['(41) 3562 3464', '41.93562.3464',
+                                 '+55-41-3562-3464', '']),
+        (ca.CAPostalCodeField, ['K1N 5J9', 'k1n5j9', 'DDD 111', '', None]),
+        (ca.CAPhoneNumberField, ['(123) 123 1234', '+1 123-123-1234', '']),
+        (ca.CAProvinceField, ['pei', 'Quebec', 'XX', '']),
+        (ca.CASocialInsuranceNumberField, ['046-454-286', '111-222-333',
+                                           '046 454 286', '']),
+        (us.USStateField, ['calif', 'CA', 'XX', '', None]),
+        (us.USZipCodeField, ['20500', '20500-0003', '2050', '', None]),
+        (us.USPhoneNumberField, ['(312) 555-1212', '1-312-555-1212', '555-1212', '']),
+    )
+
+    def assertMatchesRunValidation(self, field, values):
+        result = field.validate_many(values)
+        self.assertIsInstance(result, BatchResult)
+        self.assertEqual(len(result), len(values))
+        for value, (output, error) in zip(values, result):
+            try:
+                expected = field.run_validation(value)
+            except ValidationError:
+                self.assertIsNone(output)
+                self.assertIsNotNone(error, value)
+            else:
+                self.assertIsNone(error, value)
+                self.assertEqual(output, expected)
+
+    def test_matches_run_validation(self):
+        for field_class, values in self.samples:
+            self.assertMatchesRunValidation(field_class(), values)
+            self.assertMatchesRunValidation(field_class(allow_blank=True), values)
+
+    def test_error_codes(self):
+        result = validate_many(br.BRCPFField(), [
+            '663.256.017-26', '489.294.654-54', '375.788.573-XX', '123.456.78'])
+        self.assertEqual(result.errors, [None, 'invalid', 'digits_only', 'max_digits'])
+        self.assertEqual(result.values, ['663.256.017-26', None, None, None])
+        self.assertEqual(result.invalid_count, 3)
+
+    def test_validator_errors(self):
+        field = ca.CAPostalCodeField(max_length=3)
+        result = field.validate_many(['K1N 5J9'])
+        self.assertEqual(result.values, [None])
+        self.assertIsNotNone(result.errors[0])
+
+    def test_field_left_untouched(self):
+        field = us.USStateField()
+        field.validate_many(['XX'])
+        with self.assertRaises(ValidationError):
+            field.run_validation('XX')
+
+
+class NoValidationError(ValidationError):
+    def __init__(self, *args, **kwargs):
+        raise AssertionError('ValidationError built')
+
+
+class CheckTest(TestCase):
+    samples = ValidateManyTest.samples
+
+    def test_matches_run_validation(self):
+        for field_class, values in self.samples:
+            field = field_class()
+            for value in values:
+                result = field.check(value)
+                self.assertIsInstance(result, ValidationResult)
+                try:
+                    expected = field.run_validation(value)
+                except ValidationError as exc:
+                    self.assertFalse(result.valid, value)
+                    self.assertIsNone(result.value)
+                    self.assertEqual(result.message(), exc.detail[0])
+                else:
+                    self.assertTrue(result.valid, value)
+                    self.assertEqual(result.value, expected)
+                    self.assertIsNone(result.message())
+
+    def test_error_codes(self):
+        field = br.BRCPFField()
+        self.assertEqual(field.check('375.788.573-XX').code, 'digits_only')
+        self.assertEqual(field.check('375.788.573-XX').message(), 'This field requires only numbers.')
+        self.assertEqual(br.BRStateField().check('TX').code, 'invalid_choice')
+        self.assertEqual(ca.CAPostalCodeField().check('').code, 'blank')
+        self.assertEqual(ca.CAPostalCodeField(max_length=3).check('K1N 5J9').code, 'max_length')
+
+    def test_no_exceptions(self):
+        from rest_framework import fields
+        samples = ((br.BRCPFField, '489.294.654-54'),
+                   (br.BRStateField, 'TX'),
+                   (ca.CASocialInsuranceNumberField, '111-222-333'),
+                   (us.USZipCodeField, '2050'))
+        for field_class, value in samples:
+            with self.assertRaises(ValidationError):
+                field_class().run_validation(value)
+        self.addCleanup(setattr, fields, 'ValidationError', fields.ValidationError)
+        fields.ValidationError = NoValidationError
+        for field_class, value in samples:
+            self.assertFalse(field_class().check(value))
+            self.assertEqual(field_class().validate_many([value]).invalid_count, 1)
+
+    def test_instrumented(self):
+        calls = []
+        instrumentation.enable(lambda *call: calls.append(call[:2]))
+        self.addCleanup(instrumentation.disable)
+        self.assertEqual(us.USStateField().check('XX').code, 'invalid')
+        self.assertEqual(calls, [('USStateField', 'invalid')])
+
+    def test_messages(self):
+        field = br.BRCPFField()
+        values = ['663.256.017-26', '375.788.573-XX']
+        result = field.validate_many(values)
+        self.assertEqual(result.messages(field), [None, 'This field requires only numbers.'])
+        field = br.BRStateField(error_messages={'invalid_choice': '{input} is not a state.'})
+        result = field.validate_many(['TX'])
+        self.assertEqual(result.messages(field, ['TX']), ['TX is not a state.'])
+
+
+class InputLengthTest(TestCase):
+    codes = {
+        br.BRStateField: 'invalid_choice',
+        br.BRCPFField: 'max_digits',
+        br.BRCNPJField: 'max_digits',
+    }
+
+    def test_oversized(self):
+        for field_class, values in ValidateManyTest.samples:
+            field = field_class()
+            limit = field.max_input_length
+            self.assertIn(limit, (64, 100))
+            code = self.codes.get(field_class, 'invalid')
+            for value in ('9' * (limit + 1), ' ' * limit + values[0], '9' * 10 ** 6):
+                self.assertEqual(field.check(value).code, code, field_class)
+                with self.assertRaises(ValidationError):
+                    field.run_validation(value)
+
+    def test_bound(self):
+        field = br.BRCPFField()
+        self.assertEqual(field.check('663.256.017-26' + ' ' * 50).code, 'max_digits')
+        self.assertEqual(field.check('6' * 64).code, 'max_digits')
+        self.assertEqual(field.check('x' * 64).code, 'digits_only')
+        self.assertEqual(field.check('x' * 65).code, 'max_digits')
+        self.assertTrue(us.USStateField().check(' ' * 90 + 'calif'))
+
+    def test_integers(self):
+        self.assertEqual(ca.CAPhoneNumberField().check(10 ** 5000).code, 'invalid')
+        self.assertEqual(us.USZipCodeField().check(-10 ** 64).code, 'invalid')
+        self.assertEqual(us.USZipCodeField().check(20500).value, '20500')
+        self.assertEqual(br.BRCPFField().check(10 ** 5000).code, 'invalid')
+
+    def test_unbounded(self):
+        field = ca.CAPostalCodeField()
+        field.max_input_length = None
+        self.assertEqual(field.check(' ' * 100 + 'K1N 5J9').value, 'K1N 5J9')
+        self.assertEqual(ca.CAPostalCodeField().check(' ' * 100 + 'K1N 5J9').code, 'invalid')
+
+
+class ParallelValidateManyTest(TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super(ParallelValidateManyTest, cls).setUpClass()
+        cls.pool = validation_pool(2)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.pool.close()
+        cls.pool.join()
+        super(ParallelValidateManyTest, cls).tearDownClass()
+
+    def test_matches_serial(self):
+        for field_class, values in ValidateManyTest.samples:
+            for field in (field_class(), field_class(allow_blank=True)):
+                serial = field.validate_many(values * 3)
+                parallel = field.validate_many(values * 3, pool=self.pool, chunk_size=2)
+                self.assertEqual(parallel.values, serial.values)
+                self.assertEqual(parallel.errors, serial.errors)
+
+    def test_field_options(self):
+        field = ca.CAPostalCodeField(max_length=3)
+        result = field.validate_many(['K1N 5J9', 'K1N 5J9'], pool=self.pool)
+        self.assertEqual(result.values, [None, None])
+        self.assertEqual(result.errors, field.validate_many(['K1N 5J9'] * 2).errors)
+
+    def test_own_pool(self):
+        values = ['663.256.017-26', '489.294.654-54', 'x', ''] * 10
+        result = validate_many(br.BRCPFField(), iter(values), workers=2)
+        self.assertEqual(result.errors, validate_many(br.BRCPFField(), values).errors)
+
+    def test_empty(self):
+        self.assertEqual(len(validate_many(us.USStateField(), [], pool=self.pool)), 0)
+
+    def test_workers(self):
+        self.assertEqual(self.pool.workers, 2)
@@ -7,6 +7,8 @@ from rest_framework import serializers as drf_serializers
 
 from rest_localflavor.test.testcases import DRFTestCase
 from rest_localflavor.br import serializers
+from rest_localflavor.br.cep_ranges import CEP_RANGES, cep_state
+from rest_localflavor.br.validators import BRZipCodeStateValidator
 
 
 class BRStateFieldTest(TestCase):
@@ -43,6 +45,27 @@ class BRStateFieldTest(TestCase):
         self.assertEqual(exc_info.exception.detail,
                          self.invalid_inputs.get("TX"))
 
+    def test_valid_states(self):
+        field = serializers.BRStateField()
+        for value, expected in (("DF", "df"), ("df", "df"), ("Goias", "go"),
+                                ("Goiás", "go"), ("GOIÁS", "go"), (" sp ", "sp"),
+                                ("sao paulo", "sp"), ("Distrito Federal", "df")):
+            self.assertEqual(field.run_validation(value), expected)
+
+    def test_shared_choices(self):
+        field, other = serializers.BRStateField(), serializers.BRStateField()
+        self.assertIs(field.choice_strings_to_values, other.choice_strings_to_values)
+        self.assertEqual(len(field.choices), 27)
+        self.assertEqual(field.choices["go"], "Goiás")
+        self.assertEqual(field.to_representation("sp"), "sp")
+
+    def test_custom_choices(self):
+        field = serializers.BRStateField(choices=(("sp", "São Paulo"),))
+        self.assertEqual(field.run_validation("sp"), "sp")
+        for value in ("SP", "go"):
+            with self.assertRaises(drf_serializers.ValidationError):
+                field.run_validation(value)
+
 
 class BRCPFFieldTest(TestCase):
     def setUp(self):
@@ -105,6 +128,13 @@ class BRCPFFieldTest(TestCase):
         self.assertEqual(exc_info.exception.detail,
                          self.invalid.get("123.456.78"))
 
+    def test_unicode_verifier_digits_cpf(self):
+        field = serializers.BRCPFField()
+        for value in ("٦٦٣٢٥٦٠١٧٢٦", "6632560172６"):
+            with self.assertRaises(drf_serializers.ValidationError) as exc_info:
+                field.run_validation(value)
+            self.assertEqual(exc_info.exception.detail, ['Invalid CPF number.'])
+
     def test_valid_cpf(self):
         field = serializers.BRCPFField()
         output = field.run_validation("663.256.017-26")
@@ -158,6 +188,14 @@ class BRCNPJFieldTest(TestCase):
                          self.invalid.get("64.132.916/0001-XX"))
 
 
+    def test_unicode_verifier_digits_cnpj(self):
+        field = serializers.BRCNPJField()
+        for value in ("٦٤١٣٢٩١٦٠٠٠١٨٨", "6413291600018８"):
+            with self.assertRaises(drf_serializers.ValidationError) as exc_info:
+                field.run_validation(value)
+            self.assertEqual(exc_info.exception.detail, ['Invalid CNPJ number.'])
+
+
 class BRZipCodeFieldTest(TestCase):
     def setUp(self):
         self.error_invalid = ['Enter a zip code in the format XXXXX-XXX, XX.XXX-XXX or XXXXXXXX.']
@@ -243,3 +281,49 @@ class BRPhoneNumberFieldTest(DRFTestCase):
 
     def test_valid(self):
         self.assertFieldOutput(serializers.BRPhoneNumberField, self.valid, self.invalid)
+
+
+class BRZipCodeStateValidatorTest(TestCase):
+    def serializer(self, data):
+        class AddressSerializer(drf_serializers.Serializer):
+            cep = serializers.BRZipCodeField(allow_blank=True)
+            uf = serializers.BRStateField(allow_blank=True)
+
+            class Meta:
+                validators = [BRZipCodeStateValidator('cep', 'uf')]
+
+        return AddressSerializer(data=data)
+
+    def test_cep_state(self):
+        for cep, state in (('01310-100', 'sp'), ('20040-020', 'rj'), ('70.040-010', 'df'),
+                           ('73000000', 'df'), ('72900000', 'go'), ('69301000', 'rr'),
+                           ('69400000', 'am'), ('99999-999', 'rs'), ('00999-999', None),
+                           ('78900-000', None), ('7336061', None), ('abcde-fgh', None)):
+            self.assertEqual(cep_state(cep), state, cep)
+
+    def test_ranges(self):
+        from rest_localflavor.br.br_states import REGIONS
+        for (_, last, _), (first, _, _) in zip(CEP_RANGES, CEP_RANGES[1:]):
+            self.assertLess(last, first)
+        self.assertEqual(set(state for _, _, state in CEP_RANGES),
+                         set(region.code for region in REGIONS))
+
+    def test_valid(self):
+        for state in ('sp', 'SP', 'São Paulo', 'sao paulo'):
+            serializer = self.serializer({'cep': '01310-100', 'uf': state})
+            self.assertTrue(serializer.is_valid(), serializer.errors)
+        self.assertTrue(self.serializer({'cep': '', 'uf': 'sp'}).is_valid())
+
+    def test_invalid(self):
+        serializer = self.serializer({'cep': '01310-100', 'uf': 'rj'})
+        self.assertFalse(serializer.is_valid())
+        self.assertEqual(serializer.errors, {
+            'cep': ['The zip code 01310-100 is not from the state rj.']})
+        self.assertFalse(self.serializer({'cep': '78900-000', 'uf': 'mt'}).is_valid())
+
+    def test_message(self):
+        validator = BRZipCodeStateValidator('cep', 'uf', message='{postal_code}/{region}')
+        with self.assertRaises(drf_serializers.ValidationError) as exc_info:
+            validator({'cep': '01310-100', 'uf': 'Bahia'})
+        self.assertEqual(exc_info.exception.detail, {'cep': ['01310-100/Bahia']})
+        validator({'cep': '40000-000', 'uf': 'Bahia'})
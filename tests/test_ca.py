@@ -2,9 +2,13 @@
 from __future__ import unicode_literals
 
 from rest_localflavor.test.testcases import DRFTestCase
+from rest_framework import serializers as drf_serializers
 from rest_framework.exceptions import ValidationError
 
 from rest_localflavor.ca import serializers
+from rest_localflavor.ca.ca_provinces import PROVINCE_CHOICES
+from rest_localflavor.ca.postal_codes import LETTER_PROVINCES, in_province, postal_code_provinces
+from rest_localflavor.ca.validators import CAPostalCodeProvinceValidator
 
 
 class FieldtestMixin(object):
@@ -90,6 +94,8 @@ class CAProvinceFieldTest(DRFTestCase, FieldtestMixin):
             'pe': 'PE',
             'pei': 'PE',
             'p.e.i.': 'PE',
+            ' British Columbia ': 'BC',
+            'QUEBEC': 'QC',
         }
 
         self.invalid = {
@@ -98,6 +104,11 @@ class CAProvinceFieldTest(DRFTestCase, FieldtestMixin):
             'a': error_invalid,
             'XX': error_invalid,
             'AZ': error_invalid,
+            # only case and surrounding whitespace are ignored
+            'P.E.I': error_invalid,
+            '.bc': error_invalid,
+            'British-Columbia': error_invalid,
+            'Québec': error_invalid,
         }
 
 
@@ -120,3 +131,47 @@ class CASocialInsuranceNumberFieldTest(DRFTestCase, FieldtestMixin):
             'xxx/yyy/zzz': error_invalid,
             '046 454 286': error_invalid,
         }
+
+
+class CAPostalCodeProvinceValidatorTest(DRFTestCase):
+    def serializer(self, data):
+        class AddressSerializer(drf_serializers.Serializer):
+            postal_code = serializers.CAPostalCodeField()
+            province = serializers.CAProvinceField()
+
+            class Meta:
+                validators = [CAPostalCodeProvinceValidator('postal_code', 'province')]
+
+        return AddressSerializer(data=data)
+
+    def test_postal_code_provinces(self):
+        for postal_code, provinces in (('K1N 5J9', ('ON',)), ('h2x1y4', ('QC',)),
+                                       ('X0A 0H0', ('NU',)), ('X1A 2L9', ('NT',)),
+                                       ('X9Z', ('NT', 'NU')), ('D1A', ()), ('1AB', ()),
+                                       ('', ())):
+            self.assertEqual(postal_code_provinces(postal_code), provinces, postal_code)
+
+    def test_in_province(self):
+        self.assertTrue(in_province('V6B 1A1', 'BC'))
+        self.assertFalse(in_province('V6B 1A1', 'AB'))
+        self.assertTrue(in_province('X9Z', 'NU'))
+        self.assertFalse(in_province('X0A 0H0', 'NT'))
+        self.assertFalse(in_province('W1A', 'ON'))
+        self.assertFalse(in_province('K1N', 'XX'))
+        self.assertFalse(in_province('', 'ON'))
+
+    def test_every_province(self):
+        codes = set(code for code, _ in PROVINCE_CHOICES)
+        self.assertEqual(set(sum(LETTER_PROVINCES.values(), ())), codes)
+
+    def test_valid(self):
+        for province in ('ON', 'Ontario', 'on'):
+            serializer = self.serializer({'postal_code': 'K1N 5J9', 'province': province})
+            self.assertTrue(serializer.is_valid(), serializer.errors)
+
+    def test_invalid(self):
+        serializer = self.serializer({'postal_code': 'K1N 5J9', 'province': 'Quebec'})
+        self.assertFalse(serializer.is_valid())
+        self.assertEqual(serializer.errors, {
+            'postal_code': ['The postal code K1N 5J9 is not from the province QC.']})
+        self.assertFalse(self.serializer({'postal_code': 'X0A 0H0', 'province': 'NT'}).is_valid())
@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+import threading
+
+from django.test import TestCase, override_settings
+
+from rest_framework.exceptions import ValidationError
+
+from rest_localflavor.br import serializers as br
+from rest_localflavor.ca import serializers as ca
+from rest_localflavor.cache import LRUCache, cache_stats, clear_caches
+from rest_localflavor.us import serializers as us
+
+
+class LRUCacheTest(TestCase):
+    def test_eviction(self):
+        cache = LRUCache(2)
+        cache.set('a', 1)
+        cache.set('b', 2)
+        self.assertEqual(cache.get('a'), 1)
+        cache.set('c', 3)  # evicts 'b', the least recently used
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(cache.get('c'), 3)
+        self.assertEqual(cache.stats(), {
+            'hits': 2, 'misses': 1, 'evictions': 1, 'size': 2, 'maxsize': 2})
+
+    def test_threads(self):
+        cache = LRUCache(50)
+
+        def work(offset):
+            for i in range(2000):
+                key = (i + offset) % 80
+                if cache.get(key) is None:
+                    cache.set(key, key)
+
+        threads = [threading.Thread(target=work, args=(n,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        stats = cache.stats()
+        self.assertEqual(stats['hits'] + stats['misses'], 16000)
+        self.assertLessEqual(len(cache), 50)
+
+
+class CachedFieldTest(TestCase):
+    samples = (
+        (br.BRZipCodeField, ['73.360-610', '70.000-0000', '']),
+        (br.BRPhoneNumberField, ['(41) 3562 3464', '411-9134-9435']),
+        (ca.CAPostalCodeField, ['k1n5j9', 'DDD 111', '']),
+        (ca.CAProvinceField, ['p.e.i.', 'XX', '']),
+        (us.USStateField, ['calif', 'XX', '']),
+    )
+
+    def setUp(self):
+        clear_caches()
+
+    def outcome(self, field, value):
+        try:
+            return field.run_validation(value), None
+        except ValidationError as exc:
+            return None, exc.detail
+
+    def test_same_results(self):
+        for field_class, values in self.samples:
+            plain = field_class()
+            for _ in range(2):
+                cached = field_class(cache_size=10)
+                for value in values:
+                    self.assertEqual(self.outcome(cached, value),
+                                     self.outcome(plain, value))
+        for stats in cache_stats():
+            self.assertEqual(stats['hits'], stats['misses'], stats)
+
+    def test_disabled_by_default(self):
+        us.USStateField().run_validation('CA')
+        self.assertEqual(cache_stats(), [])
+
+    @override_settings(REST_LOCALFLAVOR_CACHE={'DEFAULT_SIZE': 1, 'USStateField': 5})
+    def test_settings(self):
+        us.USStateField().run_validation('CA')
+        ca.CAProvinceField().run_validation('PE')
+        sizes = dict((s['field'], s['maxsize']) for s in cache_stats())
+        self.assertEqual(sizes, {'USStateField': 5, 'CAProvinceField': 1})
+
+    def test_options_and_validators(self):
+        us.USStateField(cache_size=5).run_validation('CA')
+        us.USStateField(cache_size=5, allow_blank=True).run_validation('CA')
+        us.USStateField(cache_size=5, validators=[]).run_validation('CA')
+        self.assertEqual(len(cache_stats()), 2)
+
+    def test_trim_whitespace(self):
+        br.BRZipCodeField(cache_size=10).run_validation(' 73.360-610')
+        field = br.BRZipCodeField(cache_size=10, trim_whitespace=False)
+        with self.assertRaises(ValidationError):
+            field.run_validation(' 73.360-610')
+        self.assertEqual(len(cache_stats()), 2)
+
+    def test_error_messages(self):
+        first = br.BRZipCodeField(cache_size=10, error_messages={'invalid': 'First'})
+        second = br.BRZipCodeField(cache_size=10, error_messages={'invalid': 'Second'})
+        self.assertEqual(self.outcome(first, '70.000-0000'), (None, ['First']))
+        self.assertEqual(self.outcome(second, '70.000-0000'), (None, ['Second']))
+        self.assertEqual(cache_stats(), [])
+
+    def test_batch(self):
+        field = us.USStateField(cache_size=5)
+        field.run_validation('CA')
+        result = field.validate_many(['CA', 'XX', 'XX'])
+        self.assertEqual(result.errors, [None, 'invalid', 'invalid'])
+        self.assertEqual(cache_stats()[0]['hits'], 2)
@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+import copy
+
+from django.test import TestCase
+
+from rest_framework import serializers
+from rest_framework.exceptions import ValidationError
+
+from rest_localflavor.ca.serializers import CAPostalCodeField, CAProvinceField
+from rest_localflavor.us.serializers import USStateField
+
+
+class BlankInvalidMixinTest(TestCase):
+    def test_class_level_messages(self):
+        field = CAProvinceField()
+        self.assertEqual(field.error_messages['blank'], field.error_messages['invalid'])
+        self.assertEqual(field.error_messages['null'], field.error_messages['invalid'])
+        self.assertIsNot(field.error_messages, CAProvinceField.default_error_messages)
+
+    def test_custom_invalid_message(self):
+        field = USStateField(error_messages={'invalid': 'Nope.'})
+        for value in ('', None, 'XX'):
+            with self.assertRaises(ValidationError) as exc_info:
+                field.run_validation(value)
+            self.assertEqual(exc_info.exception.detail, ['Nope.'])
+
+
+class ShallowCopyMixinTest(TestCase):
+    def test_copy_is_independent(self):
+        field = CAPostalCodeField(max_length=10, required=False)
+        clone = copy.deepcopy(field)
+        self.assertIsNot(clone, field)
+        self.assertEqual(clone.run_validation('k1n5j9'), 'K1N 5J9')
+        self.assertEqual(clone.max_length, 10)
+        self.assertFalse(clone.required)
+        self.assertIsNot(clone.validators, field.validators)
+        clone.validators.append(lambda value: None)
+        self.assertNotEqual(len(clone.validators), len(field.validators))
+
+    def test_bound_and_mutable_arguments_use_drf_copy(self):
+        class AddressSerializer(serializers.Serializer):
+            province = CAProvinceField()
+
+        bound = AddressSerializer().fields['province']
+        self.assertIsNone(copy.deepcopy(bound).parent)
+
+        field = USStateField(style={'base_template': 'input.html'})
+        clone = copy.deepcopy(field)
+        self.assertIsNot(clone._kwargs['style'], field._kwargs['style'])
+
+    def test_serializer(self):
+        class AddressSerializer(serializers.Serializer):
+            postal_code = CAPostalCodeField()
+            state = USStateField()
+
+        first = AddressSerializer(data={'postal_code': 'k1n5j9', 'state': 'calif'})
+        second = AddressSerializer(data={'postal_code': 'DDD 111', 'state': 'XX'})
+        self.assertTrue(first.is_valid())
+        self.assertEqual(first.validated_data, {'postal_code': 'K1N 5J9', 'state': 'CA'})
+        self.assertFalse(second.is_valid())
+        self.assertEqual(set(second.errors), {'postal_code', 'state'})
+        self.assertIsNot(first.fields['state'], second.fields['state'])
+
+    def test_error_messages_are_per_instance(self):
+        class AddressSerializer(serializers.Serializer):
+            state = USStateField()
+
+        first = AddressSerializer(data={})
+        first.fields['state'].error_messages['required'] = 'custom for a'
+        first.fields['state']._kwargs['help_text'] = 'changed'
+        second = AddressSerializer(data={})
+        self.assertFalse(second.is_valid())
+        self.assertEqual(second.errors['state'], ['This field is required.'])
+        declared = AddressSerializer._declared_fields['state']
+        self.assertEqual(declared.error_messages['required'], 'This field is required.')
+        self.assertNotIn('help_text', declared._kwargs)
@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+import random
+
+from rest_localflavor.test import fuzz
+from rest_localflavor.test.testcases import DRFTestCase
+
+
+class FuzzTest(DRFTestCase):
+    def test_fields_match_references(self):
+        for name in sorted(fuzz.CASES):
+            self.assertMatchesReference(name, inputs=1000)
+
+    def test_every_field_has_a_case(self):
+        from rest_localflavor.batch import field_classes
+        self.assertEqual(set(fuzz.CASES), set(field_classes()))
+
+    def test_detects_mismatches(self):
+        from rest_localflavor.ca import serializers
+        luhn = serializers.luhn
+        self.addCleanup(setattr, serializers, 'luhn', luhn)
+        serializers.luhn = lambda number: luhn(number[:-1] + '0')
+        report = fuzz.fuzz('CASocialInsuranceNumberField', budget=float('inf'), max_inputs=500)
+        self.assertGreater(report.mismatch_count, 0)
+        value, expected, actual = report.mismatches[0]
+        self.assertNotEqual(expected, actual)
+
+    def test_report(self):
+        report = fuzz.fuzz('USZipCodeField', budget=float('inf'), max_inputs=200, chunk_size=64)
+        self.assertEqual(report.inputs, 200)
+        self.assertGreater(report.reference_rate, 0)
+        self.assertGreater(report.field_rate, 0)
+        self.assertIn('USZipCodeField', str(report))
+
+    def test_seeded(self):
+        generate = fuzz.CASES['BRCPFField'].generator
+        runs = []
+        for _ in range(2):
+            rnd = random.Random(7)
+            runs.append([generate(rnd) for _ in range(50)])
+        self.assertEqual(runs[0], runs[1])
+        self.assertGreater(len(set(runs[0])), 40)
@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+import re
+
+try:
+    from unittest import mock
+except ImportError:
+    import mock
+
+from django.test import TestCase
+from django.utils.six import StringIO
+
+from rest_localflavor.br.serializers import BRCNPJField, BRCPFField
+from rest_localflavor.ca.serializers import CAPostalCodeField, CASocialInsuranceNumberField
+from rest_localflavor.test import generators
+
+
+class GeneratorsTest(TestCase):
+    fields = {
+        'cpf': BRCPFField,
+        'cnpj': BRCNPJField,
+        'sin': CASocialInsuranceNumberField,
+        'ca_postal_code': CAPostalCodeField,
+    }
+
+    def test_every_generator_has_a_field(self):
+        self.assertEqual(set(self.fields), set(generators.GENERATORS))
+
+    def test_round_trip(self):
+        for name, field_class in sorted(self.fields.items()):
+            field = field_class()
+            for value in generators.generate(name, count=5000, seed=1):
+                self.assertEqual(field.check(value).value, value, (name, value))
+
+    def test_bare(self):
+        for name in ('cpf', 'cnpj', 'ca_postal_code'):
+            field = self.fields[name]()
+            for value in generators.generate(name, count=2000, seed=2, formatted=False):
+                self.assertTrue(re.match(r'^[0-9A-Z]+$', value), value)
+                self.assertTrue(field.check(value), (name, value))
+        field = CASocialInsuranceNumberField()
+        for value in generators.generate('sin', count=2000, seed=2, formatted=False):
+            self.assertTrue(field.check('%s-%s-%s' % (value[:3], value[3:6], value[6:])))
+
+    def test_invalid(self):
+        for name, field_class in sorted(self.fields.items()):
+            field = field_class()
+            values = list(generators.generate(name, count=2000, seed=3, invalid=0.25))
+            invalid = [value for value in values if not field.check(value)]
+            self.assertTrue(350 < len(invalid) < 650, (name, len(invalid)))
+            values = generators.generate(name, count=500, seed=3, invalid=1)
+            self.assertFalse(any(field.check(value) for value in values), name)
+
+    def test_invalid_share(self):
+        for invalid in (-0.1, 1.5, float('nan')):
+            with self.assertRaises(ValueError):
+                generators.generate('cpf', count=1, invalid=invalid)
+        for invalid in ('-0.1', '1.5', 'nan', 'x'):
+            with mock.patch('sys.stderr', new_callable=StringIO) as stderr:
+                with self.assertRaises(SystemExit):
+                    generators.main(['cpf', '--invalid', invalid])
+            self.assertIn("argument --invalid: expected a number between 0 and 1, got '%s'" % invalid,
+                          stderr.getvalue())
+
+    def test_main(self):
+        with mock.patch('sys.stdout', new_callable=StringIO) as stdout:
+            generators.main(['cpf', '--count', '3', '--seed', '1', '--invalid', '0.5'])
+        self.assertEqual(stdout.getvalue().splitlines(),
+                         list(generators.generate('cpf', count=3, seed=1, invalid=0.5)))
+
+    def test_seeded(self):
+        for name in sorted(generators.GENERATORS):
+            values = list(generators.generate(name, count=1500, seed=4, chunk_size=1000))
+            self.assertEqual(values, list(generators.generate(name, count=1500, seed=4)))
+            self.assertEqual(len(values), 1500)
+            self.assertGreater(len(set(values)), 1400)
+            self.assertNotEqual(values, list(generators.generate(name, count=1500, seed=5)))
+
+    def test_endless(self):
+        values = generators.generate('cpf', chunk_size=10)
+        self.assertEqual(len([next(values) for _ in range(25)]), 25)
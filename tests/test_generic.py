@@ -1,7 +1,19 @@
 
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+import random
+import re
+
 from django.test import TestCase
+from django.utils import six
 
-from rest_localflavor.generic.checksums import luhn
+from rest_localflavor.generic import checksums
+from rest_localflavor.generic.checksums import CNPJ, CPF, luhn
+from rest_localflavor.generic.normalize import LazyIndex, build_index, fold, lookup
+from rest_localflavor.generic.phones import WHITESPACE, PhoneRule, normalize_phone
+from rest_localflavor.generic.regions import (
+    CONTIGUOUS, OBSOLETE, STATE, TERRITORY, Region, RegionRegistry)
 
 
 class LuhnChecksumTestCase(TestCase):
@@ -24,3 +36,278 @@ class LuhnChecksumTestCase(TestCase):
     def test_invalid_values(self):
         for value in self.invalid_values:
             self.assertEqual(luhn(value), False)
+
+    def test_edge_cases(self):
+        self.assertIs(luhn(''), True)
+        self.assertIs(luhn(18), True)
+        self.assertIs(luhn(0), True)
+        self.assertIs(luhn('٧٩٩٢٧٣٩٨٧١٣'), True)
+        for value in (-18, True, 18.0, '1 8', '+18', '1_8', '18\x00', '²', b'18', None):
+            self.assertIs(luhn(value), False, repr(value))
+        # beyond the digits str() of an int accepts on recent Pythons
+        value = (10 ** 6000 - 1) // 99 * 18
+        self.assertIs(luhn(value), True)
+        self.assertIs(luhn(value + 1), False)
+
+    def test_matches_reference(self):
+        from rest_localflavor.test.fuzz import UNICODE_DIGITS, _luhn
+        rnd = random.Random(0)
+        for _ in range(5000):
+            digits = rnd.choice(('0123456789', rnd.choice(UNICODE_DIGITS)))
+            value = ''.join(rnd.choice(digits) for _ in range(rnd.randrange(30)))
+            self.assertEqual(luhn(value), _luhn(value), value)
+            if digits == '0123456789' and value:
+                self.assertEqual(luhn(int(value)), _luhn(value), value)
+
+
+class CheckDigitsTestCase(TestCase):
+    def test_cpf(self):
+        for value in ['66325601726', '37578857320', '84828509895', '00000000000']:
+            self.assertTrue(CPF.is_valid(value))
+        for value in ['48929465454', '66325601727', '6632560172', 'abcdefghijk', '+6325601726']:
+            self.assertFalse(CPF.is_valid(value))
+
+    def test_cnpj(self):
+        self.assertTrue(CNPJ.is_valid('64132916000188'))
+        for value in ['12345678901210', '64132916000189', '6413291600018', '641329160001XX']:
+            self.assertFalse(CNPJ.is_valid(value))
+
+    def test_unicode_digits(self):
+        # like the str() comparison of the old fields, the verifier digits
+        # must be ASCII ones while the others may be any decimal digit
+        values = ['٦٦٣٢٥٦٠١٧26', '٦٦٣٢٥٦٠١٧٢٦', '6632560172６', '²' * 11]
+        self.assertEqual([CPF.is_valid(value) for value in values], [True, False, False, False])
+        self.assertEqual(CPF.is_valid_many(values), [True, False, False, False])
+        self.assertFalse(CNPJ.is_valid('641329160001٨٨'))
+
+    def test_check_digits(self):
+        self.assertEqual(CPF.compute('663256017'), '26')
+        self.assertEqual(CNPJ.compute('641329160001'), '88')
+        self.assertEqual(CPF.compute('٦٦٣٢٥٦٠١٧'), '26')
+
+
+class CheckDigitAlgorithmTestCase(TestCase):
+    valid = {
+        'luhn': ['79927398713', 79927398713, '046454286', '0'],
+        'verhoeff': ['2363', '12340', '0'],
+        'damm': ['5724', '0'],
+        'mod97_10': ['79444', '3214282912345698765432161182'],
+        'cpf': ['66325601726', '00000000000', '٦٦٣٢٥٦٠١٧26'],
+        'cnpj': ['64132916000188'],
+    }
+
+    def test_known_values(self):
+        for name, values in self.valid.items():
+            algorithm = checksums.ALGORITHMS[name]
+            for value in values:
+                self.assertTrue(algorithm.is_valid(value), (name, value))
+            self.assertEqual(algorithm.is_valid_many(values), [True] * len(values))
+
+    def test_compute(self):
+        self.assertEqual(checksums.LUHN.compute('7992739871'), '3')
+        self.assertEqual(checksums.VERHOEFF.compute('236'), '3')
+        self.assertEqual(checksums.DAMM.compute('572'), '4')
+        self.assertEqual(checksums.MOD97_10.compute('794'), '44')
+        self.assertEqual(checksums.MOD97_10.compute('32142829123456987654321611'), '82')
+        self.assertEqual(checksums.CPF.compute('663256017'), '26')
+        self.assertEqual(checksums.CNPJ.compute_many(['641329160001', 641329160001]), ['88', '88'])
+        with self.assertRaises(ValueError):
+            checksums.CPF.compute('6632560172')
+        with self.assertRaises(ValueError):
+            checksums.DAMM.compute('57a')
+
+    def test_round_trip(self):
+        rnd = random.Random(0)
+        for name, algorithm in sorted(checksums.ALGORITHMS.items()):
+            size = {'cpf': 9, 'cnpj': 12}.get(name)
+            for _ in range(300):
+                payload = ''.join(rnd.choice('0123456789') for _ in range(size or rnd.randrange(1, 40)))
+                value = payload + algorithm.compute(payload)
+                self.assertTrue(algorithm.is_valid(value), (name, value))
+                if isinstance(algorithm, checksums.Mod11):
+                    continue
+                # a single digit error is always detected
+                index = rnd.randrange(len(value))
+                digit = '%d' % ((int(value[index]) + rnd.randrange(1, 10)) % 10)
+                self.assertFalse(algorithm.is_valid(value[:index] + digit + value[index + 1:]), name)
+
+    def test_transpositions(self):
+        rnd = random.Random(1)
+        for algorithm in (checksums.VERHOEFF, checksums.DAMM, checksums.MOD97_10):
+            for _ in range(300):
+                payload = ''.join(rnd.choice('0123456789') for _ in range(rnd.randrange(2, 20)))
+                value = payload + algorithm.compute(payload)
+                index = rnd.randrange(len(value) - 1)
+                if value[index] != value[index + 1]:
+                    swapped = value[:index] + value[index + 1] + value[index] + value[index + 2:]
+                    self.assertFalse(algorithm.is_valid(swapped), (algorithm, value))
+
+    def test_matches_existing(self):
+        from rest_localflavor.test.fuzz import CPF_WEIGHTS, _mod11_valid
+        rnd = random.Random(2)
+        for _ in range(2000):
+            value = ''.join(rnd.choice('0123456789') for _ in range(rnd.randrange(1, 20)))
+            self.assertEqual(checksums.LUHN.is_valid(value), luhn(value), value)
+            value = '%011d' % rnd.randrange(10 ** 11)
+            self.assertEqual(CPF.is_valid(value), _mod11_valid(value, CPF_WEIGHTS), value)
+
+    def test_batches(self):
+        # the ASCII strings of a batch are decoded at once, anything else
+        # one by one: the results are the same as value by value
+        rnd = random.Random(3)
+        alphabet = '0123456789' * 3 + 'x \n\x05٣²'
+        for algorithm in checksums.ALGORITHMS.values():
+            for _ in range(50):
+                values = [''.join(rnd.choice(alphabet) for _ in range(rnd.randrange(16)))
+                          for _ in range(rnd.randrange(8))]
+                if rnd.random() < 0.2:
+                    values.append(rnd.choice((None, 79927398713, b'0', True)))
+                self.assertEqual(algorithm.is_valid_many(iter(values)),
+                                 [algorithm.is_valid(value) for value in values], values)
+            payloads = ['%d' % rnd.randrange(10 ** 9) for _ in range(20)]
+            self.assertEqual(algorithm.compute_many(payloads),
+                             [algorithm.compute(payload) for payload in payloads])
+        self.assertEqual(checksums.LUHN.is_valid_many([]), [])
+        with self.assertRaises(ValueError):
+            checksums.LUHN.compute_many(['12', '1a'])
+
+    def test_invalid_input(self):
+        for algorithm in checksums.ALGORITHMS.values():
+            for value in ('', '12a', ' 123', '-1', -1, None, '²²²', '1_000'):
+                self.assertFalse(algorithm.is_valid(value), (algorithm, value))
+        self.assertTrue(luhn(''))
+        self.assertFalse(checksums.CPF.is_valid('663256017260'))
+        self.assertFalse(checksums.MOD97_10.is_valid('01'))
+
+    def test_decode(self):
+        self.assertEqual(list(checksums.decode('0189')), [0, 1, 8, 9])
+        self.assertEqual(list(checksums.decode(189)), [1, 8, 9])
+        self.assertEqual(list(checksums.decode('٠١٨٩')), [0, 1, 8, 9])
+        for value in ('', '1 2', '²', -3, 1.5):
+            with self.assertRaises(ValueError):
+                checksums.decode(value)
+
+    def test_custom_mod11(self):
+        algorithm = checksums.Mod11(range(7, 1, -1), remainders=[r % 10 for r in range(11)])
+        self.assertEqual(algorithm.compute('12345'), '%d' % ((6 * 1 + 5 * 2 + 4 * 3 + 3 * 4 + 2 * 5) % 11 % 10))
+        self.assertTrue(algorithm.is_valid('123456' + algorithm.compute('123456')))
+        with self.assertRaises(ValueError):
+            checksums.Mod11((2, 3), remainders=range(10))
+
+
+class NormalizeTestCase(TestCase):
+    def test_fold(self):
+        self.assertEqual(fold(' B.C. '), 'b.c.')
+        self.assertEqual(fold('Goiás'), 'goias')
+        self.assertEqual(fold("Prince-Edward  Island"), 'prince-edward  island')
+
+    def test_index(self):
+        mapping = {'b.c.': 'BC', 'bc': 'BC', 'british columbia': 'BC', 'québec': 'QC'}
+        index = build_index(mapping)
+        self.assertEqual(lookup(index, 'BC'), 'BC')
+        self.assertEqual(lookup(index, ' B.C.\t'), 'BC')
+        self.assertEqual(lookup(index, 'British Columbia'), 'BC')
+        # only case and surrounding whitespace are ignored
+        for value in ('bcx', '.bc', 'b c', 'british-columbia', ')bc', 'b\tc'):
+            self.assertIsNone(lookup(index, value), value)
+        self.assertIsNone(lookup(index, None))
+        self.assertIsNone(lookup(index, 'Quebec'))
+        self.assertEqual(lookup(index, 'QUÉBEC'), 'QC')
+        folded = build_index(mapping, folded=True)
+        self.assertEqual(lookup(folded, 'Quebec', folded=True), 'QC')
+        self.assertIsNone(lookup(folded, '\uff31uebec', folded=True))
+        with self.assertRaises(TypeError):
+            index['x'] = 'X'
+
+    def test_ambiguous(self):
+        with self.assertRaises(ValueError):
+            build_index({'Québec': 'QC', 'quebec': 'QB'}, folded=True)
+        build_index({'Québec': 'QC', 'quebec': 'QB'})
+
+    def test_lazy_index(self):
+        class Holder(object):
+            index = LazyIndex('rest_localflavor.generic.checksums', 'LUHN_ODD_LOOKUP')
+
+        self.assertIsInstance(Holder.__dict__['index'], LazyIndex)
+        self.assertEqual(Holder().index[1], 2)
+        self.assertEqual(Holder.__dict__['index'], Holder.index)
+
+
+class RegionRegistryTestCase(TestCase):
+    def setUp(self):
+        self.registry = RegionRegistry('XX', (
+            ('BB', 'Bravo', STATE | CONTIGUOUS),
+            ('AA', 'Alfa', STATE),
+            ('OO', 'Ôscar Islands', TERRITORY),
+            ('ZZ', 'Zulu', TERRITORY | OBSOLETE),
+        ))
+
+    def test_choices(self):
+        self.assertEqual(self.registry.choices(), (
+            ('BB', 'Bravo'), ('AA', 'Alfa'), ('OO', 'Ôscar Islands'), ('ZZ', 'Zulu')))
+        self.assertEqual(self.registry.choices(sort=True)[0], ('AA', 'Alfa'))
+        self.assertEqual(self.registry.choices(STATE), (('BB', 'Bravo'), ('AA', 'Alfa')))
+        self.assertEqual(self.registry.choices(CONTIGUOUS), (('BB', 'Bravo'),))
+        self.assertEqual(self.registry.choices(TERRITORY, exclude=OBSOLETE),
+                         (('OO', 'Ôscar Islands'),))
+
+    def test_lookups(self):
+        region = self.registry.get('OO')
+        self.assertIsInstance(region, Region)
+        self.assertEqual((region.code, region.country, region.flags), ('OO', 'XX', TERRITORY))
+        self.assertIsNone(self.registry.get('oo'))
+        self.assertIs(self.registry.get_by_name('oscar islands'), region)
+        self.assertIs(self.registry.get_by_name(' OSCAR ISLANDS'), region)
+        self.assertIsNone(self.registry.get_by_name('OSCAR-ISLANDS'))
+        self.assertIsNone(self.registry.get_by_name('Oscar'))
+        self.assertEqual(len(self.registry), 4)
+
+    def test_slots(self):
+        with self.assertRaises(AttributeError):
+            self.registry.get('AA').population = 1
+
+    def test_country_registries(self):
+        from rest_localflavor.br import br_states, uf
+        from rest_localflavor.ca import ca_provinces
+        from rest_localflavor.us import us_states
+
+        self.assertIs(uf.STATE_CHOICES, br_states.STATE_CHOICES)
+        self.assertEqual(br_states.REGIONS.get_by_name('sao paulo').code, 'sp')
+        self.assertEqual(ca_provinces.REGIONS.get('YT').flags, TERRITORY)
+        self.assertEqual(len(us_states.CONTIGUOUS_STATES), 49)
+        self.assertEqual(len(us_states.US_STATES), 51)
+        for code, name in us_states.USPS_CHOICES:
+            self.assertEqual(us_states.REGIONS.get(code).name, name)
+
+
+class PhoneRuleTestCase(TestCase):
+    def legacy(self, pattern, value):
+        value = re.sub(r'(\(|\)|\s+)', '', value)
+        match = re.search(pattern, value)
+        return match and '-'.join(match.groups())
+
+    def test_matches_legacy_patterns(self):
+        samples = ['41-3562-3464', '(41) 3562 3464', '41.93562.3464', '4135623464',
+                   '41935623464', '41--3562-3464', '411-9134-9435', '(41) 3562.3464 ',
+                   '123-123-1234', '1-123-123-1234', '11231231234', '1231231234',
+                   '1.123.123.1234', '+1 123-123-1234', '1-(123) 123 1234', '123-123-12345',
+                   '\u0664\u0661-3562-3464', '41-3562-3464-', '-41-3562-3464', '', '-', '1-']
+        for country, pattern in (('BR', r'^(\(\d{2}\)|\d{2})[-\.\s]?(\d{4,5})[-\.\s]?(\d{4})$'),
+                                 ('CA', r'^(?:1-?)?(\d{3})[-\.]?(\d{3})[-\.]?(\d{4})$')):
+            for value in samples:
+                self.assertEqual(normalize_phone(country, value), self.legacy(pattern, value),
+                                 (country, value))
+
+    def test_whitespace(self):
+        spaces = set(c for c in map(six.unichr, range(0x3001)) if re.match(r'\s', c, re.UNICODE))
+        self.assertEqual(set(WHITESPACE), spaces)
+
+    def test_rule(self):
+        rule = PhoneRule([(4, 4)], separators='/', prefix='33', prefix_separators='/', joiner=' ')
+        self.assertEqual(rule.normalize('1234/5678'), '1234 5678')
+        self.assertEqual(rule.normalize('33/(1234) 5678'), '1234 5678')
+        self.assertIsNone(rule.normalize('1234-5678'))
+        self.assertIsNone(rule.normalize('1234//5678'))
+        self.assertIsNone(rule.normalize('4412345678'))
+        with self.assertRaises(ValueError):
+            PhoneRule([(4, 4), (8,)], separators='/')
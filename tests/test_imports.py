@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+import os
+import subprocess
+import sys
+import unittest
+
+from django.test import TestCase
+
+from rest_localflavor.test.imports import MODULES, SETUP, import_times
+from rest_localflavor.generic.lazy import LazyPattern, lazy_attributes
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Loaded only when the fields first need them.
+DEFERRED = ('rest_localflavor.br.br_states', 'rest_localflavor.ca.ca_provinces',
+            'rest_localflavor.us.us_states', 'rest_localflavor.aio',
+            'rest_localflavor.generic.vectorized', 'multiprocessing', 'numpy')
+
+
+@unittest.skipIf(sys.version_info < (3, 7), 'python -X importtime requires Python 3.7')
+class ImportTimeTest(TestCase):
+    def test_deferred_modules(self):
+        times = import_times()
+        for module in MODULES:
+            self.assertIn(module, times)
+        for module in DEFERRED:
+            self.assertNotIn(module, times)
+
+    def test_lazy_public_names(self):
+        from rest_localflavor.br import br_states
+        from rest_localflavor.br.serializers import STATE_CHOICES
+        from rest_localflavor.ca.ca_provinces import PROVINCES_INDEX
+        from rest_localflavor.us.us_states import STATES_INDEX, STATE_CHOICES as US_STATE_CHOICES
+        from rest_localflavor.us import us_states
+
+        self.assertIs(STATE_CHOICES, br_states.STATE_CHOICES)
+        self.assertEqual(PROVINCES_INDEX['quebec'], 'QC')
+        self.assertEqual(STATES_INDEX['calif'], 'CA')
+        self.assertIs(us_states.STATE_CHOICES, US_STATE_CHOICES)
+        self.assertEqual(len(us_states.USPS_CHOICES), len(US_STATE_CHOICES) + 3)
+        with self.assertRaises(AttributeError):
+            us_states.NO_SUCH_NAME
+
+    def test_uf_alias(self):
+        # importing the alias module does not build the index
+        code = SETUP + (
+            "from rest_localflavor.br import br_states, uf\n"
+            "assert uf.STATE_CHOICES is br_states.STATE_CHOICES\n"
+            "print('STATES_INDEX' in vars(br_states))\n")
+        output = subprocess.check_output([sys.executable, '-c', code], cwd=ROOT)
+        self.assertEqual(output.decode('ascii').strip(), 'False')
+
+
+class LazyTest(TestCase):
+    def test_lazy_attributes(self):
+        calls = []
+        namespace = {'__name__': 'example'}
+        getter = lazy_attributes(namespace, {'VALUE': lambda: calls.append(1) or 42})
+        if sys.version_info >= (3, 7):
+            self.assertEqual(calls, [])
+            self.assertEqual(getter('VALUE'), 42)
+        self.assertEqual(namespace['VALUE'], 42)
+        self.assertEqual(calls, [1])
+        with self.assertRaises(AttributeError):
+            getter('OTHER')
+
+    def test_lazy_pattern(self):
+        pattern = LazyPattern(r'^(\d+)$')
+        self.assertNotIn('_compiled', vars(pattern))
+        self.assertEqual(pattern.match('123').group(1), '123')
+        self.assertIsNone(pattern.match('x'))
+        self.assertEqual(pattern.pattern, r'^(\d+)$')
+        self.assertIn('match', vars(pattern))
@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from django.test import TestCase, override_settings
+
+from rest_framework.exceptions import ValidationError
+
+from rest_localflavor import instrumentation
+from rest_localflavor.br import serializers as br
+from rest_localflavor.ca import serializers as ca
+from rest_localflavor.us import serializers as us
+
+calls = []
+
+
+def record(field, outcome, elapsed_ns):
+    calls.append((field, outcome, elapsed_ns))
+
+
+class InstrumentationTest(TestCase):
+    def setUp(self):
+        del calls[:]
+        self.addCleanup(instrumentation.disable)
+
+    def test_disabled_by_default(self):
+        self.assertNotIn('run_validation', vars(br.BRCPFField))
+        br.BRCPFField().run_validation('663.256.017-26')
+        self.assertEqual(calls, [])
+
+    def test_callback(self):
+        instrumentation.enable(record)
+        br.BRCPFField().run_validation('663.256.017-26')
+        with self.assertRaises(ValidationError):
+            us.USStateField().run_validation('XX')
+        with self.assertRaises(ValidationError):
+            br.BRStateField().run_validation('')
+        self.assertEqual([call[:2] for call in calls], [
+            ('BRCPFField', None), ('USStateField', 'invalid'), ('BRStateField', 'empty')])
+        for call in calls:
+            self.assertGreaterEqual(call[2], 0)
+
+    def test_batch(self):
+        instrumentation.enable(record)
+        ca.CAPostalCodeField().validate_many(['K1N 5J9', 'DDD 111'])
+        self.assertEqual([call[:2] for call in calls], [
+            ('CAPostalCodeField', None), ('CAPostalCodeField', 'invalid')])
+
+    def test_disable_restores_methods(self):
+        original = ca.CAPhoneNumberField.run_validation
+        instrumentation.enable(record)
+        instrumentation.enable(record)
+        self.assertIs(vars(ca.CAPhoneNumberField)['run_validation'].instrumented, original)
+        instrumentation.disable()
+        self.assertNotIn('run_validation', vars(ca.CAPhoneNumberField))
+        self.assertIs(ca.CAPhoneNumberField.run_validation, original)
+
+    def test_setting(self):
+        with override_settings(REST_LOCALFLAVOR_INSTRUMENTATION='tests.test_instrumentation.record'):
+            br.BRCNPJField().run_validation('64.132.916/0001-88')
+        br.BRCNPJField().run_validation('64.132.916/0001-88')
+        self.assertEqual([call[:2] for call in calls], [('BRCNPJField', None)])
+
+
+class AggregatorTest(TestCase):
+    def test_snapshot(self):
+        aggregator = instrumentation.Aggregator(buckets=(100, 1000))
+        aggregator('USStateField', None, 50)
+        aggregator('USStateField', None, 500)
+        aggregator('USStateField', 'invalid', 5000)
+        self.assertEqual(aggregator.snapshot(), {
+            'USStateField': {
+                'outcomes': {'valid': 2, 'invalid': 1},
+                'buckets': [1, 1, 1],
+                'count': 3,
+                'sum_ns': 5550,
+            },
+        })
+        aggregator.reset()
+        self.assertEqual(aggregator.snapshot(), {})
+
+    def test_prometheus(self):
+        aggregator = instrumentation.Aggregator(buckets=(1000,))
+        aggregator('BRCPFField', None, 200)
+        aggregator('BRCPFField', 'invalid', 2000)
+        self.assertEqual(aggregator.prometheus().splitlines(), [
+            '# TYPE localflavor_validations_total counter',
+            'localflavor_validations_total{field="BRCPFField",outcome="invalid"} 1',
+            'localflavor_validations_total{field="BRCPFField",outcome="valid"} 1',
+            '# TYPE localflavor_validation_seconds histogram',
+            'localflavor_validation_seconds_bucket{field="BRCPFField",le="1e-06"} 1',
+            'localflavor_validation_seconds_bucket{field="BRCPFField",le="+Inf"} 2',
+            'localflavor_validation_seconds_sum{field="BRCPFField"} 2.2e-06',
+            'localflavor_validation_seconds_count{field="BRCPFField"} 2',
+        ])
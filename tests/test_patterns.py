@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+import re
+
+from django.test import TestCase
+
+try:
+    from unittest import mock
+except ImportError:
+    import mock
+
+from rest_framework.exceptions import ValidationError
+
+from rest_localflavor.br import serializers as br
+from rest_localflavor.ca import serializers as ca
+from rest_localflavor.us import serializers as us
+
+
+class PrecompiledPatternsTest(TestCase):
+    """
+    Guards against regexes compiled, or looked up in the ``re`` module
+    cache, on every ``run_validation`` call. Patterns are compiled on first
+    use, so every field runs once before ``re`` is patched.
+    """
+    samples = (
+        (br.BRStateField, ['DF', 'TX']),
+        (br.BRCPFField, ['663.256.017-26', '66325601726', '375.788.573-XX']),
+        (br.BRCNPJField, ['64.132.916/0001-88', '64.132.916/0001-XX']),
+        (br.BRZipCodeField, ['73.360-610', '70.000-0000']),
+        (br.BRPhoneNumberField, ['(41) 3562 3464', '411-9134-9435']),
+        (ca.CAPostalCodeField, ['K1N 5J9', 'DDD 111']),
+        (ca.CAPhoneNumberField, ['(123) 123 1234', '+1 123-123-1234']),
+        (ca.CAProvinceField, ['p.e.i.', 'XX']),
+        (ca.CASocialInsuranceNumberField, ['046-454-286', '046 454 286']),
+        (us.USStateField, ['calif', 'XX']),
+        (us.USZipCodeField, ['20500-0003', '2050']),
+        (us.USPhoneNumberField, ['(312) 555-1212', '555-1212']),
+    )
+
+    def run_all(self, fields):
+        for field, values in fields:
+            for value in values:
+                try:
+                    field.run_validation(value)
+                except ValidationError:
+                    pass
+
+    def test_no_re_module_calls(self):
+        fields = [(field_class(), values) for field_class, values in self.samples]
+        self.run_all(fields)
+        names = [name for name in ('compile', 'sub', 'subn', 'match', 'search',
+                                   'fullmatch', 'split', 'findall')
+                 if hasattr(re, name)]
+        patchers = [mock.patch.object(re, name, side_effect=getattr(re, name))
+                    for name in names]
+        mocks = [patcher.start() for patcher in patchers]
+        try:
+            self.run_all(fields)
+        finally:
+            for patcher in patchers:
+                patcher.stop()
+        for name, patched in zip(names, mocks):
+            self.assertFalse(patched.called, 're.%s called by %r' % (name, patched.call_args))
@@ -2,9 +2,13 @@
 from __future__ import unicode_literals
 
 from rest_localflavor.test.testcases import DRFTestCase
+from rest_framework import serializers as drf_serializers
 from rest_framework.exceptions import ValidationError
 
 from rest_localflavor.us import serializers
+from rest_localflavor.us.us_states import USPS_CHOICES
+from rest_localflavor.us.validators import USZipCodeStateValidator
+from rest_localflavor.us.zip_codes import ZIP_PREFIX_RANGES, zip_code_states
 
 
 class FieldtestMixin(object):
@@ -40,6 +44,9 @@ class USStateFieldTest(DRFTestCase, FieldtestMixin):
             'calf': 'CA',
             'calif': 'CA',
             'california': 'CA',
+            ' California ': 'CA',
+            'N DAK': 'ND',
+            'New York': 'NY',
         }
 
         self.invalid = {
@@ -48,4 +55,96 @@ class USStateFieldTest(DRFTestCase, FieldtestMixin):
             'a': error_invalid,
             'XX': error_invalid,
             'AX': error_invalid,
+            # only case and surrounding whitespace are ignored
+            ')aZ': error_invalid,
+            'a\ta': error_invalid,
+            'NewYork': error_invalid,
         }
+
+
+class USZipCodeFieldTest(DRFTestCase, FieldtestMixin):
+    def setUp(self):
+        self.field_class = serializers.USZipCodeField
+
+        error_invalid = ["Enter a zip code in the format XXXXX or XXXXX-XXXX."]
+
+        self.valid = {
+            '20500': '20500',
+            '20500-0003': '20500-0003',
+            ' 10001 ': '10001',
+        }
+
+        self.invalid = {
+            None: error_invalid,
+            '2050': error_invalid,
+            '205000': error_invalid,
+            '20500-03': error_invalid,
+            '20500 0003': error_invalid,
+            'ABCDE': error_invalid,
+            '\u0662\u0660\u0665\u0660\u0660': error_invalid,
+        }
+
+
+class USPhoneNumberFieldTest(DRFTestCase, FieldtestMixin):
+    def setUp(self):
+        self.field_class = serializers.USPhoneNumberField
+
+        error_invalid = ["Phone numbers must be in XXX-XXX-XXXX format."]
+
+        self.valid = {
+            '312-555-1212': '312-555-1212',
+            '3125551212': '312-555-1212',
+            '312 555-1212': '312-555-1212',
+            '(312) 555-1212': '312-555-1212',
+            '312.555.1212': '312-555-1212',
+            '1-312-555-1212': '312-555-1212',
+            '13125551212': '312-555-1212',
+        }
+
+        self.invalid = {
+            None: error_invalid,
+            '': error_invalid,
+            '555-1212': error_invalid,
+            '312-555-121': error_invalid,
+            '312--555-1212': error_invalid,
+            '+1 312-555-1212': error_invalid,
+            '2-312-555-1212': error_invalid,
+        }
+
+
+class USZipCodeStateValidatorTest(DRFTestCase):
+    def serializer(self, data):
+        class AddressSerializer(drf_serializers.Serializer):
+            zip_code = serializers.USZipCodeField()
+            state = serializers.USStateField()
+
+            class Meta:
+                validators = [USZipCodeStateValidator('zip_code', 'state')]
+
+        return AddressSerializer(data=data)
+
+    def test_zip_code_states(self):
+        for zip_code, states in (('00501', ('NY',)), ('20500-0003', ('DC',)), ('94043', ('CA',)),
+                                 ('96799', ('AS', 'HI')), ('96910', ('FM', 'GU', 'MH', 'MP', 'PW')),
+                                 ('99501', ('AK',)), ('00000', ()), ('21', ()), ('ABCDE', ())):
+            self.assertEqual(tuple(sorted(zip_code_states(zip_code))), states, zip_code)
+
+    def test_ranges(self):
+        codes = set(code for code, _ in USPS_CHOICES)
+        previous = -1
+        for first, last, states in ZIP_PREFIX_RANGES:
+            self.assertTrue(previous < first <= last <= 999)
+            self.assertTrue(set(states) <= codes, states)
+            previous = last
+
+    def test_valid(self):
+        for state in ('CA', 'calif', 'California'):
+            serializer = self.serializer({'zip_code': '94043', 'state': state})
+            self.assertTrue(serializer.is_valid(), serializer.errors)
+
+    def test_invalid(self):
+        serializer = self.serializer({'zip_code': '94043-1351', 'state': 'NY'})
+        self.assertFalse(serializer.is_valid())
+        self.assertEqual(serializer.errors, {
+            'zip_code': ['The zip code 94043-1351 is not from the state NY.']})
+        self.assertFalse(self.serializer({'zip_code': '00000', 'state': 'NY'}).is_valid())
@@ -0,0 +1,153 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+import io
+import json
+import os
+import shutil
+import tempfile
+
+try:
+    from unittest import mock
+except ImportError:
+    import mock
+
+from django.test import TestCase
+from django.utils import six
+from django.utils.six import StringIO
+
+from rest_localflavor import validate
+from rest_localflavor.br.serializers import BRCPFField
+from rest_localflavor.us.serializers import USStateField
+
+
+class ValidateRowsTest(TestCase):
+    def test_generator(self):
+        rows = iter([{'cpf': '663.256.017-26', 'state': 'calif'},
+                     {'cpf': '489.294.654-54', 'state': 'XX'},
+                     {'cpf': '66325601726'}])
+        fields = {'cpf': BRCPFField(), 'state': USStateField()}
+        output = validate.validate_rows(rows, fields, chunk_size=2)
+        self.assertEqual(next(output), ({'cpf': '663.256.017-26', 'state': 'CA'}, {}))
+        self.assertEqual(list(output), [
+            ({'cpf': '489.294.654-54', 'state': 'XX'}, {'cpf': 'invalid', 'state': 'invalid'}),
+            ({'cpf': '66325601726'}, {'state': 'blank'}),
+        ])
+
+    def test_malformed_rows(self):
+        rows = iter([{'cpf': '663.256.017-26'}, validate.MalformedRow('invalid_json', '{'),
+                     {'cpf': '489.294.654-54'}])
+        output = validate.validate_rows(rows, {'cpf': BRCPFField()}, chunk_size=2)
+        self.assertEqual(list(output), [
+            ({'cpf': '663.256.017-26'}, {}),
+            ({}, {None: 'invalid_json'}),
+            ({'cpf': '489.294.654-54'}, {'cpf': 'invalid'}),
+        ])
+
+    def test_field_classes(self):
+        classes = validate.field_classes()
+        self.assertIs(classes['BRCPFField'], BRCPFField)
+        self.assertIn('CAPostalCodeField', classes)
+        self.assertIn('USStateField', classes)
+
+
+class ValidateCommandTest(TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def path(self, name):
+        return os.path.join(self.directory, name)
+
+    def write(self, name, content):
+        with io.open(self.path(name), 'w', encoding='utf-8') as stream:
+            stream.write(content)
+
+    def read(self, name):
+        with io.open(self.path(name), encoding='utf-8') as stream:
+            return stream.read()
+
+    def main(self, *argv):
+        # the summary and usage messages go to stderr
+        with mock.patch('sys.stderr', new_callable=StringIO) as stderr:
+            try:
+                return validate.main(list(argv))
+            finally:
+                self.stderr = stderr.getvalue()
+
+    def assertSummary(self, rows, invalid):
+        six.assertRegex(self, self.stderr, r'^%d rows, %d invalid, \d+ rows/s\n$' % (rows, invalid))
+
+    def test_csv(self):
+        self.write('in.csv', 'name,cep,postal\n'
+                             'Ana,73360610,k1n5j9\n'
+                             'Bob,70.000-0000,K1N 5J9\n')
+        status = self.main(self.path('in.csv'), '--map', 'cep=BRZipCodeField',
+                           '--map', 'postal=ca.CAPostalCodeField',
+                           '--output', self.path('out.csv'),
+                           '--errors', self.path('errors.csv'))
+        self.assertEqual(status, 1)
+        self.assertSummary(2, 1)
+        self.assertEqual(self.read('out.csv').splitlines(), [
+            'name,cep,postal', 'Ana,73360610,K1N 5J9', 'Bob,70.000-0000,K1N 5J9'])
+        self.assertEqual(self.read('errors.csv').splitlines(), [
+            'row,column,value,error', '2,cep,70.000-0000,invalid'])
+
+    def test_jsonl(self):
+        self.write('in.jsonl', '{"uf": "calif"}\n\n{"uf": "XX"}\n{"uf": ""}\n')
+        status = self.main(self.path('in.jsonl'), '--map', 'uf=USStateField',
+                           '--output', self.path('out.jsonl'),
+                           '--drop-invalid', '--allow-blank')
+        self.assertEqual(status, 1)
+        self.assertSummary(3, 1)
+        rows = [json.loads(line) for line in self.read('out.jsonl').splitlines()]
+        self.assertEqual(rows, [{'uf': 'CA'}, {'uf': ''}])
+
+    def test_csv_extra_fields(self):
+        self.write('in.csv', 'name,cep\n'
+                             'Ana,73360610\n'
+                             'Bob,73360610,extra,fields\n'
+                             'Cid\n')
+        status = self.main(self.path('in.csv'), '--map', 'cep=BRZipCodeField',
+                           '--allow-blank', '--output', self.path('out.csv'),
+                           '--errors', self.path('errors.csv'))
+        self.assertEqual(status, 1)
+        self.assertSummary(3, 1)
+        self.assertEqual(self.read('out.csv').splitlines(), [
+            'name,cep', 'Ana,73360610', 'Cid,'])
+        self.assertEqual(self.read('errors.csv').splitlines(), [
+            'row,column,value,error', '2,,"extra,fields",extra_fields'])
+
+    def test_jsonl_malformed(self):
+        self.write('in.jsonl', '{"uf": "calif"}\n[1, 2]\n{"uf":\n"ny"\n{"uf": "XX"}\n')
+        status = self.main(self.path('in.jsonl'), '--map', 'uf=USStateField',
+                           '--output', self.path('out.jsonl'),
+                           '--errors', self.path('errors.csv'))
+        self.assertEqual(status, 1)
+        self.assertSummary(5, 4)
+        rows = [json.loads(line) for line in self.read('out.jsonl').splitlines()]
+        self.assertEqual(rows, [{'uf': 'CA'}, {'uf': 'XX'}])
+        self.assertEqual(self.read('errors.csv').splitlines(), [
+            'row,column,value,error',
+            '2,,"[1, 2]",not_an_object',
+            '3,,"{""uf"":",invalid_json',
+            '4,,"""ny""",not_an_object',
+            '5,uf,XX,invalid',
+        ])
+
+    def test_workers(self):
+        self.write('in.jsonl', '{"uf": "calif"}\n{"uf": "XX"}\n{"uf": "ny"}\n')
+        status = self.main(self.path('in.jsonl'), '--map', 'uf=USStateField',
+                           '--output', self.path('out.jsonl'), '--workers', '2')
+        self.assertEqual(status, 1)
+        self.assertSummary(3, 1)
+        rows = [json.loads(line) for line in self.read('out.jsonl').splitlines()]
+        self.assertEqual(rows, [{'uf': 'CA'}, {'uf': 'XX'}, {'uf': 'NY'}])
+
+    def test_unknown_field(self):
+        self.write('in.csv', 'a\n1\n')
+        with self.assertRaises(SystemExit):
+            self.main(self.path('in.csv'), '--map', 'a=NoSuchField')
+        self.assertIn("error: invalid --map 'a=NoSuchField'", self.stderr)
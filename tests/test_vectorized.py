@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+import random
+import unittest
+
+from django.test import TestCase
+
+from rest_localflavor.br.serializers import BRCNPJField, BRCPFField
+from rest_localflavor.generic import vectorized
+from rest_localflavor.generic.checksums import CNPJ, CPF, luhn
+
+np = vectorized.np
+
+
+def _samples(rng, size, algorithm, punctuation, count=3000):
+    alphabet = '0123456789' * 4 + punctuation * 2 + 'x /+_٣'
+    samples = ['', None, 12345, '٦٦٣٢٥٦٠١٧٢٦', '²' * size, punctuation * 3]
+    for _ in range(count):
+        body = ''.join(rng.choice('0123456789') for _ in range(size - 2))
+        dv = algorithm.compute(body)
+        value = body + dv
+        kind = rng.random()
+        if kind < 0.3:
+            pass  # valid
+        elif kind < 0.5:
+            # near miss, one digit changed
+            i = rng.randrange(size)
+            value = value[:i] + rng.choice('0123456789') + value[i + 1:]
+        elif kind < 0.7:
+            # punctuated
+            value = ''.join(c + (rng.choice(punctuation) if rng.random() < 0.2 else '')
+                            for c in value)
+        else:
+            value = ''.join(rng.choice(alphabet) for _ in range(rng.randrange(20)))
+        samples.append(value)
+    return samples
+
+
+@unittest.skipIf(np is None, "NumPy is not installed")
+class VectorizedDifferentialTest(TestCase):
+    def setUp(self):
+        self.rng = random.Random(1234)
+
+    def assertSameAsField(self, field_class, function, values):
+        mask, reasons = function(values)
+        result = field_class().validate_many(values)
+        self.assertEqual([vectorized.REASONS[r] for r in reasons], result.errors)
+        self.assertEqual(mask.tolist(), [e is None for e in result.errors])
+
+    def test_cpf(self):
+        self.assertSameAsField(BRCPFField, vectorized.cpf_many,
+                               _samples(self.rng, 11, CPF, '-.'))
+
+    def test_cnpj(self):
+        self.assertSameAsField(BRCNPJField, vectorized.cnpj_many,
+                               _samples(self.rng, 14, CNPJ, '-/.'))
+
+    def test_oversized(self):
+        punctuation = '.' * 60
+        values = [punctuation + '66325601726', '66325601726' + punctuation, '-' * 70,
+                  '-' * 64, '1' * 65, '٦' * 70, '663.256.017-26' + ' ' * 60]
+        self.assertSameAsField(BRCPFField, vectorized.cpf_many, values)
+        self.assertSameAsField(BRCNPJField, vectorized.cnpj_many, values)
+        mask, reasons = vectorized.cpf_many(values[:3])
+        self.assertEqual(reasons.tolist(), [vectorized.MAX_DIGITS] * 3)
+
+    def test_non_strings(self):
+        # the fields reject anything but strings, numbers included
+        values = [12345678909, 66325601726, 64132916000188, b'66325601726',
+                  b'64132916000188', 66325601726.0, True]
+        for field_class, function in ((BRCPFField, vectorized.cpf_many),
+                                      (BRCNPJField, vectorized.cnpj_many)):
+            self.assertSameAsField(field_class, function, values)
+            for value in values:
+                mask, reasons = function(np.array([value]))
+                self.assertEqual(reasons.tolist(), [vectorized.INVALID], value)
+
+    def test_string_array(self):
+        values = ['663.256.017-26', '66325601726', '48929465454', '1234']
+        mask, reasons = vectorized.cpf_many(np.array(values))
+        self.assertEqual(mask.tolist(), [True, True, False, False])
+        self.assertEqual(reasons.tolist(), [vectorized.VALID, vectorized.VALID,
+                                            vectorized.INVALID, vectorized.MAX_DIGITS])
+
+    def test_digit_matrix(self):
+        matrix = np.array([[int(c) for c in v] for v in ['66325601726', '48929465454']],
+                          dtype=np.uint8)
+        mask, _ = vectorized.cpf_many(matrix)
+        self.assertEqual(mask.tolist(), [True, False])
+        mask, reasons = vectorized.cnpj_many(matrix)
+        self.assertEqual(reasons.tolist(), [vectorized.MAX_DIGITS] * 2)
+
+    def test_luhn(self):
+        values = ['', '0', '79927398713', '72723846', 'abc', '٧٩٩٢٧٣٩٨٧١٣', None]
+        for _ in range(3000):
+            values.append(''.join(self.rng.choice('0123456789' * 5 + ' -x')
+                                  for _ in range(self.rng.randrange(20))))
+        mask, reasons = vectorized.luhn_many(values)
+        self.assertEqual(mask.tolist(), [luhn(v) for v in values])
+
+    def test_luhn_numeric(self):
+        values = [79927398713, 72723846, 0, -18]
+        mask, _ = vectorized.luhn_many(np.array(values))
+        self.assertEqual(mask.tolist(), [luhn(v) for v in values])
+        matrix = np.array([[7, 9, 9, 2, 7, 3, 9, 8, 7, 1, 3], [7, 9, 9, 2, 7, 3, 9, 8, 7, 1, 4]])
+        mask, _ = vectorized.luhn_many(matrix)
+        self.assertEqual(mask.tolist(), [True, False])
+
+    def test_luhn_non_strings(self):
+        values = [b'79927398713', 79927398713, 79927398713.0, True, -18, None, '79927398713']
+        mask, _ = vectorized.luhn_many(values)
+        self.assertEqual(mask.tolist(), [luhn(v) for v in values])
+        for value in values:
+            mask, _ = vectorized.luhn_many(np.array([value]))
+            self.assertEqual(mask.tolist(), [luhn(value)], value)